@@ -0,0 +1,142 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+import os
+import threading
+from typing import Optional
+
+from .ProcessHandler import _LockFreeHandler, _finalize_at_exit
+from .RecordQueue import RecordQueue
+
+
+_BATCH_SIZE: int = 256
+
+
+class BackgroundHandler(_LockFreeHandler):
+    """
+    Dispatches Log Records to another handler from a dedicated thread, via a bounded queue, so that a slow handler (such as a network handler) does not stall other handlers or the emitting thread.
+
+    Filters are applied by the emitting thread, only the wrapped handler is called from the background thread. When the queue is full the overflow policy of the queue applies (see :class:``RecordQueue``), backpressure is only ever applied to records destined for the wrapped handler.
+    """
+
+    def __init__(
+        self,
+        handler: logging.Handler,
+        max_size: int = 10000,
+        overflow: str = 'block',
+        timeout: Optional[float] = 1.0,
+        drop_level: int | str = logging.WARNING,
+        drain_timeout: Optional[float] = 5.0
+    ) -> None:
+        """
+        Initialize *BackgroundHandler*.
+
+        :param handler: The handler to dispatch records to.
+        :param max_size: The capacity of the queue, ``0`` for an unbounded queue, defaults to 10000.
+        :param overflow: The overflow policy applied when the queue is full, defaults to 'block'.
+        :param timeout: For ``block`` and ``drop_below`` policies, the maximum number of seconds to wait for space, ``None`` to wait indefinitely, defaults to 1.0.
+        :param drop_level: For the ``drop_below`` policy, records below this level are dropped when the queue is full, defaults to WARNING.
+        :param drain_timeout: The maximum number of seconds to wait for queued records to be dispatched when flushing or closing the handler, ``None`` to wait indefinitely, defaults to 5.0.
+        """
+        super().__init__()
+        self.__handler = handler
+        self.__queue = RecordQueue(max_size, overflow, timeout, drop_level, 'hanaro.BackgroundHandler')
+        self.__drain_timeout = drain_timeout
+        self.__condition = threading.Condition(threading.Lock())
+        self.__is_busy = False
+        self.__is_closed = False
+        self.__pid = 0
+        self.__thread: Optional[threading.Thread] = None
+        self.__finalizer = _finalize_at_exit(self)
+
+    @property
+    def handler(self) -> logging.Handler:
+        """The handler records are dispatched to."""
+        return self.__handler
+
+    @property
+    def queue(self) -> RecordQueue:
+        """The queue of records waiting to be dispatched, for example to inspect its depth (``qsize()``) or drop counts."""
+        return self.__queue
+
+    @property
+    def drop_counts(self) -> dict[str, int]:
+        """The number of records dropped since the handler was created, per overflow policy."""
+        return self.__queue.drop_counts
+
+    def qsize(self) -> int:
+        """Get the number of records waiting to be dispatched."""
+        return self.__queue.qsize()
+
+    def __start(self) -> None:
+        with self.lock:  # type: ignore[union-attr]
+            if self.__pid != os.getpid():
+                # NOTE: state inherited from a parent process belongs to the parent process
+                if self.__pid != 0:
+                    self.__queue._at_fork_reinit()
+                self.__condition = threading.Condition(threading.Lock())
+                self.__is_busy = False
+                self.__thread = threading.Thread(target=self.__run, name='hanaro.BackgroundHandler', daemon=True)
+                self.__thread.start()
+                self.__pid = os.getpid()
+
+    def __run(self) -> None:
+        queue = self.__queue
+        condition = self.__condition
+        handle = self.__handler.handle
+        while True:
+            batch = queue.get_many(_BATCH_SIZE)
+            if len(batch) == 0:
+                with condition:
+                    self.__is_busy = False
+                    condition.notify_all()
+                    if self.__is_closed:
+                        break
+                queue.wait()
+                with condition:
+                    self.__is_busy = True
+                continue
+            for record in batch:
+                try:
+                    handle(record)
+                except Exception:
+                    self.handleError(record)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Queue *record* to be dispatched to the wrapped handler, applying the overflow policy if the queue is full.
+
+        :param record: The Log Record to emit.
+        """
+        if self.__is_closed:
+            return
+        if self.__pid != os.getpid():
+            self.__start()
+        self.__queue.put(record)
+
+    def flush(self) -> None:
+        """Wait (up to *drain_timeout* seconds) for queued records to be dispatched, then flush the wrapped handler."""
+        if self.__pid == os.getpid():
+            thread = self.__thread
+            queue = self.__queue
+            with self.__condition:
+                self.__condition.wait_for(
+                    lambda: (not self.__is_busy and queue.qsize() == 0) or thread is None or not thread.is_alive(),
+                    self.__drain_timeout)
+        self.__handler.flush()
+
+    def close(self) -> None:
+        """Dispatch any queued records (waiting up to *drain_timeout* seconds), then close the wrapped handler."""
+        self.__finalizer.cancel()
+        if self.__pid == os.getpid():
+            with self.__condition:
+                self.__is_closed = True
+            self.__queue.wake()
+            thread = self.__thread
+            if thread is not None and thread is not threading.current_thread():
+                thread.join(self.__drain_timeout)
+        else:
+            self.__is_closed = True
+        self.__handler.close()
+        super().close()
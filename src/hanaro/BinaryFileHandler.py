@@ -0,0 +1,91 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+import logging.handlers
+from typing import IO, Any, Iterator, cast
+
+from .BinaryRecordCodec import BinaryRecordCodec
+
+
+class BinaryFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    A :class:``logging.handlers.RotatingFileHandler`` which writes Log Records in the compact binary form of :class:``BinaryRecordCodec``, rather than formatting them.
+
+    Records are formatted only when the log is read, such as via ``python -m hanaro.decode`` (or :meth:``read``.) Each log file (including rotated log files) can be decoded on its own, and a log file which is opened for appending starts a new session of interned strings.
+
+    A log file must only be written by a single process, forked processes should forward records to the parent process (see :class:``ProcessHandler``.)
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        max_bytes: int = 0,
+        backup_count: int = 0,
+        delay: bool = False
+    ) -> None:
+        """
+        Initialize *BinaryFileHandler*.
+
+        :param filename: The path of the log file.
+        :param max_bytes: The size in bytes at which the log file is rotated, ``0`` to never rotate, defaults to 0.
+        :param backup_count: The number of rotated log files to keep, defaults to 0.
+        :param delay: Defer opening the log file until the first record is emitted, defaults to False.
+        """
+        self.__codec = BinaryRecordCodec()
+        self.__size = 0
+        self.__is_empty = True
+        super().__init__(filename, 'ab', max_bytes, backup_count, None, True)
+        # NOTE: `RotatingFileHandler` opens the log file in text mode when *max_bytes* is set
+        self.mode = 'ab'
+        self.encoding = None
+        self.delay = delay
+        if not delay:
+            self.stream = self._open()
+
+    @staticmethod
+    def read(filename: str) -> Iterator[logging.LogRecord]:
+        """
+        Read the Log Records of a binary log file.
+
+        :param filename: The path of the log file.
+        :return: An iterator of decoded Log Records.
+        """
+        with open(filename, 'rb') as file:
+            data = file.read()
+        return BinaryRecordCodec.decode(data)
+
+    def _open(self) -> Any:
+        stream = open(self.baseFilename, 'ab')
+        size = stream.tell()
+        # NOTE: interned strings are only valid within the log file they are defined in, an existing log file gets a new session
+        data = (BinaryRecordCodec.HEADER if size == 0 else b'') + self.__codec.reset()
+        stream.write(data)
+        stream.flush()
+        self.__size = size + len(data)
+        self.__is_empty = size == 0
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Encode *record* into the log file, rotating the log file if it would exceed *max_bytes*.
+
+        :param record: The Log Record to emit.
+        """
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            data = self.__codec.encode(record)
+            if self.maxBytes > 0 and not self.__is_empty and self.__size + len(data) > self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+                # NOTE: encoded again, within the session of the new log file
+                data = self.__codec.encode(record)
+            stream = cast(IO[bytes], self.stream)
+            stream.write(data)
+            stream.flush()
+            self.__size += len(data)
+            self.__is_empty = False
+        except Exception:
+            self.handleError(record)
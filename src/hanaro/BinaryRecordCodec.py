@@ -0,0 +1,473 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+import operator
+import os
+import struct
+from typing import Any, Callable, Iterator, Optional, cast
+
+from .RecordCodec import _STANDARD_ATTRIBUTES, _formatter
+
+
+# entry tags
+_RESET: int = 0
+_STRING: int = 1
+_SITE: int = 2
+_THREAD: int = 3
+_CONTEXT: int = 4
+_RECORD: int = 5
+
+# value tags
+_NONE: bytes = b'\x00'
+_FALSE: bytes = b'\x01'
+_TRUE: bytes = b'\x02'
+_INT: bytes = b'\x03'
+_FLOAT: bytes = b'\x04'
+_STR: bytes = b'\x05'
+_INTERNED: bytes = b'\x06'
+_DICT: bytes = b'\x07'
+
+# record flags
+_INTERPOLATED: int = 0x01
+_EXC_TEXT: int = 0x02
+_STACK_INFO: int = 0x04
+_EXTRAS: int = 0x08
+
+_SMALL_VARINTS: tuple[bytes, ...] = tuple(bytes((i,)) for i in range(0, 128))
+
+_pack_float = struct.Struct('<d').pack
+_unpack_float = struct.Struct('<d').unpack_from
+
+
+def _varint(n: int) -> bytes:
+    """Encode the unsigned integer *n* as a LEB128 varint."""
+    if n < 0x80:
+        return _SMALL_VARINTS[n]
+    if n < 0x4000:
+        return bytes(((n & 0x7f) | 0x80, n >> 7))
+    out = bytearray()
+    while n >= 0x80:
+        out.append((n & 0x7f) | 0x80)
+        n >>= 7
+    out.append(n)
+    return bytes(out)
+
+
+def _zigzag(n: int) -> bytes:
+    """Encode the signed integer *n* as a zigzag varint, so that small negative integers are small varints."""
+    return _varint(n << 1 if n >= 0 else ((-n) << 1) - 1)
+
+
+def _encode_str(value: str) -> bytes:
+    data = value.encode('utf-8', 'surrogatepass')
+    return _varint(len(data)) + data
+
+
+def _entry(payload: bytes) -> bytes:
+    return _varint(len(payload)) + payload
+
+
+def _context_key(value: Any) -> Any:
+    """Get a hashable key for the extra attribute *value*, equal for values which are encoded equally."""
+    t = type(value)
+    if t is dict:
+        return (dict, tuple([(str(k), _context_key(v)) for k, v in value.items()]))
+    if t is str or t is int or t is bool or t is float or value is None:
+        return (t, value)
+    return (object, str(value))
+
+
+class _Reader:
+    """Reads the fields of an entry."""
+
+    __slots__ = ['data', 'offset', 'strings']
+
+    def __init__(self, data: bytes, offset: int) -> None:
+        self.data = data
+        self.offset = offset
+        self.strings: list[Optional[str]] = [None]
+
+    def varint(self) -> int:
+        data = self.data
+        offset = self.offset
+        result = data[offset]
+        offset += 1
+        if result >= 0x80:
+            result &= 0x7f
+            shift = 7
+            while True:
+                b = data[offset]
+                offset += 1
+                result |= (b & 0x7f) << shift
+                if b < 0x80:
+                    break
+                shift += 7
+        self.offset = offset
+        return result
+
+    def zigzag(self) -> int:
+        n = self.varint()
+        return n >> 1 if (n & 1) == 0 else -((n + 1) >> 1)
+
+    def string(self) -> str:
+        length = self.varint()
+        offset = self.offset
+        self.offset = offset + length
+        return self.data[offset:offset + length].decode('utf-8', 'surrogatepass')
+
+    def interned(self) -> Optional[str]:
+        return self.strings[self.varint()]
+
+    def value(self) -> Any:
+        tag = self.data[self.offset]
+        self.offset += 1
+        # NOTE: the value tags (`_NONE`, `_FALSE`, etc.)
+        match tag:
+            case 0:
+                return None
+            case 1:
+                return False
+            case 2:
+                return True
+            case 3:
+                return self.zigzag()
+            case 4:
+                value = _unpack_float(self.data, self.offset)[0]
+                self.offset += 8
+                return value
+            case 5:
+                return self.string()
+            case 6:
+                return self.interned()
+            case 7:
+                return {self.interned(): self.value() for _ in range(0, self.varint())}
+        raise ValueError(f'Unsupported value tag "{tag}"')
+
+
+class BinaryRecordCodec:
+    """
+    Encodes Log Records into a compact binary form for log files, deferring formatting until the log is read (see :meth:``decode``.)
+
+    A log is a *HEADER* followed by length-prefixed entries. Strings which repeat (logger names, format strings, context values, etc.) are interned, as are call sites (level, logger name, format string and location) and threads: each is defined by an entry once, and records refer to it by number. Timestamps are varints (microseconds since the previous record), and ``args`` are encoded as-is rather than interpolated (unless an argument is not a primitive, in which case the message is interpolated when encoded.) Exception info is rendered to text, and extra attributes (such as injected context) are kept.
+
+    An encoder is stateful, its definitions are only valid in the log it writes to. A reset entry (see :meth:``reset``) starts a new session of definitions, for example when a log is opened for appending.
+    """
+
+    HEADER: bytes = b'HNRB\x01'
+    """The header of a binary log, a magic number and a format version."""
+
+    def __init__(self, max_definitions: int = 65536) -> None:
+        """
+        Initialize *BinaryRecordCodec* instance.
+
+        :param max_definitions: The number of interned strings (or call sites) at which the encoder is reset, which bounds its memory use (such as when messages are not format strings), defaults to 65536.
+        """
+        self.__max_definitions = max_definitions
+        self.__strings: dict[str, bytes] = {}
+        self.__sites: dict[tuple[Any, ...], bytes] = {}
+        self.__threads: dict[tuple[Any, ...], bytes] = {}
+        self.__contexts: dict[Any, bytes] = {}
+        self.__retained: list[tuple[Any, ...]] = []
+        self.__extras: tuple[set[str], tuple[str, ...], Callable[[dict[str, Any]], Any]] = (set(), (), lambda attributes: ())
+        self.__created = 0
+
+    def reset(self) -> bytes:
+        """
+        Reset the definitions of the encoder.
+
+        :return: A reset entry, which must be written before any other entry encoded after the reset.
+        """
+        self.__strings.clear()
+        self.__sites.clear()
+        self.__threads.clear()
+        self.__contexts.clear()
+        self.__retained.clear()
+        self.__created = 0
+        # NOTE: the start time of `logging` is kept so that `relativeCreated` can be decoded
+        return _entry(_SMALL_VARINTS[_RESET] + _varint(round(getattr(logging, '_startTime', 0) * 1000000)))
+
+    def __intern(self, value: Optional[str], definitions: list[bytes]) -> bytes:
+        if value is None:
+            return _SMALL_VARINTS[0]
+        strings = self.__strings
+        e = strings.get(value)
+        if e is None:
+            e = _varint(len(strings) + 1)
+            strings[value] = e
+            definitions.append(_entry(_SMALL_VARINTS[_STRING] + e + value.encode('utf-8', 'surrogatepass')))
+        return e
+
+    def __encode_extra(self, value: Any, definitions: list[bytes]) -> bytes:
+        """Encode an extra attribute of a record, strings are interned (context repeats between records) and values which are not primitives are encoded as ``str``."""
+        t = type(value)
+        if t is str:
+            return _INTERNED + self.__intern(value, definitions)
+        if t is int:
+            return _INT + _zigzag(value)
+        if t is bool:
+            return _TRUE if value else _FALSE
+        if t is float:
+            return _FLOAT + _pack_float(value)
+        if value is None:
+            return _NONE
+        if t is dict:
+            return _DICT + _varint(len(value)) + b''.join([
+                self.__intern(str(k), definitions) + self.__encode_extra(v, definitions)
+                for k, v in value.items()
+            ])
+        return _STR + _encode_str(str(value))
+
+    def __define_context(self, names: tuple[str, ...], values: tuple[Any, ...], definitions: list[bytes]) -> bytes:
+        """Define the extra attributes of a record (its context), which are usually the same for many records."""
+        contexts = self.__contexts
+        try:
+            key: Any = (names, values)
+            e = contexts.get(key)
+        except TypeError:
+            # NOTE: keyed by content, an `extra` dict may be reused (and mutated) between records, only the immutable snapshots of `ContextInjectionFilter` are keyed by identity (and kept alive while they are keys)
+            key = (names, tuple([id(v) if k == '_metadata_fields' else _context_key(v) for k, v in zip(names, values)]))
+            e = contexts.get(key)
+            if e is None and '_metadata_fields' in names:
+                self.__retained.append(values)
+        if e is None:
+            e = _varint(len(contexts) + 1)
+            contexts[key] = e
+            fields = [_varint(len(names))]
+            for k, v in zip(names, values):
+                fields.append(self.__intern(k, definitions))
+                fields.append(self.__encode_extra(v, definitions))
+            definitions.append(_entry(_SMALL_VARINTS[_CONTEXT] + e + b''.join(fields)))
+        return e
+
+    def encode(self, record: logging.LogRecord) -> bytes:
+        """
+        Encode *record*, along with any definitions it requires.
+
+        :param record: The Log Record to encode.
+        :return: The encoded entries.
+        """
+        definitions: list[bytes] = []
+        sites = self.__sites
+        if len(sites) >= self.__max_definitions or len(self.__strings) >= self.__max_definitions or len(self.__contexts) >= self.__max_definitions:
+            definitions.append(self.reset())
+        attributes = record.__dict__
+        msg = record.msg
+        args = record.args
+        flags = 0
+        body: list[bytes] = []
+        if type(msg) is not str:
+            flags = _INTERPOLATED
+        elif args:
+            if type(args) is tuple:
+                body.append(_SMALL_VARINTS[len(args)] if len(args) < 0x80 else _varint(len(args)))
+                arg: Any
+                for arg in args:
+                    t = type(arg)
+                    if t is str:
+                        data = arg.encode('utf-8', 'surrogatepass')
+                        body.append(_STR + _varint(len(data)) + data)
+                    elif t is int:
+                        body.append(_INT + _zigzag(arg))
+                    elif t is float:
+                        body.append(_FLOAT + _pack_float(arg))
+                    elif t is bool:
+                        body.append(_TRUE if arg else _FALSE)
+                    elif arg is None:
+                        body.append(_NONE)
+                    else:
+                        # NOTE: the conversion of an object (`%s`, `%r`, etc.) is only known to the format string, the message is interpolated
+                        flags = _INTERPOLATED
+                        break
+            else:
+                flags = _INTERPOLATED
+        else:
+            body.append(_SMALL_VARINTS[0])
+        if flags == _INTERPOLATED:
+            body = [_encode_str(record.getMessage())]
+            msg = None
+        # NOTE: records logged from the same call site (and thread) share their level, logger name, format string and location
+        site_key = (record.name, record.levelno, record.levelname, msg, record.pathname, record.lineno, record.funcName)
+        site = sites.get(site_key)
+        if site is None:
+            intern = self.__intern
+            site = _varint(len(sites) + 1)
+            sites[site_key] = site
+            fields = b''.join([
+                _varint(record.levelno),
+                intern(record.levelname, definitions),
+                intern(record.name, definitions),
+                intern(msg, definitions),
+                intern(record.pathname, definitions),
+                _varint(record.lineno or 0),
+                intern(record.funcName, definitions)
+            ])
+            definitions.append(_entry(_SMALL_VARINTS[_SITE] + site + fields))
+        threads = self.__threads
+        thread_key = (record.thread, record.process, record.threadName, record.processName)
+        thread_id = threads.get(thread_key)
+        if thread_id is None:
+            thread, process, thread_name, process_name = thread_key
+            thread_id = _varint(len(threads) + 1)
+            threads[thread_key] = thread_id
+            fields = b''.join([
+                _varint(0 if process is None else process + 1),
+                _varint(0 if thread is None else thread + 1),
+                self.__intern(process_name, definitions),
+                self.__intern(thread_name, definitions)
+            ])
+            definitions.append(_entry(_SMALL_VARINTS[_THREAD] + thread_id + fields))
+        # NOTE: microseconds, consistent with `msecs` so that decoding renders the same `asctime` and `msecs`
+        created = record.created
+        seconds = int(created)
+        micros = round((created - seconds) * 1000000)
+        msecs = int(record.msecs) * 1000
+        if micros < msecs:
+            micros = msecs
+        elif micros > msecs + 999:
+            micros = msecs + 999
+        timestamp = seconds * 1000000 + micros
+        delta = timestamp - self.__created
+        self.__created = timestamp
+        if record.exc_info is not None or record.exc_text is not None or record.stack_info is not None:
+            exc_text = record.exc_text
+            if exc_text is None and record.exc_info is not None and record.exc_info[0] is not None:
+                exc_text = _formatter.formatException(record.exc_info)
+            if exc_text:
+                flags |= _EXC_TEXT
+                body.append(_encode_str(exc_text))
+            stack_info = record.stack_info
+            if stack_info:
+                flags |= _STACK_INFO
+                body.append(_encode_str(stack_info))
+        extras = attributes.keys() - _STANDARD_ATTRIBUTES
+        if extras:
+            # NOTE: records logged from the same code usually have the same extras, their (ordered) names are cached
+            cached = self.__extras
+            if cached[0] != extras:
+                names = tuple(sorted([k for k in extras if k[:1] != '_' or k == '_metadata_fields']))
+                getter = operator.itemgetter(*names) if len(names) > 1 else (lambda attributes: (attributes[names[0]],)) if len(names) == 1 else (lambda attributes: ())
+                cached = (extras, names, getter)
+                self.__extras = cached
+            names = cached[1]
+            if len(names) > 0:
+                flags |= _EXTRAS
+                body.append(self.__define_context(names, cached[2](attributes), definitions))
+        payload = b''.join([_SMALL_VARINTS[_RECORD], site, thread_id, _zigzag(delta), _SMALL_VARINTS[flags], *body])
+        definitions.append(_varint(len(payload)))
+        definitions.append(payload)
+        return b''.join(definitions)
+
+    @staticmethod
+    def decode(data: bytes) -> Iterator[logging.LogRecord]:
+        """
+        Decode the Log Records of a binary log.
+
+        :param data: The content of a binary log, starting with *HEADER*. A partially written last entry (such as when a process crashed) is ignored.
+        :return: An iterator of decoded Log Records, ``args`` are decoded as they were logged.
+        """
+        header = BinaryRecordCodec.HEADER
+        if data[:len(header)] != header:
+            raise ValueError(f'Unsupported binary log, expected a header of: {header!r}')
+        reader = _Reader(data, len(header))
+        length = len(data)
+        sites: list[dict[str, Any]] = [{}]
+        threads: list[dict[str, Any]] = [{}]
+        contexts: list[dict[str, Any]] = [{}]
+        start_time = 0.0
+        created = 0
+        while reader.offset < length:
+            try:
+                size = reader.varint()
+            except IndexError:
+                return
+            offset = reader.offset
+            end = offset + size
+            if end > length:
+                return
+            tag = data[offset]
+            reader.offset = offset + 1
+            if tag == _RECORD:
+                site = sites[reader.varint()]
+                thread = threads[reader.varint()]
+                created += reader.zigzag()
+                flags = data[reader.offset]
+                reader.offset += 1
+                msg = site['msg']
+                args: tuple[Any, ...]
+                if flags & _INTERPOLATED:
+                    msg = reader.string()
+                    args = ()
+                else:
+                    args = tuple([reader.value() for _ in range(0, reader.varint())])
+                record = logging.LogRecord.__new__(logging.LogRecord)
+                attributes = record.__dict__
+                attributes.update(site)
+                attributes.update(thread)
+                attributes.update({
+                    'msg': msg, 'args': args,
+                    'exc_info': None,
+                    'exc_text': reader.string() if flags & _EXC_TEXT else None,
+                    'stack_info': reader.string() if flags & _STACK_INFO else None,
+                    'created': created / 1000000, 'msecs': (created % 1000000) // 1000 + 0.0,
+                    'relativeCreated': (created / 1000000 - start_time) * 1000
+                })
+                if flags & _EXTRAS:
+                    attributes.update(contexts[reader.varint()])
+                yield record
+            elif tag == _STRING:
+                index = reader.varint()
+                if index != len(reader.strings):
+                    raise ValueError(f'Unexpected string definition "{index}", expected: {len(reader.strings)}')
+                reader.strings.append(data[reader.offset:end].decode('utf-8', 'surrogatepass'))
+            elif tag == _SITE:
+                index = reader.varint()
+                if index != len(sites):
+                    raise ValueError(f'Unexpected call site definition "{index}", expected: {len(sites)}')
+                levelno = reader.varint()
+                levelname = reader.interned()
+                name = reader.interned()
+                msg = reader.interned()
+                pathname = reader.interned()
+                filename: Optional[str]
+                try:
+                    filename = os.path.basename(cast(str, pathname))
+                    module = os.path.splitext(filename)[0]
+                except (TypeError, ValueError, AttributeError):
+                    filename = pathname
+                    module = 'Unknown module'
+                sites.append({
+                    'name': name, 'msg': msg,
+                    'levelname': levelname, 'levelno': levelno,
+                    'pathname': pathname, 'filename': filename, 'module': module,
+                    'lineno': reader.varint(), 'funcName': reader.interned()
+                })
+            elif tag == _THREAD:
+                index = reader.varint()
+                if index != len(threads):
+                    raise ValueError(f'Unexpected thread definition "{index}", expected: {len(threads)}')
+                process = reader.varint() - 1
+                thread_ident = reader.varint() - 1
+                threads.append({
+                    'process': None if process < 0 else process,
+                    'thread': None if thread_ident < 0 else thread_ident,
+                    'processName': reader.interned(),
+                    'threadName': reader.interned()
+                })
+            elif tag == _CONTEXT:
+                index = reader.varint()
+                if index != len(contexts):
+                    raise ValueError(f'Unexpected context definition "{index}", expected: {len(contexts)}')
+                contexts.append({
+                    cast(str, reader.interned()): reader.value()
+                    for _ in range(0, reader.varint())
+                })
+            elif tag == _RESET:
+                reader.strings = [None]
+                sites = [{}]
+                threads = [{}]
+                contexts = [{}]
+                start_time = reader.varint() / 1000000
+                created = 0
+            # NOTE: entries of an unknown kind are skipped, entries are length-prefixed
+            reader.offset = end
@@ -0,0 +1,263 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import glob
+import gzip
+import io
+import logging
+import logging.handlers
+import lzma
+import os
+import queue
+import shutil
+import threading
+import time
+from typing import Callable, Optional
+
+from .ProcessHandler import _finalize_at_exit
+
+
+_COMPRESSORS: dict[str, tuple[str, Callable[[str], io.BufferedIOBase]]] = {
+    'gzip': ('.gz', lambda filename: gzip.GzipFile(filename, 'wb')),
+    'lzma': ('.xz', lambda filename: lzma.LZMAFile(filename, 'wb')),
+}
+
+
+class BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    A :class:``logging.handlers.RotatingFileHandler`` which buffers formatted records, writing them to the file in large batches rather than one write (and flush) per record.
+
+    The buffer is written when it reaches *buffer_size* bytes, when *flush_interval* seconds have passed since a record was buffered, or immediately for records at or above *flush_level*. The size of the file is tracked as a running byte count, rather than by seeking the file for every record.
+
+    The log file is rotated when it would exceed *max_bytes*, or every *rotate_interval* seconds. Rotation only renames the log file on the emitting thread, shifting (and optionally compressing) rotated log files is performed by a background thread of the handler.
+    """
+
+    COMPRESSIONS: tuple[str, ...] = ('none', *_COMPRESSORS.keys())
+    """The supported compressions of rotated log files."""
+
+    def __init__(
+        self,
+        filename: str,
+        max_bytes: int = 0,
+        backup_count: int = 0,
+        encoding: Optional[str] = 'utf-8',
+        buffer_size: int = 256 * 1024,
+        flush_interval: float = 0.2,
+        flush_level: int | str = logging.ERROR,
+        rotate_interval: float = 0,
+        compress: Optional[str] = None
+    ) -> None:
+        """
+        Initialize *BufferedRotatingFileHandler*.
+
+        :param filename: The path of the log file.
+        :param max_bytes: The size in bytes at which the log file is rotated, ``0`` to never rotate by size, defaults to 0.
+        :param backup_count: The number of rotated log files to keep, defaults to 0.
+        :param encoding: The text encoding of the log file, defaults to 'utf-8'.
+        :param buffer_size: The number of buffered bytes at which the buffer is written, ``0`` to write every record immediately, defaults to 256KiB.
+        :param flush_interval: The maximum number of seconds a record is buffered before it is written, defaults to 0.2.
+        :param flush_level: Records at or above this level are written immediately (along with any buffered records), defaults to ERROR.
+        :param rotate_interval: The number of seconds between rotations of the log file (aligned to local midnight), ``0`` to never rotate by time, defaults to 0.
+        :param compress: The compression of rotated log files, one of 'none', 'gzip', or 'lzma', defaults to None (not compressed.)
+        """
+        compress = None if compress is None else compress.lower()
+        if compress is not None and compress not in BufferedRotatingFileHandler.COMPRESSIONS:
+            raise ValueError(f'Unsupported compression "{compress}", expected one of: {", ".join(BufferedRotatingFileHandler.COMPRESSIONS)}')
+        self.__compressor = None if compress is None else _COMPRESSORS.get(compress)
+        self.__buffer = list[str]()
+        self.__buffered = 0
+        self.__buffer_size = buffer_size
+        self.__flush_interval = flush_interval
+        self.__flush_level = (
+            flush_level
+            if isinstance(flush_level, int)
+            else int(getattr(logging, flush_level.upper()))
+        )
+        self.__rotate_interval = rotate_interval
+        self.__pending = threading.Event()
+        self.__closing = threading.Event()
+        self.__rotations = queue.SimpleQueue[Optional[str]]()
+        self.__rotator: Optional[threading.Thread] = None
+        self.__pid = 0
+        self.__thread: Optional[threading.Thread] = None
+        super().__init__(filename, 'a', max_bytes, backup_count, encoding)
+        self.__encoding = self.encoding if self.encoding is not None else 'utf-8'
+        self.__size = os.path.getsize(self.baseFilename) if os.path.isfile(self.baseFilename) else 0
+        self.__rollover_at = self.__compute_rollover(time.time())
+        # NOTE: log files renamed for rotation by a process which exited before they were rotated
+        for pending in sorted(glob.glob(glob.escape(self.baseFilename) + '.*.pending')):
+            self.__rotate_async(pending)
+        self.__finalizer = _finalize_at_exit(self)
+
+    def __compute_rollover(self, now: float) -> Optional[float]:
+        interval = self.__rotate_interval
+        if interval <= 0:
+            return None
+        local = time.localtime(now)
+        midnight = now - (local.tm_hour * 3600 + local.tm_min * 60 + local.tm_sec + (now % 1))
+        return midnight + ((now - midnight) // interval + 1) * interval
+
+    def __start(self) -> None:
+        if self.__pid != 0:
+            # NOTE: state inherited from a parent process belongs to the parent process
+            self.__buffer.clear()
+            self.__buffered = 0
+            self.__rotations = queue.SimpleQueue[Optional[str]]()
+            self.__rotator = None
+        self.__pending = threading.Event()
+        self.__closing = threading.Event()
+        self.__thread = threading.Thread(target=self.__run, name='hanaro.BufferedRotatingFileHandler', daemon=True)
+        self.__thread.start()
+        self.__pid = os.getpid()
+
+    def __run(self) -> None:
+        pending = self.__pending
+        closing = self.__closing
+        while not closing.is_set():
+            pending.wait()
+            pending.clear()
+            closing.wait(self.__flush_interval)
+            # NOTE: `logging.shutdown()` holds the handler lock while it closes the handler, which then waits for this thread (and writes the buffer itself)
+            if not self.__acquire_unless_closing():
+                return
+            try:
+                self.__write()
+            except Exception:
+                # NOTE: there is no record to report the error against, the buffered records are discarded
+                self.__buffer.clear()
+                self.__buffered = 0
+            finally:
+                self.release()
+
+    def __acquire_unless_closing(self) -> bool:
+        lock = self.lock
+        closing = self.__closing
+        while not closing.is_set():
+            if lock.acquire(timeout=0.1):  # type: ignore[union-attr]
+                return True
+        return False
+
+    def __write(self) -> None:
+        buffer = self.__buffer
+        if len(buffer) == 0:
+            return
+        if self.stream is None:
+            self.stream = self._open()
+        stream = self.stream
+        stream.write(''.join(buffer))
+        stream.flush()
+        buffer.clear()
+        self.__size += self.__buffered
+        self.__buffered = 0
+
+    def __rotate_async(self, pending: str) -> None:
+        rotator = self.__rotator
+        if rotator is None or not rotator.is_alive():
+            rotator = threading.Thread(target=self.__run_rotations, args=(self.__rotations,), name='hanaro.BufferedRotatingFileHandler.rotation', daemon=True)
+            self.__rotator = rotator
+            rotator.start()
+        self.__rotations.put(pending)
+
+    def __run_rotations(self, rotations: queue.SimpleQueue[Optional[str]]) -> None:
+        while (pending := rotations.get()) is not None:
+            try:
+                self.__rotate_backups(pending)
+            except Exception:
+                # NOTE: the rotated log file is retained (as a ".pending" file) and rotated when the handler is next created
+                pass
+
+    def __rotate_backups(self, pending: str) -> None:
+        base = self.baseFilename
+        compressor = self.__compressor
+        suffix = '' if compressor is None else compressor[0]
+        for i in range(self.backupCount - 1, 0, -1):
+            source = self.rotation_filename(f'{base}.{i}{suffix}')
+            destination = self.rotation_filename(f'{base}.{i + 1}{suffix}')
+            if os.path.exists(source):
+                if os.path.exists(destination):
+                    os.remove(destination)
+                os.rename(source, destination)
+        destination = self.rotation_filename(f'{base}.1{suffix}')
+        if os.path.exists(destination):
+            os.remove(destination)
+        if compressor is None:
+            os.rename(pending, destination)
+        else:
+            # NOTE: compressed to a temporary file, a partially compressed log file is never mistaken for a rotated log file
+            with open(pending, 'rb') as source_file, compressor[1](destination + '.tmp') as destination_file:
+                shutil.copyfileobj(source_file, destination_file, 1024 * 1024)
+            os.rename(destination + '.tmp', destination)
+            os.remove(pending)
+
+    def doRollover(self) -> None:  # noqa: N802
+        """Write any buffered records, then rotate the log file. Rotated log files are shifted (and compressed) by a background thread."""
+        self.__write()
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None  # type: ignore[assignment]
+        if self.backupCount > 0 and os.path.exists(self.baseFilename):
+            pending = f'{self.baseFilename}.{time.time_ns()}.pending'
+            os.rename(self.baseFilename, pending)
+            self.__rotate_async(pending)
+        self.stream = self._open()
+        self.__size = 0
+        self.__rollover_at = self.__compute_rollover(time.time())
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Format *record* into the buffer, rotating the log file if required and writing the buffer when it is full (or *record* is at or above *flush_level*.)
+
+        :param record: The Log Record to emit.
+        """
+        try:
+            if self.__pid != os.getpid():
+                self.__start()
+            text = self.format(record) + self.terminator
+            # NOTE: most log lines are ASCII, their length is their size in bytes
+            size = len(text) if text.isascii() else len(text.encode(self.__encoding))
+            rollover_at = self.__rollover_at
+            if rollover_at is not None and record.created >= rollover_at:
+                self.doRollover()
+            elif self.maxBytes > 0:
+                total = self.__size + self.__buffered
+                if total > 0 and total + size >= self.maxBytes:
+                    self.doRollover()
+            buffer = self.__buffer
+            buffer.append(text)
+            self.__buffered += size
+            if self.__buffered >= self.__buffer_size or record.levelno >= self.__flush_level:
+                self.__write()
+            elif len(buffer) == 1:
+                self.__pending.set()
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Write any buffered records, and flush the log file."""
+        self.acquire()
+        try:
+            self.__write()
+            super().flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Write any buffered records and close the log file, then wait for any rotated log files to be shifted (and compressed.)"""
+        self.__finalizer.cancel()
+        self.__closing.set()
+        self.__pending.set()
+        thread = self.__thread
+        rotator = self.__rotator
+        if self.__pid != os.getpid() and self.__pid != 0:
+            self.__buffer.clear()
+        elif thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self.acquire()
+        try:
+            self.__write()
+        finally:
+            self.release()
+        super().close()
+        if rotator is not None and rotator.is_alive():
+            self.__rotations.put(None)
+            rotator.join()
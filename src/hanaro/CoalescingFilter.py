@@ -0,0 +1,123 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import collections
+import logging
+import threading
+from typing import Any
+
+
+class CoalescingFilter(logging.Filter):
+    """
+    Coalesce repeated logging output within a window of time.
+
+    Records are repeats of each other when they have the same logger name, level, message template and ``args``. The first record passes the filter, repeats within *window* seconds of it are suppressed, and when the window closes a single record (``<message> (repeated N times)``) is logged in place of the repeats.
+
+    Windows are indexed by the repeated values, in the order they were opened, so closing windows costs a lookup per record. The first record of each open window is retained, to log its repeats. The number of open windows is bounded by *max_size*, when the bound is reached the oldest window is closed early. The decision is cached on the record (as ``_hanaro_coalesced``), so handlers sharing the filter make one decision per record.
+
+    A filter has no timer of its own, a window is closed when a record is filtered after the window has elapsed (or via :meth:``flush``.)
+    """
+
+    DEFAULT_MAX_SIZE: int = 4096
+    """The default maximum number of open windows."""
+
+    def __init__(self, name: str = '', window: float = 0.0, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """
+        Initialize *CoalescingFilter*.
+
+        :param name: A name for identifying the filter, defaults to ''.
+        :param window: The number of seconds within which repeated records are coalesced, ``0`` to disable coalescing, defaults to 0.0.
+        :param max_size: The maximum number of open windows, defaults to ``DEFAULT_MAX_SIZE``.
+        """
+        self.__lock = threading.Lock()
+        # NOTE: `OrderedDict` because closed windows are removed from the front, which degrades iteration of a `dict`
+        self.__index: collections.OrderedDict[tuple[Any, ...], list[Any]] = collections.OrderedDict()
+        self.__window = 0.0
+        self.__max_size = 1
+        super().__init__(name)
+        self.configure(window, max_size)
+
+    def configure(self, window: float = 0.0, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """
+        Replace the filter settings, closing all open windows.
+
+        :param window: The number of seconds within which repeated records are coalesced, ``0`` to disable coalescing, defaults to 0.0.
+        :param max_size: The maximum number of open windows, defaults to ``DEFAULT_MAX_SIZE``.
+        """
+        with self.__lock:
+            self.__window = max(0.0, window)
+            self.__max_size = max(1, max_size)
+        self.flush()
+
+    def flush(self) -> None:
+        """Close all open windows, logging a record in place of the repeats of each, such as before shutdown."""
+        with self.__lock:
+            closed = list(self.__index.values())
+            self.__index.clear()
+        self.__log_repeats(closed)
+
+    def __log_repeats(self, closed: list[list[Any]]) -> None:
+        for _, count, first, last in closed:
+            if count == 0:
+                continue
+            repeat = logging.makeLogRecord(first.__dict__)
+            attributes = repeat.__dict__
+            attributes.pop('_formatted', None)
+            repeat.msg = '%s (repeated %d times)'
+            repeat.args = (first.getMessage(), count)
+            repeat.exc_info = None
+            repeat.exc_text = None
+            repeat.stack_info = None
+            repeat.created = last
+            repeat.msecs = int((last - int(last)) * 1000) + 0.0
+            repeat.relativeCreated = (last - logging._startTime) * 1000  # type: ignore[attr-defined]
+            # NOTE: the record of the repeats is never coalesced itself
+            attributes['_hanaro_coalesced'] = True
+            logging.getLogger(first.name).handle(repeat)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        attributes = record.__dict__
+        decision = attributes.get('_hanaro_coalesced', None)
+        if decision is not None:
+            return bool(decision)
+        window = self.__window
+        if window <= 0:
+            return True
+        # NOTE: keyed on the values themselves rather than their hash, records with colliding hashes are not repeats
+        key = (record.name, record.levelno, record.msg, record.args)
+        try:
+            hash(key)
+        except TypeError:
+            # NOTE: such as `args` which is a dict, records which cannot be hashed are never coalesced
+            return True
+        created = record.created
+        closed = None
+        index = self.__index
+        with self.__lock:
+            # NOTE: windows are opened in order (and have the same length), closed windows are at the front of the index
+            while len(index) > 0 and index[next(iter(index))][0] <= created:
+                if closed is None:
+                    closed = []
+                closed.append(index.popitem(last=False)[1])
+            entry = index.get(key, None)
+            if entry is None or entry[0] <= created:
+                if entry is not None:
+                    # NOTE: a window which is not at the front of the index, because records were filtered out of order
+                    if closed is None:
+                        closed = []
+                    closed.append(index.pop(key))
+                elif len(index) >= self.__max_size:
+                    if closed is None:
+                        closed = []
+                    closed.append(index.popitem(last=False)[1])
+                index[key] = [created + window, 0, record, created]
+                decision = True
+            else:
+                entry[1] += 1
+                if created > entry[3]:
+                    entry[3] = created
+                decision = False
+        attributes['_hanaro_coalesced'] = decision
+        if closed is not None:
+            self.__log_repeats(closed)
+        return decision
@@ -26,32 +26,82 @@ class _ConfigFilterSettings:
             else re.compile(f'^{source}$', re.RegexFlag.IGNORECASE)
         )
 
+    def matches(self, name: str) -> bool:
+        """Determine if the logger *name* is matched by these settings."""
+        return (
+            name == self.source
+            if self.pattern is None
+            else self.pattern.match(name) is not None
+        )
+
+
+class _ConfigFilterState:
+    """Represent the rules of a :class:``ConfigFilter`` paired with the decisions cached for those rules."""
+
+    __slots__ = ['cache', 'settings']
+    cache: dict[str, int]
+    settings: list[_ConfigFilterSettings]
+
+    def __init__(self, settings: list[_ConfigFilterSettings]) -> None:
+        self.cache = {}
+        self.settings = settings
+
 
 class ConfigFilter(logging.Filter):
     """Filter out unwanted logging output via configuration."""
 
-    def __init__(self, name: str = '', config: Optional[dict[str, dict[str, Any]]] = None) -> None:
+    DEFAULT_CACHE_SIZE: int = 4096
+    """The default maximum number of logger names with a cached decision."""
+
+    def __init__(self, name: str = '', config: Optional[dict[str, dict[str, Any]]] = None, cache_size: int = DEFAULT_CACHE_SIZE) -> None:
         """
         Initialize *ConfigFilter*.
 
         :param name: A name for identifying the filter, defaults to ''.
+        :param config: Filter configuration settings, defaults to {}.
+        :param cache_size: The maximum number of logger names with a cached decision, defaults to ``DEFAULT_CACHE_SIZE``.
+        """
+        self.__cache_size = max(1, cache_size)
+        self.__state = _ConfigFilterState([])
+        super().__init__(name)
+        self.configure(config)
+
+    def configure(self, config: Optional[dict[str, dict[str, Any]]] = None) -> None:
+        """
+        Replace the filter configuration settings, invalidating any cached decisions.
+
+        The new settings take effect atomically, records being filtered concurrently observe either the old or the new settings (never a mix of both.)
+
         :param config: Filter configuration settings, defaults to {}.
         """
         if config is None:
             config = {}
-        self.__settings = [
+        self.__state = _ConfigFilterState([
             _ConfigFilterSettings(k, v)
             for k, v in config.items()
-        ]
-        super().__init__(name)
+        ])
+
+    def get_level(self, name: str) -> int:
+        """
+        Get the effective minimum level for records from the logger *name*.
+
+        :param name: The name of a logger.
+        :return: The minimum level required for a record to pass the filter, ``logging.NOTSET`` if no settings match *name*.
+        """
+        state = self.__state
+        level = state.cache.get(name)
+        if level is None:
+            level = logging.NOTSET
+            for e in state.settings:
+                if e.level > level and e.matches(name):
+                    level = e.level
+            if len(state.cache) >= self.__cache_size:
+                state.cache.clear()
+            state.cache[name] = level
+        return level
 
     def filter(self, record: logging.LogRecord) -> bool:
-        for e in self.__settings:
-            is_match = (
-                record.name == e.source
-                if e.pattern is None
-                else e.pattern.match(record.name)
-            )
-            if is_match and record.levelno < e.level:
-                return False
-        return True
+        level = self.__state.cache.get(record.name)
+        if level is None:
+            level = self.get_level(record.name)
+        return record.levelno >= level
@@ -3,11 +3,125 @@
 from __future__ import annotations
 
 import contextvars
+import functools
 import logging
 import re
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=1024)
+def _metadata_pattern(key: str) -> re.Pattern[str]:
+    """Get a compiled pattern matching a ``key="value"`` metadata pair for the specified *key*."""
+    return re.compile(f' {re.escape(key)}="[^"]*"')
+
+
+class _ContextMetadata:
+    """Represent a pre-rendered "metadata" attribute, and the last merge performed with it."""
+
+    __slots__ = ['context', 'merged', 'rendered']
+    context: dict[str, str]
+    merged: tuple[str, str] | None
+    rendered: str
+
+    def __init__(self, context: dict[str, str]) -> None:
+        for k in context.keys():
+            _metadata_pattern(k)
+        self.context = context
+        self.merged = None
+        self.rendered = ' '.join(f'{k}="{v}"' for k, v in context.items())
+
+    def merge(self, metadata: str) -> str:
+        """Merge the context into *metadata* already carried by a record, replacing values of existing keys."""
+        merged = self.merged
+        if merged is not None and merged[0] == metadata:
+            return merged[1]
+        result = f' {metadata}'
+        appended = []
+        for k, v in self.context.items():
+            if f' {k}="' in result:
+                pair = f' {k}="{v}"'
+                result = _metadata_pattern(k).sub(lambda _: pair, result)
+            else:
+                appended.append(f'{k}="{v}"')
+        if len(appended) > 0:
+            result = f'{result} {" ".join(appended)}'
+        result = result.lstrip()
+        self.merged = (metadata, result)
+        return result
+
+
+class _ContextSnapshot:
+    """
+    Represent an immutable snapshot of context to be injected into Log Records.
+
+    Snapshots are layered copy-on-write, a snapshot for a nested scope is derived from the snapshot of its enclosing scope (its *base*) and is only rebuilt when either changes.
+    """
+
+    __slots__ = ['attributes', 'base', 'fields', 'metadata']
+    attributes: dict[str, str]
+    base: _ContextSnapshot | None
+    fields: dict[str, dict[str, str]]
+    metadata: dict[str, _ContextMetadata]
+
+    def __init__(self, attributes: dict[str, str], metadata: dict[str, dict[str, str]], base: _ContextSnapshot | None = None) -> None:
+        self.attributes = attributes
+        self.base = base
+        self.metadata = {
+            k: _ContextMetadata(v)
+            for k, v in metadata.items()
+        }
+        self.fields = {
+            k: v
+            for k, v in metadata.items()
+            if len(v) > 0
+        }
+
+    def layer(self, other: _ContextSnapshot) -> _ContextSnapshot:
+        """Create a new snapshot with the context of *other* layered over this snapshot."""
+        metadata = {k: v.context for k, v in self.metadata.items()}
+        for k, v in other.metadata.items():
+            metadata[k] = {**metadata[k], **v.context} if k in metadata else v.context
+        return _ContextSnapshot({**self.attributes, **other.attributes}, metadata, self)
+
+    def inject(self, record: logging.LogRecord) -> None:
+        """
+        Inject the snapshot into *record*.
+
+        Metadata is injected as a pre-rendered attribute, the fields it was rendered from are also injected (as ``_metadata_fields``, keyed by metadata attribute name) for formatters which output structured records.
+        """
+        attributes = record.__dict__
+        if len(self.metadata) == 0:
+            attributes.update(self.attributes)
+        else:
+            existing = [attributes.get(k, None) for k in self.metadata.keys()]
+            attributes.update(self.attributes)
+            fields = attributes.get('_metadata_fields', None)
+            if not any(existing):
+                for k, v in self.metadata.items():
+                    attributes[k] = v.rendered
+                if len(self.fields) > 0:
+                    attributes['_metadata_fields'] = self.fields if fields is None else {**fields, **self.fields}
+                return
+            merged_fields = {} if fields is None else dict(fields)
+            for metadata, e in zip(self.metadata.items(), existing):
+                name, context_metadata = metadata
+                if not e:
+                    attributes[name] = context_metadata.rendered
+                    if len(context_metadata.context) > 0:
+                        merged_fields[name] = context_metadata.context
+                else:
+                    attributes[name] = context_metadata.merge(str(e))
+                    if len(context_metadata.context) > 0:
+                        previous = merged_fields.get(name, None)
+                        if previous is None:
+                            # NOTE: merged into metadata which was not injected from a context, its fields are only known as text
+                            merged_fields.pop(name, None)
+                        else:
+                            merged_fields[name] = {**previous, **context_metadata.context}
+            if fields is not None or len(merged_fields) > 0:
+                attributes['_metadata_fields'] = merged_fields
+
+
 class ContextInjectionFilter(logging.Filter):
     """Injects context data into Log Records."""
 
@@ -19,7 +133,7 @@ class ContextInjectionFilter(logging.Filter):
         :param is_metadata: Indicates that the Context being injects is a "metadata" context.
         :param metadata_name: For "metadata" contexts, sets the Log Record Attribute Name of the metadata, defaults to "metadata".
         """
-        self.__context = context if context is not None else {}
+        self.__context = dict(context) if context is not None else {}
         self.__is_metadata = is_metadata
         self.__metadata_name = (
             metadata_name
@@ -28,6 +142,41 @@ class ContextInjectionFilter(logging.Filter):
         )
         super().__init__()
         self.__token: contextvars.Token[Optional[ContextInjectionFilter]] | None = None
+        self.__parent: Optional[ContextInjectionFilter] = None
+        self.__scope: _ContextSnapshot | None = None
+        self.__snapshot: _ContextSnapshot | None = None
+
+    def __invalidate(self) -> None:
+        """Discard snapshots, called only when the context changes."""
+        self.__snapshot = None
+        self.__scope = None
+
+    def __get_snapshot(self) -> _ContextSnapshot:
+        snapshot = self.__snapshot
+        if snapshot is None:
+            context = dict(self.__context)
+            snapshot = self.__snapshot = _ContextSnapshot(
+                context,
+                {self.__metadata_name: context} if self.__is_metadata else {})
+        return snapshot
+
+    def _get_scope_snapshot(self) -> _ContextSnapshot:
+        """
+        Get a snapshot of this context layered over the contexts of all enclosing scopes.
+
+        The cost of this call depends only on the depth of the active scope, snapshots are rebuilt only when a context in the active scope changes.
+        """
+        parent = self.__parent
+        base = None if parent is None else parent._get_scope_snapshot()
+        scope = self.__scope
+        if scope is None or scope.base is not base:
+            snapshot = self.__get_snapshot()
+            scope = self.__scope = (
+                snapshot
+                if base is None
+                else base.layer(snapshot)
+            )
+        return scope
 
     def __getitem__(self, key: str) -> str | None:
         """
@@ -48,8 +197,10 @@ class ContextInjectionFilter(logging.Filter):
         if value is None:
             if key in self.__context:
                 del self.__context[key]
-        else:
+                self.__invalidate()
+        elif self.__context.get(key, None) != value:
             self.__context[key] = value
+            self.__invalidate()
 
     def __delitem__(self, key: str) -> None:
         """
@@ -57,14 +208,14 @@ class ContextInjectionFilter(logging.Filter):
 
         :param key: The key to delete the value of.
         """
-        self.__context.pop(key, None)
+        if self.__context.pop(key, None) is not None:
+            self.__invalidate()
 
     def __enter__(self) -> ContextInjectionFilter:
         """
         Establish this filter as the active context.
 
-        Any :func:``get_logger()`` call within this context will
-        automatically attach this filter to the returned logger.
+        Any Log Record handled within this context (by handlers configured via :func:``configure_logging()``, or by queued loggers) will receive this context, layered over the contexts of any enclosing scopes.
 
         Returns
         -------
@@ -72,6 +223,8 @@ class ContextInjectionFilter(logging.Filter):
             Returns ``self`` so it can be assigned in a ``with`` statement.
         """
         from .utils import _CIF_contextvar
+        self.__parent = _CIF_contextvar.get()
+        self.__scope = None
         self.__token = _CIF_contextvar.set(self)
         return self
 
@@ -84,6 +237,8 @@ class ContextInjectionFilter(logging.Filter):
         if self.__token is not None:
             _CIF_contextvar.reset(self.__token)
             self.__token = None
+        self.__parent = None
+        self.__scope = None
 
     def filter(self, record: logging.LogRecord) -> bool:
         """
@@ -92,16 +247,8 @@ class ContextInjectionFilter(logging.Filter):
         :param record: The Log Record to mutate.
         :return: ``True``
         """
-        if self.__is_metadata:
-            metadata = f' {getattr(record, self.__metadata_name, "")}'
-            for k, v in self.__context.items():
-                if not hasattr(record, k):
-                    metadata = f'{metadata} {k}="{v}"'
-                else:
-                    metadata = re.sub(f' {k}="[^"]*"', f' {k}="{v}"', metadata)
-                setattr(record, k, v)
-            setattr(record, self.__metadata_name, metadata.lstrip())
-        else:
-            for k, v in self.__context.items():
-                setattr(record, k, v)
+        snapshot = self.__snapshot
+        if snapshot is None:
+            snapshot = self.__get_snapshot()
+        snapshot.inject(record)
         return True
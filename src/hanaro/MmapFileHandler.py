@@ -0,0 +1,184 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+import mmap
+import os
+import threading
+from typing import Optional, cast
+
+from .ProcessHandler import _finalize_at_exit
+
+
+def _preallocate(filename: str, size: int) -> None:
+    """Create (or extend) the segment file *filename* to *size* bytes, allocating its blocks where supported."""
+    fd = os.open(filename, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if os.fstat(fd).st_size < size:
+            os.ftruncate(fd, size)
+        if hasattr(os, 'posix_fallocate'):
+            try:
+                # NOTE: a sparse segment could fail to allocate a block on a full disk, which is a SIGBUS when writing to the mapping
+                os.posix_fallocate(fd, 0, size)
+            except OSError:
+                pass
+    finally:
+        os.close(fd)
+
+
+def _used_length(data: bytes | mmap.mmap) -> int:
+    """Get the used length of the segment *data*, the offset after its last non-zero byte."""
+    # NOTE: scanned back from the end rather than for the first zero byte, a record may contain NUL characters (every record ends with a newline)
+    end = len(data)
+    while end > 0:
+        start = max(0, end - 64 * 1024)
+        chunk = data[start:end].rstrip(b'\0')
+        if len(chunk) > 0:
+            return start + len(chunk)
+        end = start
+    return 0
+
+
+class MmapFileHandler(logging.Handler):
+    """
+    Writes Log Records into a preallocated, memory-mapped log segment, such that a write costs about a memory copy (the kernel writes the segment back to disk.)
+
+    When a segment is full the handler rolls over to the next segment, which is preallocated in the background, and rotated segments are retained like those of ``RotatingFileHandler`` (``app.log.1``, ``app.log.2``, etc.) When the handler is closed the segment is truncated to its used length, otherwise unused space at the end of a segment is zero-filled (see :meth:``recover``.)
+
+    A segment must only be written by a single process, forked processes should forward records to the parent process (see :class:``ProcessHandler``.)
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        max_bytes: int = 4 * 1024 * 1024,
+        backup_count: int = 10,
+        encoding: str = 'utf-8'
+    ) -> None:
+        """
+        Initialize *MmapFileHandler*, opening (or creating) the segment.
+
+        :param filename: The path of the log segment.
+        :param max_bytes: The size of each segment in bytes, defaults to 4MiB.
+        :param backup_count: The number of rotated segments to keep, defaults to 10.
+        :param encoding: The text encoding of the log segment, defaults to 'utf-8'.
+        """
+        super().__init__()
+        self.baseFilename = os.path.abspath(filename)
+        self.__max_bytes = max_bytes
+        self.__backup_count = backup_count
+        self.__encoding = encoding
+        self.__pid = os.getpid()
+        self.__mapping: Optional[mmap.mmap] = None
+        self.__offset = 0
+        self.__preallocator: Optional[threading.Thread] = None
+        self.__open()
+        self.__finalizer = _finalize_at_exit(self)
+
+    @staticmethod
+    def recover(filename: str, encoding: str = 'utf-8') -> list[str]:
+        """
+        Recover the complete lines of a segment, such as a segment which was not closed because the process crashed.
+
+        :param filename: The path of the log segment.
+        :param encoding: The text encoding of the log segment, defaults to 'utf-8'.
+        :return: The complete (newline-terminated) lines of the segment, a partially written last line is excluded.
+        """
+        with open(filename, 'rb') as file:
+            data = file.read()
+        data = data[:_used_length(data)]
+        end = data.rfind(b'\n')
+        return data[:end + 1].decode(encoding, 'replace').splitlines()
+
+    def __next_filename(self) -> str:
+        return f'{self.baseFilename}.next'
+
+    def __open(self) -> None:
+        filename = self.baseFilename
+        next_filename = self.__next_filename()
+        if not os.path.exists(filename) and os.path.exists(next_filename):
+            os.rename(next_filename, filename)
+        _preallocate(filename, self.__max_bytes)
+        with open(filename, 'r+b') as file:
+            mapping = mmap.mmap(file.fileno(), 0)
+        # NOTE: a segment which was not closed (the process crashed) is zero-filled after its last record
+        self.__offset = _used_length(mapping)
+        self.__mapping = mapping
+        self.__preallocator = threading.Thread(target=_preallocate, args=(next_filename, self.__max_bytes), name='hanaro.MmapFileHandler', daemon=True)
+        self.__preallocator.start()
+
+    def __close(self) -> None:
+        mapping = self.__mapping
+        if mapping is None:
+            return
+        self.__mapping = None
+        mapping.close()
+        if self.__pid == os.getpid():
+            # NOTE: a clean close truncates the segment to its used length
+            os.truncate(self.baseFilename, self.__offset)
+
+    def doRollover(self) -> None:  # noqa: N802
+        """Close the current segment, rotate segments, and open the next (preallocated) segment."""
+        self.__close()
+        preallocator = self.__preallocator
+        if preallocator is not None:
+            preallocator.join()
+        if self.__backup_count > 0:
+            for i in range(self.__backup_count - 1, 0, -1):
+                source = f'{self.baseFilename}.{i}'
+                destination = f'{self.baseFilename}.{i + 1}'
+                if os.path.exists(source):
+                    os.replace(source, destination)
+            os.replace(self.baseFilename, f'{self.baseFilename}.1')
+        else:
+            os.remove(self.baseFilename)
+        self.__open()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Copy the formatted *record* into the segment, rolling over to the next segment when the segment is full.
+
+        :param record: The Log Record to emit.
+        """
+        try:
+            data = (self.format(record) + '\n').encode(self.__encoding)
+            if self.__mapping is None:
+                self.__open()
+            offset = self.__offset
+            if offset + len(data) > self.__max_bytes:
+                if offset > 0:
+                    self.doRollover()
+                    offset = self.__offset
+                # NOTE: a record larger than a segment is truncated
+                data = data[:self.__max_bytes - offset]
+            end = offset + len(data)
+            cast(mmap.mmap, self.__mapping)[offset:end] = data
+            self.__offset = end
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """Schedule writeback of the segment (it is not necessary to flush for records to survive a crash of the process, only of the operating system.)"""
+        self.acquire()
+        try:
+            if self.__mapping is not None:
+                self.__mapping.flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Close the segment, truncating it to its used length."""
+        self.__finalizer.cancel()
+        self.acquire()
+        try:
+            self.__close()
+            preallocator = self.__preallocator
+            if preallocator is not None and self.__pid == os.getpid():
+                preallocator.join()
+                self.__preallocator = None
+                # NOTE: the next segment is only preallocated while the handler is open
+                if os.path.exists(self.__next_filename()):
+                    os.remove(self.__next_filename())
+        finally:
+            self.release()
+        super().close()
@@ -0,0 +1,166 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+import multiprocessing.connection
+import multiprocessing.util
+import os
+import threading
+import weakref
+from typing import Any, Optional
+
+from .RecordCodec import RecordCodec
+
+
+def _close_handler(ref: 'weakref.ref[logging.Handler]') -> None:
+    handler = ref()
+    if handler is not None:
+        handler.close()
+
+
+def _finalize_at_exit(handler: logging.Handler) -> 'multiprocessing.util.Finalize[None]':
+    """
+    Close *handler* when the process exits, returning the finalizer (which *handler* cancels when it is closed.)
+
+    :param handler: The handler to close.
+    :return: The finalizer of *handler*.
+    """
+    # NOTE: `multiprocessing` children exit without running `atexit` hooks (and so without `logging.shutdown()`), finalizers are run in both cases
+    # NOTE: a forked child inherits the finalizers of the parent, handlers only release the state of the process which created them (such as threads) and discard inherited state
+    # NOTE: the finalizer holds a weak reference to *handler* (not a bound method), so that a handler which is discarded can be collected
+    return multiprocessing.util.Finalize(handler, _close_handler, args=(weakref.ref(handler),), exitpriority=10)
+
+
+class _LockFreeHandler(logging.Handler):
+    """A handler whose ``emit`` is thread-safe, records are handled without acquiring the handler lock so that emitting threads can prepare (freeze, encode or queue) records concurrently."""
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """
+        Conditionally emit *record*, without acquiring the handler lock.
+
+        :param record: The Log Record to handle.
+        :return: ``True`` if *record* was emitted, otherwise ``False``.
+        """
+        rv = self.filter(record)
+        if isinstance(rv, logging.LogRecord):
+            record = rv
+        if rv:
+            self.emit(record)
+        return bool(rv)
+
+
+class ProcessHandler(_LockFreeHandler):
+    """
+    Forwards Log Records to an aggregating process (see :class:``ProcessListener``), so that many processes can share the same log output without clobbering it.
+
+    Records are frozen (see :class:``RecordCodec``) by the emitting thread, and sent in batches (one message per batch) by a background thread of the handler.
+    """
+
+    def __init__(self, address: Any, timeout: Optional[float] = 5.0) -> None:
+        """
+        Initialize *ProcessHandler*.
+
+        :param address: The address of the :class:``ProcessListener`` to forward records to.
+        :param timeout: The maximum number of seconds to wait for queued records to be sent when flushing or closing the handler, ``None`` to wait indefinitely, defaults to 5.0.
+        """
+        super().__init__()
+        self.__address = address
+        self.__timeout = timeout
+        self.__condition = threading.Condition(threading.Lock())
+        self.__buffer = list[tuple[Any, ...]]()
+        self.__in_flight = 0
+        self.__drop_count = 0
+        self.__is_closed = False
+        self.__pid = 0
+        self.__thread: Optional[threading.Thread] = None
+        self.__finalizer = _finalize_at_exit(self)
+
+    @property
+    def drop_count(self) -> int:
+        """The number of records dropped because they could not be sent."""
+        return self.__drop_count
+
+    def __start(self) -> None:
+        with self.lock:  # type: ignore[union-attr]
+            if self.__pid != os.getpid():
+                # NOTE: state inherited from a parent process belongs to the parent process
+                self.__condition = threading.Condition(threading.Lock())
+                self.__buffer = []
+                self.__in_flight = 0
+                self.__thread = threading.Thread(target=self.__run, name='hanaro.ProcessHandler', daemon=True)
+                self.__thread.start()
+                self.__pid = os.getpid()
+
+    def __run(self) -> None:
+        condition = self.__condition
+        connection: Optional[multiprocessing.connection.Connection] = None
+        while True:
+            with condition:
+                while len(self.__buffer) == 0 and not self.__is_closed:
+                    condition.wait()
+                batch = self.__buffer
+                if len(batch) == 0:
+                    break
+                self.__buffer = []
+                self.__in_flight = len(batch)
+            try:
+                if connection is None:
+                    connection = multiprocessing.connection.Client(self.__address)
+                connection.send_bytes(RecordCodec.encode_many(batch))
+            except OSError:
+                self.__drop_count += len(batch)
+                if connection is not None:
+                    connection.close()
+                    connection = None
+            with condition:
+                self.__in_flight = 0
+                condition.notify_all()
+        if connection is not None:
+            connection.close()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Freeze *record* and queue it to be sent to the aggregating process.
+
+        :param record: The Log Record to emit.
+        """
+        try:
+            frozen = RecordCodec.freeze(record)
+        except Exception:
+            self.handleError(record)
+            return
+        if self.__pid != os.getpid():
+            self.__start()
+        condition = self.__condition
+        with condition:
+            if self.__is_closed:
+                self.__drop_count += 1
+                return
+            buffer = self.__buffer
+            buffer.append(frozen)
+            if len(buffer) == 1:
+                condition.notify_all()
+
+    def flush(self) -> None:
+        """Wait (up to *timeout* seconds) for queued records to be sent."""
+        if self.__pid != os.getpid():
+            return
+        thread = self.__thread
+        with self.__condition:
+            self.__condition.wait_for(
+                lambda: (len(self.__buffer) == 0 and self.__in_flight == 0) or thread is None or not thread.is_alive(),
+                self.__timeout)
+
+    def close(self) -> None:
+        """Send any queued records (waiting up to *timeout* seconds), then close the connection to the aggregating process."""
+        self.__finalizer.cancel()
+        if self.__pid == os.getpid():
+            with self.__condition:
+                self.__is_closed = True
+                self.__condition.notify_all()
+            thread = self.__thread
+            if thread is not None and thread is not threading.current_thread():
+                thread.join(self.__timeout)
+        else:
+            self.__is_closed = True
+        super().close()
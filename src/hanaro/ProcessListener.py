@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import marshal
+import multiprocessing.connection
+import os
+import threading
+import time
+from typing import Any, Optional
+
+from .QueuedHandler import QueuedHandler
+from .RecordCodec import RecordCodec
+from .RecordQueue import RecordQueue
+from .SharedMemoryRing import SharedMemoryRing
+
+
+_RING_BATCH_SIZE: int = 256
+_RING_WAIT_TIMEOUT: float = 0.1
+_RING_POLL_INTERVAL: float = 0.001
+
+
+class ProcessListener:
+    """
+    Receives Log Records forwarded by :class:``ProcessHandler`` instances in other processes, putting them into a Log Queue (by default the Log Queue of :class:``QueuedHandler``) to be output by a single process.
+
+    Each connected process is served by its own thread, and the overflow policy of the Log Queue applies to received records (a full queue applies backpressure to the sending process.) A process connected via :class:``SharedMemoryHandler`` announces a :class:``SharedMemoryRing``, records are then read from the ring rather than the connection.
+
+    Access to the listener is restricted by file permissions (a Unix-domain socket is only accessible by its owner) rather than an authentication handshake, an HMAC handshake could deadlock a process forked while another connection is being authenticated.
+    """
+
+    def __init__(self, address: Any = None, queue: Optional[RecordQueue] = None) -> None:
+        """
+        Initialize *ProcessListener*, and begin accepting connections.
+
+        :param address: The address to listen on, such as the path of a Unix-domain socket, defaults to None (an arbitrary address.)
+        :param queue: The Log Queue to put received records into, defaults to None (the Log Queue of :class:``QueuedHandler``.)
+        """
+        self.__queue = QueuedHandler.get_queue() if queue is None else queue
+        self.__listener = multiprocessing.connection.Listener(address)
+        address = self.__listener.address
+        if (
+            multiprocessing.connection.address_type(address) == 'AF_UNIX'  # type: ignore[attr-defined]
+            and isinstance(address, str)
+            and not address.startswith('\0')
+        ):
+            os.chmod(address, 0o600)
+        self.__is_closed = False
+        self.__receivers = set[threading.Thread]()
+        self.__thread = threading.Thread(target=self.__accept, name='hanaro.ProcessListener', daemon=True)
+        self.__thread.start()
+
+    @property
+    def address(self) -> Any:
+        """The address of the listener, to be passed to :class:``ProcessHandler``."""
+        return self.__listener.address
+
+    def __accept(self) -> None:
+        while not self.__is_closed:
+            try:
+                connection = self.__listener.accept()
+            except OSError:
+                continue
+            if self.__is_closed:
+                connection.close()
+                break
+            receiver = threading.Thread(target=self.__receive, args=(connection,), name='hanaro.ProcessListener.connection', daemon=True)
+            self.__receivers.add(receiver)
+            receiver.start()
+
+    def __receive(self, connection: multiprocessing.connection.Connection) -> None:
+        put = self.__queue.put
+        thaw = RecordCodec.thaw
+        try:
+            while True:
+                message = marshal.loads(connection.recv_bytes())
+                if isinstance(message, str):
+                    self.__receive_ring(connection, SharedMemoryRing(message))
+                    break
+                for frozen in message:
+                    put(thaw(frozen))
+        except (OSError, EOFError):
+            pass
+        finally:
+            connection.close()
+            self.__receivers.discard(threading.current_thread())
+
+    def __receive_ring(self, connection: multiprocessing.connection.Connection, ring: SharedMemoryRing) -> None:
+        put = self.__queue.put
+        # NOTE: the name is removed immediately, the ring is released once both processes detach (even if either crashes)
+        ring.unlink()
+        try:
+            is_connected = True
+            while is_connected:
+                records = ring.get_many(_RING_BATCH_SIZE)
+                for record in records:
+                    put(record)
+                if len(records) == _RING_BATCH_SIZE:
+                    continue
+                # NOTE: a short pause lets the producer write many records per wakeup, rather than waking the consumer for every record
+                time.sleep(_RING_POLL_INTERVAL)
+                if ring.prepare_wait():
+                    try:
+                        # NOTE: the timeout bounds latency should a wakeup race with the "waiting" flag
+                        if connection.poll(_RING_WAIT_TIMEOUT):
+                            connection.recv_bytes()
+                    except (OSError, EOFError):
+                        is_connected = False
+            for record in ring.get_many():
+                put(record)
+        finally:
+            ring.close()
+
+    def close(self) -> None:
+        """Stop accepting connections, connected processes continue to be served until they disconnect."""
+        if self.__is_closed:
+            return
+        self.__is_closed = True
+        try:
+            # NOTE: wakes the accepting thread
+            multiprocessing.connection.Client(self.address).close()
+        except OSError:
+            pass
+        self.__thread.join(5.0)
+        self.__listener.close()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for connected processes to disconnect, such that all records they sent have been put into the Log Queue.
+
+        :param timeout: The maximum number of seconds to wait, ``None`` to wait indefinitely, defaults to None.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for receiver in list(self.__receivers):
+            receiver.join(None if deadline is None else max(0, deadline - time.monotonic()))
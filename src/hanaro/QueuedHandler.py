@@ -2,7 +2,10 @@
 # SPDX-License-Identifier: MIT
 
 import logging
-import queue
+from typing import Optional
+
+from .RecordCodec import RecordCodec
+from .RecordQueue import RecordQueue
 
 
 class QueuedHandler(logging.Handler):
@@ -14,15 +17,52 @@ class QueuedHandler(logging.Handler):
     **QueuedHandler** solves concurrency problems by collecting Log Records to a thread-safe Log Queue, accessible from a single logging context (such as the main thread of an application) where it can be safely written in a way that preserves ordering and avoids multi-threaded clobbering of log output.
     """
 
-    __s_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+    __s_queue: RecordQueue = RecordQueue(name='hanaro.QueuedHandler')
+    __s_is_freezing: bool = False
 
     def emit(self, record: logging.LogRecord) -> None:
         """
-        Emit a Log Record via the Log Queue.
+        Emit a Log Record via the Log Queue, if freezing is enabled a frozen copy of the Log Record is queued instead (see :meth:``configure``.)
 
         :param record: The Log Record to emit.
         """
-        QueuedHandler.__s_queue.put(record)
+        try:
+            if QueuedHandler.__s_is_freezing:
+                record = RecordCodec.copy(record)
+            QueuedHandler.__s_queue.put(record)
+        except Exception:
+            self.handleError(record)
+
+    @staticmethod
+    def configure(
+        max_size: int = 0,
+        overflow: str = 'block',
+        timeout: Optional[float] = 1.0,
+        drop_level: int | str = logging.WARNING,
+        freeze: bool = False
+    ) -> None:
+        """
+        Configure the capacity and overflow policy of the Log Queue.
+
+        When *freeze* is enabled records are "frozen" by the emitting thread (see :class:``RecordCodec``): the message is interpolated, exception and stack info are rendered to text, and references to ``args``, tracebacks and frames are released, so that queued records are small and formatting is spread across emitting threads.
+
+        :param max_size: The capacity of the Log Queue, ``0`` for an unbounded queue, defaults to 0.
+        :param overflow: One of 'block', 'drop_newest', 'drop_oldest', or 'drop_below', defaults to 'block'.
+        :param timeout: For 'block' and 'drop_below' policies, the maximum number of seconds to wait for space, ``None`` to wait indefinitely, defaults to 1.0.
+        :param drop_level: For the 'drop_below' policy, records below this level are dropped when the Log Queue is full, defaults to WARNING.
+        :param freeze: Should records be frozen by the emitting thread before they are queued? Defaults to False.
+        """
+        QueuedHandler.__s_queue.configure(max_size, overflow, timeout, drop_level)
+        QueuedHandler.__s_is_freezing = freeze
+
+    @staticmethod
+    def get_queue() -> RecordQueue:
+        """
+        Get the Log Queue, for example to inspect its depth or drop counts.
+
+        :return: The :class:``RecordQueue`` shared by all *QueuedHandler* instances.
+        """
+        return QueuedHandler.__s_queue
 
     @staticmethod
     def get_log_record() -> logging.LogRecord | None:
@@ -31,11 +71,17 @@ class QueuedHandler(logging.Handler):
 
         :return: A Log Record, or None if no Log Record is available.
         """
-        try:
-            return QueuedHandler.__s_queue.get_nowait()
-        except Exception:
-            pass  # NOP
-        return None
+        return QueuedHandler.__s_queue.get()
+
+    @staticmethod
+    def get_log_records(max_records: Optional[int] = None) -> list[logging.LogRecord]:
+        """
+        Get many Log Records from the Log Queue with a single lock acquisition.
+
+        :param max_records: The maximum number of Log Records to get, ``None`` to get all queued Log Records, defaults to None.
+        :return: A list of Log Records, empty if no Log Record is available.
+        """
+        return QueuedHandler.__s_queue.get_many(max_records)
 
     getLogRecord = get_log_record  # noqa: N815
     """⚠️ DEPRECATED: Use ``get_log_rewcord(...)`` instead."""
@@ -0,0 +1,195 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+import random
+from typing import Any, Optional
+
+from .ConfigFilter import _ConfigFilterSettings
+
+
+_PER_KEYS: tuple[str, ...] = ('logger', 'site')
+
+# NOTE: the key of records suppressed once the number of keys with suppressed records reaches the cache size
+_OTHER_SOURCES: str = 'other sources'
+
+
+class _RateLimitSettings(_ConfigFilterSettings):
+    """Represent the rate limiting settings of a :class:``RateLimitFilter`` rule."""
+
+    __slots__ = ['burst', 'per_site', 'rate', 'sample']
+    burst: float
+    per_site: bool
+    rate: Optional[float]
+    sample: Optional[float]
+
+    def __init__(self, source: str, settings: dict[str, Any]) -> None:
+        super().__init__(source, settings)
+        rate = settings.get('rate', None)
+        self.rate = None if rate is None else float(rate)
+        burst = settings.get('burst', None)
+        self.burst = float(burst) if burst is not None else max(1.0, self.rate or 0.0)
+        sample = settings.get('sample', None)
+        self.sample = None if sample is None else float(sample)
+        per = str(settings.get('per', 'logger')).lower()
+        if per not in _PER_KEYS:
+            raise ValueError(f'Unsupported rate limit "per" value "{per}", expected one of: {", ".join(_PER_KEYS)}')
+        self.per_site = per == 'site'
+
+
+# NOTE: records are limited per logger name, or per call site (name, pathname, lineno)
+_Key = str | tuple[str, str, int]
+
+# NOTE: cached for logger names which no rule matches, distinct from a cache miss (`None`)
+_UNLIMITED: Any = object()
+
+
+class _RateLimitState:
+    """Represent the rules of a :class:``RateLimitFilter`` paired with the rule matched by each logger name, the token buckets of those rules, and the counts of suppressed records."""
+
+    __slots__ = ['buckets', 'cache', 'settings', 'suppressed']
+    buckets: dict[_Key, list[float]]
+    cache: dict[str, Any]
+    settings: list[_RateLimitSettings]
+    suppressed: dict[_Key, int]
+
+    def __init__(self, settings: list[_RateLimitSettings]) -> None:
+        self.buckets = {}
+        self.cache = {}
+        self.settings = settings
+        self.suppressed = {}
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Rate limit and sample logging output via configuration.
+
+    Records matched by a rule are sampled (``DEBUG`` and ``INFO`` records only) and then pass through a token bucket, per logger or per call site. The rule matched by each logger name is cached, so the decision for a record costs a few lookups and some arithmetic, regardless of the number of rules. The decision is cached on the record (as ``_hanaro_sampled``), so handlers sharing the filter make one decision per record.
+
+    The number of suppressed records is summarized (as ``suppressed N records from X``) every *summary_interval*, when the next record (of any logger) is filtered.
+    """
+
+    DEFAULT_CACHE_SIZE: int = 4096
+    """The default maximum number of logger names with a cached rule, and of token buckets."""
+
+    def __init__(
+        self,
+        name: str = '',
+        config: Optional[dict[str, dict[str, Any]]] = None,
+        summary_interval: float = 10.0,
+        cache_size: int = DEFAULT_CACHE_SIZE
+    ) -> None:
+        """
+        Initialize *RateLimitFilter*.
+
+        :param name: A name for identifying the filter, defaults to ''.
+        :param config: Filter configuration settings (the same settings as :class:``ConfigFilter``), only rules with a ``rate`` or a ``sample`` are applied, defaults to {}.
+        :param summary_interval: The minimum number of seconds between summaries of suppressed records, defaults to 10.0.
+        :param cache_size: The maximum number of logger names with a cached rule, and of token buckets, defaults to ``DEFAULT_CACHE_SIZE``.
+        """
+        self.__cache_size = max(1, cache_size)
+        self.__summary_interval = summary_interval
+        self.__next_summary = 0.0
+        self.__state = _RateLimitState([])
+        self.__random = random.random
+        self.__logger = logging.getLogger(__name__)
+        super().__init__(name)
+        self.configure(config)
+
+    def configure(self, config: Optional[dict[str, dict[str, Any]]] = None, summary_interval: Optional[float] = None) -> None:
+        """
+        Replace the filter configuration settings, resetting token buckets and cached rules.
+
+        The new settings take effect atomically, records being filtered concurrently observe either the old or the new settings (never a mix of both.) Records suppressed under the old settings are summarized.
+
+        :param config: Filter configuration settings, defaults to {}.
+        :param summary_interval: The minimum number of seconds between summaries of suppressed records, defaults to the current interval.
+        """
+        if config is None:
+            config = {}
+        if summary_interval is not None:
+            self.__summary_interval = summary_interval
+            self.__next_summary = 0.0
+        previous = self.__state
+        self.__state = _RateLimitState([
+            _RateLimitSettings(k, v)
+            for k, v in config.items()
+            if v.get('rate', None) is not None or v.get('sample', None) is not None
+        ])
+        self.__summarize(previous)
+
+    def summarize(self) -> None:
+        """Log a summary of the records suppressed since the last summary, such as before shutdown."""
+        self.__summarize(self.__state)
+
+    def __summarize(self, state: _RateLimitState) -> None:
+        # NOTE: swapped rather than cleared, records suppressed concurrently are counted by the next summary
+        suppressed = state.suppressed
+        if len(suppressed) == 0:
+            return
+        state.suppressed = {}
+        for key, count in suppressed.items():
+            source = key if type(key) is str else f'{key[0]} ({key[1]}:{key[2]})'
+            # NOTE: summaries are never rate limited themselves
+            self.__logger.warning('suppressed %d records from %s', count, source, extra={'_hanaro_sampled': True})
+
+    def __get_rule(self, state: _RateLimitState, name: str) -> Any:
+        rule = _UNLIMITED
+        for e in state.settings:
+            if e.matches(name):
+                rule = e
+                break
+        if len(state.cache) >= self.__cache_size:
+            state.cache.clear()
+        state.cache[name] = rule
+        return rule
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        attributes = record.__dict__
+        decision = attributes.get('_hanaro_sampled', None)
+        if decision is not None:
+            return bool(decision)
+        state = self.__state
+        if len(state.settings) == 0:
+            return True
+        created = record.created
+        # NOTE: checked before the rule is matched, records of any logger summarize (including once limited traffic stops)
+        if created >= self.__next_summary:
+            self.__next_summary = created + self.__summary_interval
+            self.__summarize(state)
+        name = record.name
+        rule = state.cache.get(name, None)
+        if rule is None:
+            rule = self.__get_rule(state, name)
+        if rule is _UNLIMITED:
+            return True
+        key: _Key = (name, record.pathname, record.lineno) if rule.per_site else name
+        decision = True
+        if rule.sample is not None and record.levelno < logging.WARNING and self.__random() >= rule.sample:
+            decision = False
+        elif rule.rate is not None:
+            buckets = state.buckets
+            bucket = buckets.get(key, None)
+            if bucket is None:
+                if len(buckets) >= self.__cache_size:
+                    buckets.clear()
+                bucket = [rule.burst, created]
+                buckets[key] = bucket
+            else:
+                elapsed = created - bucket[1]
+                if elapsed > 0:
+                    # NOTE: refilled from the timestamps of records, rather than by reading a clock
+                    tokens = bucket[0] + elapsed * rule.rate
+                    bucket[0] = tokens if tokens < rule.burst else rule.burst
+                    bucket[1] = created
+            if bucket[0] >= 1.0:
+                bucket[0] -= 1.0
+            else:
+                decision = False
+        if not decision:
+            suppressed = state.suppressed
+            if key not in suppressed and len(suppressed) >= self.__cache_size:
+                key = _OTHER_SOURCES
+            suppressed[key] = suppressed.get(key, 0) + 1
+        attributes['_hanaro_sampled'] = decision
+        return decision
@@ -0,0 +1,171 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+import marshal
+import operator
+from typing import Any
+
+
+# NOTE: `_formatted` is the output cache of `CompiledFormatter`, like `asctime` and `message` it is an artifact of formatting
+_STANDARD_ATTRIBUTES: frozenset[str] = frozenset([
+    '_formatted', 'args', 'asctime', 'created', 'exc_info', 'exc_text', 'filename', 'funcName',
+    'levelname', 'levelno', 'lineno', 'message', 'module', 'msecs', 'msg', 'name',
+    'pathname', 'process', 'processName', 'relativeCreated', 'stack_info', 'thread',
+    'threadName'
+])
+
+_PRIMITIVE_TYPES: frozenset[type] = frozenset([str, int, float, bool, type(None)])
+
+_get_attributes = operator.itemgetter(
+    'name', 'levelno', 'levelname',
+    'pathname', 'filename', 'module', 'lineno', 'funcName',
+    'created', 'msecs', 'relativeCreated',
+    'thread', 'threadName', 'processName', 'process')
+
+_formatter = logging.Formatter()
+
+
+def _freeze_value(key: str, value: Any) -> Any:
+    """Freeze an attribute which is not a primitive, the (structured) metadata fields injected by :class:``ContextInjectionFilter`` are kept as dicts of ``str``."""
+    if key == '_metadata_fields' and type(value) is dict:
+        return {
+            str(name): {str(k): str(v) for k, v in fields.items()}
+            for name, fields in value.items()
+        }
+    return str(value)
+
+
+class RecordCodec:
+    """
+    Serializes Log Records into a compact form suitable for moving them between processes.
+
+    A record is "frozen" into a tuple of primitives: the message is interpolated, exception info is rendered to text, and any other attributes (such as injected context) are kept only if they are primitives (otherwise they are converted to ``str``, except for structured metadata fields which are kept as dicts of ``str``.) Tracebacks, frames, and ``args`` are never serialized, so encoding never pickles arbitrary objects.
+    """
+
+    @staticmethod
+    def freeze(record: logging.LogRecord) -> tuple[Any, ...]:
+        """
+        Freeze *record* into a tuple of primitives.
+
+        :param record: The Log Record to freeze.
+        :return: A tuple which can be thawed via :meth:``thaw``.
+        """
+        attributes = record.__dict__
+        exc_text = record.exc_text
+        if exc_text is None and record.exc_info is not None and record.exc_info[0] is not None:
+            exc_text = _formatter.formatException(record.exc_info)
+        extras = (
+            {}
+            if attributes.keys() <= _STANDARD_ATTRIBUTES
+            else {
+                k: (v if type(v) in _PRIMITIVE_TYPES else _freeze_value(k, v))
+                for k, v in attributes.items()
+                if k not in _STANDARD_ATTRIBUTES
+            }
+        )
+        return (
+            *_get_attributes(attributes),
+            record.getMessage(), exc_text, record.stack_info,
+            extras
+        )
+
+    @staticmethod
+    def thaw(frozen: tuple[Any, ...]) -> logging.LogRecord:
+        """
+        Thaw a tuple created by :meth:``freeze`` into a Log Record.
+
+        :param frozen: The tuple to thaw.
+        :return: A Log Record with the message already interpolated (``args`` is empty.)
+        """
+        (
+            name, levelno, levelname,
+            pathname, filename, module, lineno, func_name,
+            created, msecs, relative_created,
+            thread, thread_name, process_name, process,
+            message, exc_text, stack_info,
+            extras
+        ) = frozen
+        # NOTE: bypasses `LogRecord.__init__`, all attributes are already known
+        record = logging.LogRecord.__new__(logging.LogRecord)
+        attributes = record.__dict__
+        attributes.update(extras)
+        attributes.update({
+            'name': name, 'msg': message, 'args': (),
+            'levelname': levelname, 'levelno': levelno,
+            'pathname': pathname, 'filename': filename, 'module': module,
+            'exc_info': None, 'exc_text': exc_text, 'stack_info': stack_info,
+            'lineno': lineno, 'funcName': func_name,
+            'created': created, 'msecs': msecs, 'relativeCreated': relative_created,
+            'thread': thread, 'threadName': thread_name,
+            'processName': process_name, 'process': process
+        })
+        return record
+
+    @staticmethod
+    def copy(record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Create a frozen copy of *record*, equivalent to ``thaw(freeze(record))`` without an intermediate tuple.
+
+        :param record: The Log Record to copy.
+        :return: A Log Record with the message already interpolated (``args`` is empty), holding no references to ``args``, tracebacks or frames.
+        """
+        attributes = record.__dict__
+        exc_text = record.exc_text
+        if exc_text is None and record.exc_info is not None and record.exc_info[0] is not None:
+            exc_text = _formatter.formatException(record.exc_info)
+        copy = logging.LogRecord.__new__(logging.LogRecord)
+        copy.__dict__ = {
+            **(
+                attributes
+                if attributes.keys() <= _STANDARD_ATTRIBUTES
+                else {
+                    k: (v if k in _STANDARD_ATTRIBUTES or type(v) in _PRIMITIVE_TYPES else _freeze_value(k, v))
+                    for k, v in attributes.items()
+                }
+            ),
+            'msg': record.getMessage(), 'args': (), 'exc_info': None, 'exc_text': exc_text
+        }
+        copy.__dict__.pop('_formatted', None)
+        return copy
+
+    @staticmethod
+    def encode(record: logging.LogRecord) -> bytes:
+        """
+        Encode *record* into bytes.
+
+        :param record: The Log Record to encode.
+        :return: The encoded record.
+        """
+        return marshal.dumps(RecordCodec.freeze(record))
+
+    @staticmethod
+    def decode(data: bytes | memoryview) -> logging.LogRecord:
+        """
+        Decode a Log Record from bytes created by :meth:``encode``.
+
+        :param data: The encoded record.
+        :return: The decoded Log Record.
+        """
+        return RecordCodec.thaw(marshal.loads(data))
+
+    @staticmethod
+    def encode_many(frozen: list[tuple[Any, ...]]) -> bytes:
+        """
+        Encode many frozen records into bytes, as a single batch.
+
+        :param frozen: A list of tuples created by :meth:``freeze``.
+        :return: The encoded batch.
+        """
+        return marshal.dumps(frozen)
+
+    @staticmethod
+    def decode_many(data: bytes | memoryview) -> list[logging.LogRecord]:
+        """
+        Decode a batch of Log Records from bytes created by :meth:``encode_many``.
+
+        :param data: The encoded batch.
+        :return: A list of decoded Log Records.
+        """
+        thaw = RecordCodec.thaw
+        return [thaw(e) for e in marshal.loads(data)]
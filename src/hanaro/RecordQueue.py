@@ -0,0 +1,250 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import collections
+import logging
+import threading
+from typing import Callable, Optional
+
+
+def _create_dropped_record(name: str, drops: dict[str, int]) -> logging.LogRecord:
+    """Create a synthetic "N records dropped" Log Record, summarizing *drops* (a count per overflow policy.)"""
+    count = sum(drops.values())
+    details = ', '.join(f'{k}={v}' for k, v in drops.items())
+    return logging.LogRecord(
+        name, logging.WARNING, __file__, 0,
+        '%d records dropped (%s)', (count, details),
+        None, 'get')
+
+
+class RecordQueue:
+    """
+    A thread-safe queue of Log Records with an optional capacity and a configurable overflow policy.
+
+    When the queue is full, the overflow policy determines what happens to new records:
+
+    * ``block`` waits (up to *timeout* seconds) for space to become available, dropping the new record on timeout.
+    * ``drop_newest`` drops the new record.
+    * ``drop_oldest`` drops the oldest queued record to make space for the new record.
+    * ``drop_below`` drops the new record if its level is below *drop_level*, otherwise behaves like ``block``.
+
+    Dropped records are counted per policy, and once the pressure clears (the queue drains to half its capacity) a synthetic "N records dropped" record is queued.
+    """
+
+    OVERFLOW_POLICIES: tuple[str, ...] = ('block', 'drop_newest', 'drop_oldest', 'drop_below')
+    """The supported overflow policies."""
+
+    def __init__(
+        self,
+        max_size: int = 0,
+        overflow: str = 'block',
+        timeout: Optional[float] = 1.0,
+        drop_level: int | str = logging.WARNING,
+        name: str = 'hanaro.RecordQueue'
+    ) -> None:
+        """
+        Initialize *RecordQueue*.
+
+        :param max_size: The capacity of the queue, ``0`` for an unbounded queue, defaults to 0.
+        :param overflow: The overflow policy applied when the queue is full, defaults to 'block'.
+        :param timeout: For ``block`` and ``drop_below`` policies, the maximum number of seconds to wait for space, ``None`` to wait indefinitely, defaults to 1.0.
+        :param drop_level: For the ``drop_below`` policy, records below this level are dropped when the queue is full, defaults to WARNING.
+        :param name: The logger name used for synthetic "records dropped" records, defaults to 'hanaro.RecordQueue'.
+        """
+        self.__records = collections.deque[logging.LogRecord]()
+        self.__mutex = threading.Lock()
+        self.__not_empty = threading.Condition(self.__mutex)
+        self.__not_full = threading.Condition(self.__mutex)
+        self.__drop_counts = dict[str, int]()
+        self.__pending_drops = dict[str, int]()
+        self.__is_woken = False
+        self.__wakers: tuple[Callable[[], None], ...] = ()
+        self.__name = name
+        self.__max_size = 0
+        self.__overflow = 'block'
+        self.__timeout: Optional[float] = None
+        self.__drop_level = logging.WARNING
+        self.configure(max_size, overflow, timeout, drop_level)
+
+    def configure(
+        self,
+        max_size: int = 0,
+        overflow: str = 'block',
+        timeout: Optional[float] = 1.0,
+        drop_level: int | str = logging.WARNING
+    ) -> None:
+        """
+        Reconfigure the capacity and overflow policy of the queue, records already queued are retained.
+
+        :param max_size: The capacity of the queue, ``0`` for an unbounded queue, defaults to 0.
+        :param overflow: The overflow policy applied when the queue is full, defaults to 'block'.
+        :param timeout: For ``block`` and ``drop_below`` policies, the maximum number of seconds to wait for space, ``None`` to wait indefinitely, defaults to 1.0.
+        :param drop_level: For the ``drop_below`` policy, records below this level are dropped when the queue is full, defaults to WARNING.
+        """
+        overflow = overflow.lower()
+        if overflow not in RecordQueue.OVERFLOW_POLICIES:
+            raise ValueError(f'Unsupported overflow policy "{overflow}", expected one of: {", ".join(RecordQueue.OVERFLOW_POLICIES)}')
+        with self.__mutex:
+            self.__max_size = max(0, int(max_size))
+            self.__overflow = overflow
+            self.__timeout = None if timeout is None else float(timeout)
+            self.__drop_level = (
+                drop_level
+                if isinstance(drop_level, int)
+                else int(getattr(logging, drop_level.upper()))
+            )
+            self.__not_full.notify_all()
+
+    @property
+    def drop_counts(self) -> dict[str, int]:
+        """The number of records dropped since the queue was created, per overflow policy."""
+        with self.__mutex:
+            return dict(self.__drop_counts)
+
+    @property
+    def max_size(self) -> int:
+        """The capacity of the queue, ``0`` for an unbounded queue."""
+        return self.__max_size
+
+    @property
+    def overflow(self) -> str:
+        """The overflow policy applied when the queue is full."""
+        return self.__overflow
+
+    def _at_fork_reinit(self) -> None:
+        """Reinitialize the queue in a forked child process, discarding records (and wakers) which belong to the parent process."""
+        self.__records.clear()
+        self.__mutex = threading.Lock()
+        self.__not_empty = threading.Condition(self.__mutex)
+        self.__not_full = threading.Condition(self.__mutex)
+        self.__pending_drops.clear()
+        self.__is_woken = False
+        self.__wakers = ()
+
+    def qsize(self) -> int:
+        """Get the number of queued records."""
+        return len(self.__records)
+
+    def __drop(self, policy: str) -> None:
+        self.__drop_counts[policy] = self.__drop_counts.get(policy, 0) + 1
+        self.__pending_drops[policy] = self.__pending_drops.get(policy, 0) + 1
+
+    def __create_dropped_record(self) -> logging.LogRecord:
+        record = _create_dropped_record(self.__name, self.__pending_drops)
+        self.__pending_drops.clear()
+        return record
+
+    def put(self, record: logging.LogRecord) -> bool:
+        """
+        Put *record* into the queue, applying the overflow policy if the queue is full.
+
+        :param record: The Log Record to put into the queue.
+        :return: ``True`` if *record* was queued, ``False`` if it was dropped.
+        """
+        records = self.__records
+        with self.__mutex:
+            is_empty = len(records) == 0
+            max_size = self.__max_size
+            if max_size > 0 and len(records) >= max_size:
+                overflow = self.__overflow
+                if overflow == 'drop_newest' or (overflow == 'drop_below' and record.levelno < self.__drop_level):
+                    self.__drop(overflow)
+                    return False
+                elif overflow == 'drop_oldest':
+                    while len(records) >= max_size:
+                        records.popleft()
+                        self.__drop(overflow)
+                elif not self.__not_full.wait_for(lambda: self.__max_size <= 0 or len(records) < self.__max_size, self.__timeout):
+                    self.__drop('block')
+                    return False
+            records.append(record)
+            self.__not_empty.notify()
+        if is_empty and len(self.__wakers) > 0:
+            for waker in self.__wakers:
+                waker()
+        return True
+
+    def add_waker(self, waker: Callable[[], None]) -> None:
+        """
+        Add a *waker* callback, called by the producing thread whenever a record is put into an empty queue.
+
+        :param waker: A callback which must not block, such as one which schedules a drain via ``loop.call_soon_threadsafe(...)``.
+        """
+        with self.__mutex:
+            self.__wakers = (*self.__wakers, waker)
+
+    def remove_waker(self, waker: Callable[[], None]) -> None:
+        """
+        Remove a *waker* callback previously added via :meth:``add_waker``.
+
+        :param waker: The callback to remove.
+        """
+        with self.__mutex:
+            self.__wakers = tuple(e for e in self.__wakers if e is not waker)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the queue is not empty, :meth:``wake`` is called, or *timeout* expires.
+
+        :param timeout: The maximum number of seconds to wait, ``None`` to wait indefinitely, defaults to None.
+        :return: ``True`` if the queue is not empty, otherwise ``False``.
+        """
+        records = self.__records
+        with self.__mutex:
+            if len(records) == 0 and len(self.__pending_drops) == 0 and not self.__is_woken:
+                self.__not_empty.wait(timeout)
+            self.__is_woken = False
+            return len(records) > 0 or len(self.__pending_drops) > 0
+
+    def wake(self) -> None:
+        """Wake all threads blocked in :meth:``wait``, or the next thread to call :meth:``wait`` if none are blocked."""
+        with self.__mutex:
+            self.__is_woken = True
+            self.__not_empty.notify_all()
+
+    def get(self) -> logging.LogRecord | None:
+        """
+        Get a record from the queue, without blocking.
+
+        :return: A Log Record, or ``None`` if the queue is empty.
+        """
+        records = self.__records
+        if len(records) == 0 and len(self.__pending_drops) == 0:
+            return None
+        with self.__mutex:
+            if len(records) == 0:
+                if len(self.__pending_drops) == 0:
+                    return None
+                return self.__create_dropped_record()
+            record = records.popleft()
+            max_size = self.__max_size
+            if max_size > 0:
+                self.__not_full.notify()
+                if len(self.__pending_drops) > 0 and len(records) <= max_size // 2:
+                    records.appendleft(self.__create_dropped_record())
+            return record
+
+    def get_many(self, max_records: Optional[int] = None) -> list[logging.LogRecord]:
+        """
+        Get many records from the queue with a single lock acquisition, without blocking.
+
+        :param max_records: The maximum number of records to get, ``None`` to get all queued records, defaults to None.
+        :return: A list of Log Records, empty if the queue is empty.
+        """
+        records = self.__records
+        if len(records) == 0 and len(self.__pending_drops) == 0:
+            return []
+        with self.__mutex:
+            count = len(records) if max_records is None else min(max_records, len(records))
+            popleft = records.popleft
+            batch = [popleft() for _ in range(0, count)]
+            max_size = self.__max_size
+            if max_size > 0 and count > 0:
+                self.__not_full.notify(count)
+            if (
+                len(self.__pending_drops) > 0
+                and len(records) <= max_size // 2
+                and (max_records is None or count < max_records)
+            ):
+                batch.append(self.__create_dropped_record())
+            return batch
@@ -0,0 +1,155 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+import marshal
+import multiprocessing.connection
+import os
+import time
+from typing import Any, Optional
+
+from .ProcessHandler import _LockFreeHandler, _finalize_at_exit
+from .RecordCodec import RecordCodec
+from .RecordQueue import RecordQueue, _create_dropped_record
+from .SharedMemoryRing import SharedMemoryRing
+
+
+_WAKE: bytes = marshal.dumps(None)
+
+
+class SharedMemoryHandler(_LockFreeHandler):
+    """
+    Forwards Log Records to an aggregating process (see :class:``ProcessListener``) via a :class:``SharedMemoryRing``, for the highest-volume processes.
+
+    Records are encoded by the emitting thread and copied into the ring, there is no per-record system call. The connection to the aggregating process is only used to announce the ring, and to wake the aggregating process when it is waiting for records.
+
+    When the ring is full the overflow policies of :class:``RecordQueue`` apply, except that ``drop_oldest`` behaves like ``drop_newest`` (records already in the ring belong to the consumer.)
+    """
+
+    def __init__(
+        self,
+        address: Any,
+        size: int = 4 * 1024 * 1024,
+        overflow: str = 'block',
+        timeout: Optional[float] = 1.0,
+        drop_level: int | str = logging.WARNING
+    ) -> None:
+        """
+        Initialize *SharedMemoryHandler*.
+
+        :param address: The address of the :class:``ProcessListener`` to forward records to.
+        :param size: The size of the ring in bytes, defaults to 4MiB.
+        :param overflow: The overflow policy applied when the ring is full, defaults to 'block'.
+        :param timeout: For ``block`` and ``drop_below`` policies, the maximum number of seconds to wait for space, ``None`` to wait indefinitely, defaults to 1.0.
+        :param drop_level: For the ``drop_below`` policy, records below this level are dropped when the ring is full, defaults to WARNING.
+        """
+        overflow = overflow.lower()
+        if overflow not in RecordQueue.OVERFLOW_POLICIES:
+            raise ValueError(f'Unsupported overflow policy "{overflow}", expected one of: {", ".join(RecordQueue.OVERFLOW_POLICIES)}')
+        super().__init__()
+        self.__address = address
+        self.__size = size
+        self.__overflow = overflow
+        self.__timeout = timeout
+        self.__drop_level = (
+            drop_level
+            if isinstance(drop_level, int)
+            else int(getattr(logging, drop_level.upper()))
+        )
+        self.__drop_counts = dict[str, int]()
+        self.__pending_drops = dict[str, int]()
+        self.__pid = 0
+        self.__is_closed = False
+        self.__ring: Optional[SharedMemoryRing] = None
+        self.__connection: Optional[multiprocessing.connection.Connection] = None
+        self.__finalizer = _finalize_at_exit(self)
+
+    @property
+    def drop_counts(self) -> dict[str, int]:
+        """The number of records dropped since the handler was created, per overflow policy (or ``disconnected``.)"""
+        return dict(self.__drop_counts)
+
+    def __drop(self, policy: str) -> None:
+        self.__drop_counts[policy] = self.__drop_counts.get(policy, 0) + 1
+        self.__pending_drops[policy] = self.__pending_drops.get(policy, 0) + 1
+
+    def __connect(self) -> None:
+        # NOTE: state inherited from a parent process belongs to the parent process
+        self.__pid = os.getpid()
+        self.__ring = None
+        self.__connection = None
+        ring = SharedMemoryRing(None, self.__size)
+        try:
+            connection = multiprocessing.connection.Client(self.__address)
+            connection.send_bytes(marshal.dumps(ring.name))
+        except OSError:
+            ring.close()
+            ring.unlink()
+            return
+        self.__ring = ring
+        self.__connection = connection
+
+    def __wake(self) -> None:
+        connection = self.__connection
+        if connection is not None:
+            try:
+                connection.send_bytes(_WAKE)
+            except OSError:
+                self.__connection = None
+
+    def __write(self, ring: SharedMemoryRing, data: bytes, levelno: int) -> None:
+        if ring.write(data):
+            return
+        overflow = self.__overflow
+        if overflow == 'drop_newest' or overflow == 'drop_oldest' or (overflow == 'drop_below' and levelno < self.__drop_level):
+            self.__drop('drop_newest' if overflow == 'drop_oldest' else overflow)
+            return
+        timeout = self.__timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self.__wake()
+        while not ring.write(data):
+            if self.__connection is None or (deadline is not None and time.monotonic() >= deadline):
+                self.__drop('block')
+                return
+            time.sleep(0.001)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Encode *record* and write it into the ring.
+
+        :param record: The Log Record to emit.
+        """
+        try:
+            data = RecordCodec.encode(record)
+        except Exception:
+            self.handleError(record)
+            return
+        with self.lock:  # type: ignore[union-attr]
+            if self.__pid != os.getpid() and not self.__is_closed:
+                self.__connect()
+            ring = self.__ring
+            if ring is None or self.__connection is None:
+                self.__drop('disconnected')
+                return
+            if len(self.__pending_drops) > 0 and ring.usage() <= ring.capacity // 2:
+                if ring.write(RecordCodec.encode(_create_dropped_record('hanaro.SharedMemoryHandler', self.__pending_drops))):
+                    self.__pending_drops.clear()
+            self.__write(ring, data, record.levelno)
+            if ring.is_waiting():
+                self.__wake()
+
+    def close(self) -> None:
+        """Close the connection to the aggregating process, which then reads any records remaining in the ring."""
+        self.__finalizer.cancel()
+        with self.lock:  # type: ignore[union-attr]
+            if self.__pid == os.getpid():
+                connection = self.__connection
+                ring = self.__ring
+                self.__connection = None
+                self.__ring = None
+                if connection is not None:
+                    connection.close()
+                if ring is not None:
+                    ring.close()
+            self.__is_closed = True
+        super().close()
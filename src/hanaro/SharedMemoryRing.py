@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+import marshal
+import multiprocessing.resource_tracker
+import multiprocessing.shared_memory
+import os
+import struct
+from typing import Optional, cast
+
+from .RecordCodec import RecordCodec
+
+
+_HEADER_SIZE: int = 64
+_HEAD_OFFSET: int = 0
+_TAIL_OFFSET: int = 8
+_WAITING_OFFSET: int = 16
+_WRAP_MARKER: int = 0xFFFFFFFF
+
+_counter = struct.Struct('<Q')
+_length = struct.Struct('<I')
+
+
+class SharedMemoryRing:
+    """
+    A fixed-size, single-producer single-consumer ring buffer of encoded Log Records, in shared memory.
+
+    The producer appends length-prefixed records (see :class:``RecordCodec``) and the consumer decodes them in place (via ``memoryview``, without copying.) A record which does not fit before the end of the ring is written at the start of the ring, the remaining space is skipped.
+
+    The header holds the consumer position ("head"), the producer position ("tail"), and a "waiting" flag set by a consumer which is about to block, so that the producer only wakes the consumer when necessary.
+    """
+
+    def __init__(self, name: Optional[str] = None, size: int = 0) -> None:
+        """
+        Initialize *SharedMemoryRing*, creating a new ring or attaching to an existing ring.
+
+        :param name: The name of an existing ring to attach to, defaults to None (create a new ring.)
+        :param size: For a new ring, the size of the ring in bytes (including a small header), defaults to 0.
+        """
+        is_created = name is None
+        self.__memory = multiprocessing.shared_memory.SharedMemory(name, is_created, size)
+        self.__is_untracked = is_created and os.name == 'posix'
+        if self.__is_untracked:
+            # NOTE: the ring is unlinked by the consumer once attached, the producer must not unlink it at exit
+            multiprocessing.resource_tracker.unregister(self.__memory._name, 'shared_memory')  # type: ignore[attr-defined]
+        self.__buffer = cast(memoryview, self.__memory.buf)
+        self.__capacity = self.__memory.size - _HEADER_SIZE
+        if is_created:
+            self.__buffer[0:_HEADER_SIZE] = bytes(_HEADER_SIZE)
+        self.__head: int = _counter.unpack_from(self.__buffer, _HEAD_OFFSET)[0]
+        self.__tail: int = _counter.unpack_from(self.__buffer, _TAIL_OFFSET)[0]
+
+    @property
+    def capacity(self) -> int:
+        """The number of bytes available for records."""
+        return self.__capacity
+
+    @property
+    def name(self) -> str:
+        """The name of the ring, used to attach to it from another process."""
+        return self.__memory.name
+
+    def usage(self) -> int:
+        """Get the number of bytes currently used by records."""
+        buffer = self.__buffer
+        return _counter.unpack_from(buffer, _TAIL_OFFSET)[0] - _counter.unpack_from(buffer, _HEAD_OFFSET)[0]
+
+    def write(self, data: bytes) -> bool:
+        """
+        Append an encoded record, without blocking. Only a single producer may write to the ring.
+
+        :param data: The encoded record.
+        :return: ``True`` if *data* was written, ``False`` if there is not enough space.
+        """
+        buffer = self.__buffer
+        capacity = self.__capacity
+        size = _length.size + len(data)
+        tail = self.__tail
+        index = tail % capacity
+        remaining = capacity - index
+        required = size if size <= remaining else remaining + size
+        if tail + required - self.__head > capacity:
+            # NOTE: the consumer position is only re-read when the ring appears to be full
+            self.__head = _counter.unpack_from(buffer, _HEAD_OFFSET)[0]
+            if tail + required - self.__head > capacity:
+                return False
+        if size > remaining:
+            if remaining >= _length.size:
+                _length.pack_into(buffer, _HEADER_SIZE + index, _WRAP_MARKER)
+            index = 0
+        offset = _HEADER_SIZE + index
+        _length.pack_into(buffer, offset, len(data))
+        buffer[offset + _length.size:offset + size] = data
+        # NOTE: the tail is published last, so the consumer never observes a partially written record
+        tail += required
+        self.__tail = tail
+        _counter.pack_into(buffer, _TAIL_OFFSET, tail)
+        return True
+
+    def get_many(self, max_records: Optional[int] = None) -> list[logging.LogRecord]:
+        """
+        Decode many records from the ring. Only a single consumer may read from the ring.
+
+        :param max_records: The maximum number of records to get, ``None`` to get all records, defaults to None.
+        :return: A list of Log Records, empty if the ring is empty.
+        """
+        buffer = self.__buffer
+        capacity = self.__capacity
+        head = _counter.unpack_from(buffer, _HEAD_OFFSET)[0]
+        tail = _counter.unpack_from(buffer, _TAIL_OFFSET)[0]
+        thaw = RecordCodec.thaw
+        loads = marshal.loads
+        unpack_length = _length.unpack_from
+        length_size = _length.size
+        records = list[logging.LogRecord]()
+        append = records.append
+        count = 0
+        while head < tail and (max_records is None or count < max_records):
+            index = head % capacity
+            remaining = capacity - index
+            if remaining < length_size:
+                head += remaining
+                continue
+            offset = _HEADER_SIZE + index
+            length = unpack_length(buffer, offset)[0]
+            if length == _WRAP_MARKER:
+                head += remaining
+                continue
+            start = offset + length_size
+            append(thaw(loads(buffer[start:start + length])))
+            head += length_size + length
+            count += 1
+        # NOTE: space is released only after records are decoded, the producer cannot overwrite a record being read
+        _counter.pack_into(buffer, _HEAD_OFFSET, head)
+        return records
+
+    def prepare_wait(self) -> bool:
+        """
+        Set the "waiting" flag, called by the consumer before it blocks.
+
+        :return: ``True`` if the ring is (still) empty and the consumer may block, otherwise ``False`` (the flag is cleared.)
+        """
+        buffer = self.__buffer
+        buffer[_WAITING_OFFSET] = 1
+        if self.usage() == 0:
+            return True
+        buffer[_WAITING_OFFSET] = 0
+        return False
+
+    def is_waiting(self) -> bool:
+        """
+        Determine if the consumer is waiting to be woken, clearing the "waiting" flag. Called by the producer after writing.
+
+        :return: ``True`` if the producer should wake the consumer.
+        """
+        buffer = self.__buffer
+        if buffer[_WAITING_OFFSET] == 0:
+            return False
+        buffer[_WAITING_OFFSET] = 0
+        return True
+
+    def unlink(self) -> None:
+        """Remove the name of the ring, processes already attached to the ring are unaffected."""
+        if self.__is_untracked:
+            self.__is_untracked = False
+            multiprocessing.resource_tracker.register(self.__memory._name, 'shared_memory')  # type: ignore[attr-defined]
+        try:
+            self.__memory.unlink()
+        except FileNotFoundError:
+            pass
+
+    def close(self) -> None:
+        """Detach from the ring."""
+        self.__memory.close()
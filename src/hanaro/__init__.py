@@ -2,16 +2,35 @@
 # SPDX-FileCopyrightText: © 2025 Shaun Wilson
 # SPDX-License-Identifier: MIT
 
+from .BackgroundHandler import BackgroundHandler
+from .BinaryFileHandler import BinaryFileHandler
+from .BinaryRecordCodec import BinaryRecordCodec
+from .BufferedRotatingFileHandler import BufferedRotatingFileHandler
+from .CoalescingFilter import CoalescingFilter
 from .ConfigFilter import ConfigFilter
 from .ContextInjectionFilter import ContextInjectionFilter
+from .MmapFileHandler import MmapFileHandler
+from .ProcessHandler import ProcessHandler
+from .ProcessListener import ProcessListener
 from .QueuedHandler import QueuedHandler
+from .RateLimitFilter import RateLimitFilter
+from .RecordCodec import RecordCodec
+from .RecordQueue import RecordQueue
+from .SharedMemoryHandler import SharedMemoryHandler
+from .SharedMemoryRing import SharedMemoryRing
 from . import utils, formatters
 from .utils import (
     configure_logging,
+    drain_async,
     get_logger,
     get_queued_logger,
     handle_queued_log_records,
     patch_logging,
+    reconfigure,
+    start_async_drain,
+    start_config_watch,
+    stop_async_drain,
+    stop_config_watch,
     # deprecated exports (since 1.0.0)
     configureLogging,
     getLogger,
@@ -24,16 +43,35 @@ __version__ = '0.0.0'
 __commit__ = '0abc123'
 __all__ = [
     '__version__', '__commit__',
+    'BackgroundHandler',
+    'BinaryFileHandler',
+    'BinaryRecordCodec',
+    'BufferedRotatingFileHandler',
+    'CoalescingFilter',
     'ConfigFilter',
     'ContextInjectionFilter',
     'formatters',
+    'MmapFileHandler',
+    'ProcessHandler',
+    'ProcessListener',
     'QueuedHandler',
+    'RateLimitFilter',
+    'RecordCodec',
+    'RecordQueue',
+    'SharedMemoryHandler',
+    'SharedMemoryRing',
     'utils',
     'configure_logging',
+    'drain_async',
     'get_logger',
     'get_queued_logger',
     'handle_queued_log_records',
     'patch_logging',
+    'reconfigure',
+    'start_async_drain',
+    'start_config_watch',
+    'stop_async_drain',
+    'stop_config_watch',
     # deprecated exports (since 1.0.0)
     'configureLogging',
     'getLogger',
@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+"""
+Renders binary log files (see :class:``BinaryFileHandler``) as text, in the configured format.
+
+Usage: ``python -m hanaro.decode [--config appsettings.json] [--format FORMAT] [--datefmt DATEFMT] [--formatter default|compiled|json] FILE [FILE ...]``
+"""
+
+import argparse
+import logging
+import os
+import re
+import sys
+from typing import Optional
+
+import appsettings2
+
+from .BinaryFileHandler import BinaryFileHandler
+from .utils import _create_formatter, _load_configuration
+
+
+_ROTATION_SUFFIX: re.Pattern[str] = re.compile(r'\.\d+$')
+
+
+def _resolve_format(configuration: Optional[appsettings2.Configuration], filename: str) -> tuple[str, Optional[str], Optional[str]]:
+    """Resolve the formatter, format and datefmt of the handler which wrote *filename*, defaulting to those of ``logging``."""
+    if configuration is None:
+        return ('default', logging.BASIC_FORMAT, '%Y-%m-%dT%H:%M:%S')
+    formatter = str(configuration.get('logging__formatter', 'default')).lower()
+    fmt = configuration.get('logging__format', logging.BASIC_FORMAT)
+    datefmt = configuration.get('logging__datefmt', '%Y-%m-%dT%H:%M:%S')
+    # NOTE: rotated log files (`app.log.1`, etc.) were written by the handler of `app.log`
+    name = _ROTATION_SUFFIX.sub('', os.path.basename(filename))
+    for handler_config in configuration.get('logging__handlers') or []:
+        if str(handler_config.get('type')).lower() == 'file' and handler_config.get('name') == name:
+            fmt = handler_config.get('format', fmt)
+            break
+    # NOTE: `binary` is how the log file was written, it is rendered by the default formatter
+    return ('default' if formatter == 'binary' else formatter, fmt, datefmt)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Render binary log files as text, to ``stdout``.
+
+    :param argv: The command-line arguments, defaults to ``sys.argv[1:]``.
+    :return: The exit code.
+    """
+    parser = argparse.ArgumentParser(prog='python -m hanaro.decode', description='Render binary log files as text, in the configured format.')
+    parser.add_argument('files', nargs='+', metavar='FILE', help='binary log files, rendered in the order given (such as "app.log.2 app.log.1 app.log")')
+    parser.add_argument('-c', '--config', help='the appsettings file (json, toml or yaml) the log files were configured by, which provides the format')
+    parser.add_argument('-f', '--format', help='the format of rendered records, overrides the configured format')
+    parser.add_argument('-d', '--datefmt', help='the format of rendered timestamps, overrides the configured datefmt')
+    parser.add_argument('--formatter', help='the formatter of rendered records (default, compiled or json), overrides the configured formatter')
+    args = parser.parse_args(argv)
+    configuration = None if args.config is None else _load_configuration(args.config)
+    output = sys.stdout
+    exit_code = 0
+    for filename in args.files:
+        formatter_kind, fmt, datefmt = _resolve_format(configuration, filename)
+        formatter = _create_formatter(
+            args.formatter if args.formatter is not None else formatter_kind,
+            args.format if args.format is not None else fmt,
+            args.datefmt if args.datefmt is not None else datefmt,
+            False)
+        try:
+            for record in BinaryFileHandler.read(filename):
+                output.write(formatter.format(record))
+                output.write('\n')
+        except (OSError, ValueError) as ex:
+            print(f'{filename}: {ex}', file=sys.stderr)
+            exit_code = 1
+    output.flush()
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,7 +1,9 @@
 # SPDX-FileCopyrightText: © 2026 Shaun Wilson
 # SPDX-License-Identifier: MIT
 
+import functools
 import logging
+import re
 from typing import Any, Callable, Literal, Mapping, Optional
 
 bidi_fn: Optional[Callable[..., Any]] = None
@@ -12,6 +14,17 @@ except Exception:  # pragma: no cover
     pass
 
 
+# NOTE: a superset of the code points which the bidi algorithm reorders or removes (R, AL, AN, explicit formatting and BN), text without any of them is displayed as-is
+_BIDI_PATTERN: re.Pattern[str] = re.compile(
+    '[\x00-\x08\x0e-\x1b\x7f-\x9f\xad\u0590-\u08ff\u180e\u200b-\u200f\u202a-\u202e\u2060-\u206f'
+    '\ufb1d-\ufdff\ufe70-\ufeff\ufff0-\uffff\U00010800-\U00010fff\U0001bca0-\U0001bca3\U0001d173-\U0001d17a'
+    '\U0001e800-\U0001efff\U000e0000-\U000e0fff]')
+
+
+def _display(text: str) -> str:
+    return str(bidi_fn(text, 'utf-8', False, None, False))  # type: ignore[misc]
+
+
 class BidiFormatter(logging.Formatter):
     """A filter to run log messages through python-bidi."""
 
@@ -23,18 +36,27 @@ class BidiFormatter(logging.Formatter):
         validate: bool = True,
         *,
         defaults: Optional[Mapping[str, Any]] = None,
+        cache_size: int = 1024
     ) -> None:
-        """Initialize *BidiFormatter* instance."""
+        """
+        Initialize *BidiFormatter* instance.
+
+        :param cache_size: The number of reordered lines to cache (lines which need no reordering are never cached), ``0`` to disable the cache, defaults to 1024.
+        """
         super().__init__(fmt, datefmt, style, validate, defaults=defaults)
+        self.__display = _display if cache_size <= 0 else functools.lru_cache(maxsize=cache_size)(_display)
 
     def format(self, record: logging.LogRecord) -> str:
         """Format the LogRecord, applying bidirectional display behavior."""
         formatted = super().format(record)
-        return (
-            formatted
-            if bidi_fn is None
-            else str(bidi_fn(formatted, 'utf-8', False, None, False))
-        )
+        if (
+            bidi_fn is None
+            or (formatted.isascii() and formatted.isprintable())
+            or _BIDI_PATTERN.search(formatted) is None
+        ):
+            # NOTE: the vast majority of lines contain no right-to-left text, the bidi algorithm would return them unchanged
+            return formatted
+        return self.__display(formatted)
 
 
 __all__ = [
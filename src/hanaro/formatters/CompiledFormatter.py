@@ -0,0 +1,169 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import itertools
+import logging
+import operator
+import re
+import time
+from typing import Any, Callable, Iterator, Literal, Mapping, Optional
+
+
+_FIELD_PATTERN: re.Pattern[str] = re.compile(r'%%|%\((\w+)\)')
+
+# NOTE: outputs cached on records are keyed by an integer (rather than by the formatter), so records remain picklable
+_output_keys: Iterator[int] = itertools.count()
+
+
+def _compile(fmt: str) -> Callable[[logging.LogRecord], str]:
+    """Compile the ``%``-style *fmt* into a render function, which fetches only the fields *fmt* references."""
+    names = list[str]()
+
+    def replace(match: re.Match[str]) -> str:
+        name = match.group(1)
+        if name is None:
+            return '%%'
+        names.append(name)
+        return '%'
+    # NOTE: named fields become positional, conversion flags/width/precision are retained
+    positional = _FIELD_PATTERN.sub(replace, fmt)
+    if len(names) == 0:
+        text = positional % ()
+        return lambda record: text
+    if len(names) == 1:
+        getter = operator.attrgetter(names[0])
+        return lambda record: positional % (getter(record),)
+    getters = operator.attrgetter(*names)
+    return lambda record: positional % getters(record)
+
+
+class CompiledFormatter(logging.Formatter):
+    """
+    A :class:``logging.Formatter`` which compiles its format once, into a render function which fetches only the fields it references, and which caches the rendered timestamp per second.
+
+    Output is identical to :class:``logging.Formatter``. Only ``%``-style formats (without *defaults*) are compiled, other formats are rendered by :class:``logging.Formatter``.
+
+    The interpolated message, and the output of each formatter, are cached on the record (as ``_formatted``) so that handlers sharing a formatter format a record once, and formatters with different formats interpolate its message once. The cache is invalidated if ``msg``, ``args`` or ``created`` of the record change, or if an attribute of the formatter (such as ``converter`` or ``datefmt``) is assigned.
+    """
+
+    def __init__(
+        self,
+        fmt: Optional[str] = None,
+        datefmt: Optional[str] = None,
+        style: Literal['%', '{', '$'] = '%',
+        validate: bool = True,
+        *,
+        defaults: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """Initialize *CompiledFormatter* instance."""
+        self.__output_key = next(_output_keys)
+        super().__init__(fmt, datefmt, style, validate, defaults=defaults)
+        self.__uses_time = self.usesTime()
+        self.__render = (
+            _compile(self._fmt)
+            if type(self._style) is logging.PercentStyle and defaults is None and self._fmt is not None
+            else self._style.format
+        )
+        self.__time_cache: tuple[int, Optional[str], Any, str] = (-1, None, None, '')
+        # NOTE: subclasses which override `formatTime` or `formatMessage` are called as usual
+        self.__is_inlined = (
+            type(self).formatTime is CompiledFormatter.formatTime
+            and type(self).formatMessage is CompiledFormatter.formatMessage
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if not name.startswith('_CompiledFormatter__'):
+            # NOTE: such as `converter` or `datefmt`, outputs cached on records by this formatter are no longer valid
+            object.__setattr__(self, '_CompiledFormatter__output_key', next(_output_keys))
+        object.__setattr__(self, name, value)
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:  # noqa: N802
+        """
+        Format the creation time of *record*, the result of ``strftime`` is cached for the current second.
+
+        :param record: The Log Record to format the creation time of.
+        :param datefmt: The ``strftime`` format of the creation time, defaults to ISO8601-like.
+        :return: The formatted creation time.
+        """
+        converter = self.converter
+        if converter is not time.localtime and converter is not time.gmtime:
+            return super().formatTime(record, datefmt)
+        created = record.created
+        second = int(created)
+        cached_second, cached_datefmt, cached_converter, text = self.__time_cache
+        if cached_second != second or cached_datefmt is not datefmt or cached_converter is not converter:
+            text = time.strftime(datefmt if datefmt else self.default_time_format, converter(created))
+            self.__time_cache = (second, datefmt, converter, text)
+        if not datefmt and self.default_msec_format:
+            return self.default_msec_format % (text, record.msecs)
+        return text
+
+    def formatMessage(self, record: logging.LogRecord) -> str:  # noqa: N802
+        """Render *record* via the compiled format."""
+        try:
+            return self.__render(record)
+        except AttributeError:
+            # NOTE: rendered by the format style, which raises the same error as `logging.Formatter`
+            return self._style.format(record)
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format *record*, identically to :class:``logging.Formatter``.
+
+        :param record: The Log Record to format.
+        :return: The formatted Log Record.
+        """
+        attributes = record.__dict__
+        # NOTE: the identities of `msg` and `args`, the cache must not retain them (or prevent the record being pickled)
+        msg = id(record.msg)
+        args = id(record.args)
+        created = record.created
+        cache = attributes.get('_formatted')
+        if cache is None or cache[0] != msg or cache[1] != args or cache[2] != created:
+            # NOTE: the interpolated message (and any output) is cached on the record, for other formatters (and handlers sharing this formatter)
+            outputs: dict[int, str] = {}
+            cache = (msg, args, created, record.getMessage(), outputs)
+            attributes['_formatted'] = cache
+        else:
+            s = cache[4].get(self.__output_key)
+            if s is not None:
+                return s
+        record.message = cache[3]
+        if self.__uses_time:
+            second, datefmt, converter, text = self.__time_cache
+            # NOTE: inlined cache hit of `formatTime`, the common case
+            if (
+                second == int(created)
+                and datefmt is self.datefmt
+                and converter is self.converter
+                and datefmt
+                and self.__is_inlined
+            ):
+                record.asctime = text
+            else:
+                record.asctime = self.formatTime(record, self.datefmt)
+        if self.__is_inlined:
+            try:
+                s = self.__render(record)
+            except AttributeError:
+                s = self._style.format(record)
+        else:
+            s = self.formatMessage(record)
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if s[-1:] != '\n':
+                s = s + '\n'
+            s = s + record.exc_text
+        if record.stack_info:
+            if s[-1:] != '\n':
+                s = s + '\n'
+            s = s + self.formatStack(record.stack_info)
+        cache[4][self.__output_key] = s
+        return s
+
+
+__all__ = [
+    'CompiledFormatter'
+]
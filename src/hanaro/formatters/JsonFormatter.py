@@ -0,0 +1,192 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import functools
+import json
+import json.encoder
+import logging
+import math
+import operator
+import re
+import string
+from typing import Any, Callable, Literal, Mapping, Optional, Sequence, cast
+
+from ..RecordCodec import _STANDARD_ATTRIBUTES
+from .CompiledFormatter import CompiledFormatter, _FIELD_PATTERN
+
+orjson_fn: Optional[Callable[..., bytes]] = None
+
+try:
+    from orjson import dumps as orjson_fn
+except Exception:  # pragma: no cover
+    pass
+
+
+_DEFAULT_FIELDS: tuple[str, ...] = ('asctime', 'levelname', 'name', 'message', 'metadata')
+
+_TEMPLATE_PATTERN: re.Pattern[str] = re.compile(r'\$(?:(\w+)|\{(\w+)\})')
+
+# NOTE: attributes which are never output as fields, either because they are output as other fields or because they are artifacts of logging (as are any other attributes with a leading underscore)
+_EXCLUDED_ATTRIBUTES: frozenset[str] = frozenset([*_STANDARD_ATTRIBUTES, '_metadata_fields', '_hanaro_scoped', '_hanaro_sampled', '_hanaro_coalesced'])
+
+_encode_string: Callable[[str], str] = cast(Callable[[str], str], json.encoder.encode_basestring)  # type: ignore[attr-defined]
+
+# NOTE: `JSONEncoder.encode()` creates a C encoder per call, the C encoder is created once (where available)
+_c_make_encoder: Optional[Callable[..., Any]] = getattr(json.encoder, 'c_make_encoder', None)
+_encode_object: Callable[[dict[str, Any]], str] = (
+    cast(Callable[[dict[str, Any]], str], json.JSONEncoder(ensure_ascii=False, check_circular=False, allow_nan=False, separators=(',', ':'), default=str).encode)
+    if _c_make_encoder is None
+    else functools.partial(
+        lambda encoder, obj: ''.join(encoder(obj, 0)),
+        _c_make_encoder(None, str, _encode_string, None, ':', ',', False, False, False)
+    )
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _encode_key(key: str) -> str:
+    return f'{_encode_string(key)}:'
+
+
+def _field_names(fmt: str, style: str) -> list[str]:
+    """Get the names of the record attributes referenced by *fmt*, in order."""
+    match style:
+        case '{':
+            names = [
+                e[1].split('.', 1)[0].split('[', 1)[0]
+                for e in string.Formatter().parse(fmt)
+                if e[1]
+            ]
+        case '$':
+            names = [e[0] or e[1] for e in _TEMPLATE_PATTERN.findall(fmt)]
+        case _:
+            names = [e for e in _FIELD_PATTERN.findall(fmt) if e]
+    return list(dict.fromkeys(names))
+
+
+def _encode_value(value: Any) -> str:
+    t = type(value)
+    if t is str:
+        return _encode_string(value)
+    if t is int:
+        return int.__repr__(value)
+    if t is bool:
+        return 'true' if value else 'false'
+    if t is float:
+        # NOTE: JSON has no representation of NaN or infinity, like `orjson` they are output as null
+        return float.__repr__(value) if math.isfinite(value) else 'null'
+    if value is None:
+        return 'null'
+    return _encode_string(str(value))
+
+
+class JsonFormatter(CompiledFormatter):
+    """
+    Formats Log Records as JSON objects, one per line, for log pipelines which would otherwise parse formatted text.
+
+    The fields of the object are planned once, from the attributes referenced by *fmt* (or *fields*.) Structured metadata injected by :class:``ContextInjectionFilter`` is output as first-class fields (rather than as a pre-rendered string), as are any other attributes added to a record (such as via ``extra``.) Exceptions and stack info are output as ``exc_info`` and ``stack_info`` fields.
+
+    Records are serialized via ``orjson`` when it is installed, otherwise via an escape-aware serializer which uses the string encoder of :mod:``json``.
+    """
+
+    def __init__(
+        self,
+        fmt: Optional[str] = None,
+        datefmt: Optional[str] = None,
+        style: Literal['%', '{', '$'] = '%',
+        validate: bool = True,
+        *,
+        defaults: Optional[Mapping[str, Any]] = None,
+        fields: Optional[Sequence[str]] = None,
+        use_orjson: bool = True
+    ) -> None:
+        """
+        Initialize *JsonFormatter* instance.
+
+        :param fields: The record attributes to output (in order), defaults to the attributes referenced by *fmt*, or to ``asctime``, ``levelname``, ``name``, ``message`` and ``metadata`` if *fmt* is not provided.
+        :param use_orjson: Use ``orjson`` to serialize records when it is installed, defaults to True.
+        """
+        super().__init__(fmt, datefmt, style, validate, defaults=defaults)
+        plan = (
+            list(fields)
+            if fields is not None
+            else list(_DEFAULT_FIELDS) if fmt is None else _field_names(fmt, style)
+        )
+        self.__fields = tuple(plan)
+        getter = operator.itemgetter(*plan) if len(plan) > 0 else (lambda attributes: ())
+        self.__get_values = getter if len(plan) != 1 else (lambda attributes: (getter(attributes),))
+        # NOTE: planned fields which are not standard attributes (such as metadata) are only output when they have a value
+        self.__optional = tuple(e for e in plan if e not in _STANDARD_ATTRIBUTES)
+        self.__uses_time = 'asctime' in plan
+        self.__defaults = dict(defaults) if defaults is not None else {}
+        self.__excluded = _EXCLUDED_ATTRIBUTES.union(plan)
+        self.__extras: tuple[set[str], list[str]] = (set(), [])
+        self.__dumps = orjson_fn if use_orjson else None
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format *record* as a JSON object.
+
+        :param record: The Log Record to format.
+        :return: The JSON object, on a single line.
+        """
+        attributes = record.__dict__
+        record.message = record.getMessage()
+        if self.__uses_time:
+            record.asctime = self.formatTime(record, self.datefmt)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        try:
+            obj = dict(zip(self.__fields, self.__get_values(attributes)))
+        except KeyError:
+            defaults = self.__defaults
+            obj = {
+                k: attributes[k] if k in attributes else defaults[k]
+                for k in self.__fields
+                if k in attributes or k in defaults
+            }
+        metadata_fields = attributes.get('_metadata_fields', None)
+        for name in self.__optional:
+            fields = None if metadata_fields is None else metadata_fields.get(name, None)
+            if fields is not None:
+                # NOTE: structured metadata is output as first-class fields, rather than as a pre-rendered string
+                obj.pop(name, None)
+                for k, v in fields.items():
+                    obj.setdefault(k, v)
+            else:
+                value = obj.get(name, None)
+                if value is None or (type(value) is str and len(value) == 0):
+                    obj.pop(name, None)
+        # NOTE: a set difference, rather than a scan of every attribute of the record
+        extras = attributes.keys() - self.__excluded
+        if extras:
+            # NOTE: records logged from the same code usually have the same extras, their (ordered) names are cached
+            names = self.__extras
+            if names[0] != extras:
+                names = (extras, sorted(extras))
+                self.__extras = names
+            for k in names[1]:
+                v = attributes[k]
+                if k not in obj and k[:1] != '_' and v is not None and (type(v) is not str or v):
+                    obj[k] = v
+        if record.exc_text:
+            obj['exc_info'] = record.exc_text
+        if record.stack_info:
+            obj['stack_info'] = self.formatStack(record.stack_info)
+        dumps = self.__dumps
+        if dumps is not None:
+            try:
+                return dumps(obj, default=str).decode('utf-8')
+            except TypeError:
+                # NOTE: such as an integer larger than 64 bits
+                pass
+        try:
+            return _encode_object(obj)
+        except ValueError:
+            # NOTE: such as NaN, which JSON has no representation of
+            return '{' + ','.join([_encode_key(k) + _encode_value(v) for k, v in obj.items()]) + '}'
+
+
+__all__ = [
+    'JsonFormatter'
+]
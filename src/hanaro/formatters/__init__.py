@@ -3,7 +3,11 @@
 # SPDX-License-Identifier: MIT
 
 from .BidiFormatter import BidiFormatter
+from .CompiledFormatter import CompiledFormatter
+from .JsonFormatter import JsonFormatter
 
 __all__ = [
-    'BidiFormatter'
+    'BidiFormatter',
+    'CompiledFormatter',
+    'JsonFormatter'
 ]
@@ -6,6 +6,8 @@
 from __future__ import annotations
 
 import appsettings2
+import asyncio
+import atexit
 import contextvars
 from datetime import datetime, timezone
 import importlib
@@ -14,19 +16,324 @@ import logging.handlers
 import os
 import sys
 import threading
+import time
+from types import CodeType
 from typing import Any, Callable, Optional, cast
 
 from .formatters.BidiFormatter import BidiFormatter
+from .formatters.CompiledFormatter import CompiledFormatter
+from .formatters.JsonFormatter import JsonFormatter
+from .BackgroundHandler import BackgroundHandler
+from .BinaryFileHandler import BinaryFileHandler
+from .BufferedRotatingFileHandler import BufferedRotatingFileHandler
+from .CoalescingFilter import CoalescingFilter
 from .ConfigFilter import ConfigFilter
 from .ContextInjectionFilter import ContextInjectionFilter
+from .MmapFileHandler import MmapFileHandler
+from .ProcessHandler import ProcessHandler
+from .ProcessListener import ProcessListener
 from .QueuedHandler import QueuedHandler
+from .RateLimitFilter import RateLimitFilter
+from .SharedMemoryHandler import SharedMemoryHandler
 
 
 _CIF_contextvar: contextvars.ContextVar[Optional[ContextInjectionFilter]] = (
     contextvars.ContextVar('_CIF_contextvar', default=None)
 )
+
+
+class _ContextScopeFilter(logging.Filter):
+    """
+    Injects the active :class:``ContextInjectionFilter`` scope (see ``_CIF_contextvar``) into Log Records.
+
+    A single instance is installed on configured handlers and queued loggers, the context is resolved when a record is handled so that loggers are never mutated by context scopes.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        attributes = record.__dict__
+        if '_hanaro_scoped' not in attributes:
+            # NOTE: records are only scoped once, so queued records are not re-scoped when handled by another thread
+            attributes['_hanaro_scoped'] = True
+            ctx = _CIF_contextvar.get()
+            if ctx is not None:
+                ctx._get_scope_snapshot().inject(record)
+        return True
+
+
+_context_scope_filter = _ContextScopeFilter('context_scope_filter')
+
+
+class _QueuedLogger(logging.Logger):
+    """
+    A bare-bones Logger that only forwards Log Records to a :class:``QueuedHandler``.
+
+    Unless a level is set on the queued logger itself, it defers to the level configured for the same name in the logger hierarchy.
+    """
+
+    def __init__(self, name: Optional[str], handler: QueuedHandler) -> None:
+        super().__init__(cast(str, name))
+        self.__logger = (
+            logging.root
+            if name is None
+            else logging.Logger.manager.getLogger(name)
+        )
+        self.addHandler(handler)
+
+    def getEffectiveLevel(self) -> int:  # noqa: N802
+        return (
+            self.__logger.getEffectiveLevel()
+            if self.level == logging.NOTSET
+            else self.level
+        )
+
+    def isEnabledFor(self, level: int) -> bool:  # noqa: N802
+        return (
+            self.__logger.isEnabledFor(level)
+            if self.level == logging.NOTSET
+            else not self.disabled and level >= self.level and level > logging.Logger.manager.disable
+        )
+
+
+class _CompiledBidiFormatter(BidiFormatter, CompiledFormatter):
+    """A :class:``BidiFormatter`` which renders via :class:``CompiledFormatter``."""
+
+
+class _QueueDrainThread(threading.Thread):
+    """A dedicated writer thread which blocks on the Log Queue, outputting queued records using the root logger."""
+
+    def __init__(self) -> None:
+        super().__init__(name='hanaro.QueueDrainThread', daemon=True)
+        self.__is_stopping = False
+
+    def run(self) -> None:
+        queue = QueuedHandler.get_queue()
+        while not self.__is_stopping:
+            if queue.wait():
+                _output_queued_log_records(None, None)
+        _output_queued_log_records(None, None)
+
+    def stop(self, timeout: Optional[float]) -> None:
+        """Stop the thread once all queued records are output, waiting up to *timeout* seconds."""
+        self.__is_stopping = True
+        QueuedHandler.get_queue().wake()
+        if self is not threading.current_thread():
+            self.join(timeout)
+
+
+class _ConfigWatchThread(threading.Thread):
+    """A thread which polls the modification time of a configuration file, applying the configuration via :function:``reconfigure`` when the file changes."""
+
+    def __init__(self, filename: str, interval: float, loader: Callable[[], appsettings2.Configuration]) -> None:
+        super().__init__(name='hanaro.ConfigWatchThread', daemon=True)
+        self.__filename = filename
+        self.__interval = interval
+        self.__loader = loader
+        self.__stopping = threading.Event()
+        self.__version = self.__get_version()
+
+    def __get_version(self) -> Optional[tuple[int, int]]:
+        try:
+            stat = os.stat(self.__filename)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def run(self) -> None:
+        while not self.__stopping.wait(self.__interval):
+            version = self.__get_version()
+            if version is None or version == self.__version:
+                continue
+            self.__version = version
+            try:
+                reconfigure(self.__loader())
+            except Exception as ex:
+                # NOTE: such as a configuration file which is only partially written, it is loaded again when it next changes
+                logging.getLogger(__name__).warning('Failed to reload logging configuration from "%s": %s', self.__filename, ex)
+
+    def stop(self) -> None:
+        """Stop polling the configuration file."""
+        self.__stopping.set()
+        if self is not threading.current_thread():
+            self.join()
+
+
+class _LiveSettings:
+    """Represent the settings of a logging configuration which :function:``reconfigure`` can apply without recreating handlers."""
+
+    __slots__ = ['allow_queued_logger', 'bidi', 'coalesce', 'datefmt', 'filters', 'filters_mode', 'format', 'formatter', 'level', 'summary_interval']
+    allow_queued_logger: bool
+    bidi: bool
+    coalesce: tuple[float, int]
+    datefmt: Optional[str]
+    filters: dict[str, Any]
+    filters_mode: str
+    format: str
+    formatter: str
+    level: str
+    summary_interval: float
+
+    def __init__(self, configuration: appsettings2.Configuration) -> None:
+        self.allow_queued_logger = configuration.get('logging__allow_queued_logger', True)
+        self.bidi = cast(bool, configuration.get('logging__bidi', True))
+        coalesce_config = configuration.get('logging__coalesce')
+        self.coalesce = (
+            (0.0, CoalescingFilter.DEFAULT_MAX_SIZE)
+            if coalesce_config is None
+            else (_parse_interval(coalesce_config.get('window'), 1.0), int(coalesce_config.get('max_size', CoalescingFilter.DEFAULT_MAX_SIZE)))
+        )
+        self.datefmt = configuration.get('logging__datefmt', '%Y-%m-%dT%H:%M:%S')
+        filter_configs = configuration.get('logging__filters', None)
+        self.filters = filter_configs.toDictionary() if filter_configs is not None else {}
+        self.filters_mode = str(configuration.get('logging__filters_mode', 'filter')).lower()
+        self.format = cast(str, configuration.get('logging__format', logging.BASIC_FORMAT))
+        self.formatter = str(configuration.get('logging__formatter', 'default'))
+        self.level = cast(str, configuration.get('logging__level', 'DEBUG')).upper()
+        self.summary_interval = _parse_interval(configuration.get('logging__filters_summary_interval'), 10.0)
+
+
+class _LiveHandler:
+    """Represent a configured handler, paired with the index of its configuration and the formatter assigned to it (if any.)"""
+
+    __slots__ = ['formatter_key', 'handler', 'index', 'target']
+    formatter_key: Optional[tuple[str, Optional[str], Optional[str], bool]]
+    handler: logging.Handler
+    index: int
+    target: logging.Handler
+
+    def __init__(self, index: int, handler: logging.Handler, target: logging.Handler, formatter_key: Optional[tuple[str, Optional[str], Optional[str], bool]]) -> None:
+        self.formatter_key = formatter_key
+        self.handler = handler
+        self.index = index
+        self.target = target
+
+
+class _LiveConfiguration:
+    """Represent the logging configuration applied by :function:``configure_logging``, which :function:``reconfigure`` changes in place."""
+
+    __slots__ = ['coalescing_filter', 'config_filter', 'formatters', 'handlers', 'live_handlers', 'rate_limit_filter', 'settings', 'structure']
+    coalescing_filter: CoalescingFilter
+    config_filter: ConfigFilter
+    formatters: dict[tuple[str, Optional[str], Optional[str], bool], logging.Formatter]
+    handlers: list[logging.Handler]
+    live_handlers: list[_LiveHandler]
+    rate_limit_filter: RateLimitFilter
+    settings: _LiveSettings
+    structure: dict[str, Any]
+
+    def __init__(
+        self,
+        settings: _LiveSettings,
+        structure: dict[str, Any],
+        config_filter: ConfigFilter,
+        rate_limit_filter: RateLimitFilter,
+        coalescing_filter: CoalescingFilter,
+        formatters: dict[tuple[str, Optional[str], Optional[str], bool], logging.Formatter],
+        handlers: list[logging.Handler],
+        live_handlers: list[_LiveHandler]
+    ) -> None:
+        self.coalescing_filter = coalescing_filter
+        self.config_filter = config_filter
+        self.formatters = formatters
+        self.handlers = handlers
+        self.live_handlers = live_handlers
+        self.rate_limit_filter = rate_limit_filter
+        self.settings = settings
+        self.structure = structure
+
+
+__queued_handler = QueuedHandler()
+__queued_handler.addFilter(_context_scope_filter)
+__queued_loggers: dict[Optional[str], _QueuedLogger] = {}
 __original_get_logger: Optional[Callable[[Optional[str]], logging.Logger]] = None
 __allow_queued_logger: bool = True
+__CACHE_SIZE: int = 4096
+__DRAIN_BATCH_SIZE: int = 256
+__drain_thread: Optional[_QueueDrainThread] = None
+__drain_timeout: Optional[float] = 5.0
+__is_atexit_registered: bool = False
+__async_drain: Optional[tuple[asyncio.AbstractEventLoop, Callable[[], None]]] = None
+__process_listener: Optional[ProcessListener] = None
+__process_handler_factory: Optional[Callable[[str], logging.Handler]] = None
+__is_process_fork_registered: bool = False
+__PROCESS_ADDRESS_VARIABLE: str = 'HANARO_PROCESS_ADDRESS'
+__PROCESS_TRANSPORTS: tuple[str, ...] = ('none', 'socket', 'shm')
+__FORMATTERS: tuple[str, ...] = ('default', 'compiled', 'json')
+__caller_names: dict[CodeType, Optional[str]] = {}
+__loggers: dict[tuple[Optional[str], bool, int | str], logging.Logger] = {}
+__filter_levels: Optional[ConfigFilter] = None
+__filter_levels_restore: dict[str, int] = {}
+__live: Optional[_LiveConfiguration] = None
+__reconfigure_lock: threading.Lock = threading.Lock()
+__config_watch_thread: Optional[_ConfigWatchThread] = None
+# NOTE: settings which are applied to live handlers and filters, a change to any other setting recreates handlers
+__RECONFIGURABLE_SETTINGS: frozenset[str] = frozenset([
+    'allow_queued_logger', 'bidi', 'coalesce', 'datefmt', 'filters', 'filters_mode',
+    'filters_summary_interval', 'format', 'formatter', 'handlers', 'level'
+])
+__RECONFIGURABLE_HANDLER_SETTINGS: frozenset[str] = frozenset(['format', 'formatter', 'level'])
+
+
+def _parse_size(value: Optional[str | int], default: int) -> int:
+    """Parse a size in bytes, such as ``4096`` or ``"256KiB"`` (``KiB``, ``MiB``, and ``GiB`` suffixes are supported.)"""
+    if value is None:
+        return default
+    if type(value) is str:
+        size_unit = value[len(value) - 3:].upper()
+        match size_unit:
+            case 'KIB':
+                return int(value[:-3]) * 1024
+            case 'MIB':
+                return int(value[:-3]) * 1024 * 1024
+            case 'GIB':
+                return int(value[:-3]) * 1024 * 1024 * 1024
+    return int(value)
+
+
+def _parse_interval(value: Optional[str | int | float], default: float) -> float:
+    """Parse an interval in seconds, such as ``3600`` or ``"1h"`` (``s``, ``m``, ``h``, and ``d`` suffixes are supported, as is ``"midnight"``.)"""
+    if value is None:
+        return default
+    if type(value) is str:
+        if value.lower() == 'midnight':
+            return 86400
+        interval_unit = value[len(value) - 1:].upper()
+        match interval_unit:
+            case 'S':
+                return float(value[:-1])
+            case 'M':
+                return float(value[:-1]) * 60
+            case 'H':
+                return float(value[:-1]) * 3600
+            case 'D':
+                return float(value[:-1]) * 86400
+    return float(value)
+
+
+def _load_configuration(filename: str) -> appsettings2.Configuration:
+    """Load a configuration file, as json, toml or yaml according to its extension."""
+    builder = appsettings2.ConfigurationBuilder()
+    match os.path.splitext(filename)[1].lower():
+        case '.toml':
+            builder.add_toml(filename)
+        case '.yaml' | '.yml':
+            builder.add_yaml(filename)
+        case _:
+            builder.add_json(filename)
+    return builder.build()
+
+
+def _create_formatter(formatter: str, fmt: Optional[str], datefmt: Optional[str], bidi: bool) -> logging.Formatter:
+    """Create a formatter of the configured kind (``default``, ``compiled`` or ``json``), optionally applying bidirectional display behavior (never to JSON.)"""
+    formatter = formatter.lower()
+    if formatter == 'binary':
+        raise ValueError('Unsupported formatter "binary", it is only supported by "file" handlers')
+    if formatter not in __FORMATTERS:
+        raise ValueError(f'Unsupported formatter "{formatter}", expected one of: {", ".join(__FORMATTERS)}')
+    if formatter == 'json':
+        return JsonFormatter(fmt, datefmt)
+    if formatter == 'compiled':
+        return _CompiledBidiFormatter(fmt, datefmt) if bidi else CompiledFormatter(fmt, datefmt)
+    return BidiFormatter(fmt, datefmt) if bidi else logging.Formatter(fmt, datefmt)
 
 
 def configure_logging(
@@ -46,22 +353,50 @@ def configure_logging(
     else:
         configuration = appsettings2.Configuration()
     if force or not logging.getLogger().hasHandlers():
-        global __allow_queued_logger
-        __allow_queued_logger = configuration.get('logging__allow_queued_logger', True)
+        global __allow_queued_logger, __live
+        settings = _LiveSettings(configuration)
+        __allow_queued_logger = settings.allow_queued_logger
+        queue_config = configuration.get('logging__queue')
+        if queue_config is None:
+            queue_config = appsettings2.Configuration()
+        queue_timeout = queue_config.get('timeout', 1.0)
+        QueuedHandler.configure(
+            int(queue_config.get('max_size', 0)),
+            str(queue_config.get('overflow', 'block')),
+            None if queue_timeout is None else float(queue_timeout),
+            str(queue_config.get('drop_level', 'WARNING')).upper(),
+            cast(bool, queue_config.get('freeze', False)))
+        queue_drain = str(queue_config.get('drain', 'manual')).lower()
+        queue_drain_timeout = queue_config.get('drain_timeout', 5.0)
+        __stop_drain_thread()
+        process_config = configuration.get('logging__process')
+        if process_config is None:
+            process_config = appsettings2.Configuration()
+        process_transport = str(process_config.get('transport', 'none')).lower()
+        if process_transport not in __PROCESS_TRANSPORTS:
+            raise ValueError(f'Unsupported process transport "{process_transport}", expected one of: {", ".join(__PROCESS_TRANSPORTS)}')
+        __stop_process_listener()
+        __flush_live_filters()
+        process_parent = None if process_transport == 'none' else __get_process_parent()
         handlers = list[logging.Handler]()
-        default_bidi_enabled = cast(bool, configuration.get('logging__bidi', True))
-        default_level = cast(str, configuration.get('logging__level', 'DEBUG')).upper()
-        default_format = configuration.get('logging__format', logging.BASIC_FORMAT)
-        filter_configs = configuration.get('logging__filters', None)
-        config_filter = ConfigFilter("config_filter", filter_configs.toDictionary() if filter_configs is not None else {})
+        live_handlers = list[_LiveHandler]()
+        formatters = dict[tuple[str, Optional[str], Optional[str], bool], logging.Formatter]()
+        default_level = settings.level
+        default_format = settings.format
+        default_formatter = settings.formatter
+        filters_mode = settings.filters_mode
+        config_filter = ConfigFilter("config_filter", settings.filters)
+        rate_limit_filter = RateLimitFilter("rate_limit_filter", settings.filters, settings.summary_interval)
+        coalescing_filter = CoalescingFilter("coalescing_filter", *settings.coalesce)
         context_injection_filter = ContextInjectionFilter({}, True)
-        datefmt = configuration.get('logging__datefmt', '%Y-%m-%dT%H:%M:%S')
-        # create configured handlers
-        handler_configs = configuration.get('logging__handlers')
+        datefmt = settings.datefmt
+        # create configured handlers, unless records are forwarded to a parent process which owns the output
+        handler_configs = configuration.get('logging__handlers') if process_parent is None else None
         if handler_configs is not None:
-            for handler_config in handler_configs:
+            for index, handler_config in enumerate(handler_configs):
                 handler = None
-                match str(handler_config.get('type')).lower():
+                handler_type = str(handler_config.get('type')).lower()
+                match handler_type:
                     case 'custom':
                         module_name, class_name = handler_config.get('class').rsplit('.', 1)
                         module = importlib.import_module(module_name)
@@ -70,7 +405,7 @@ def configure_logging(
                         handler = handler_class(**(args.toDictionary() if args is not None else {}))
                     case 'console':
                         handler = logging.StreamHandler(sys.stdout)
-                    case 'file':
+                    case 'file' | 'mmap':
                         log_path = handler_config.get('path')
                         if log_path is None:
                             log_path = 'logs'
@@ -80,51 +415,106 @@ def configure_logging(
                         if log_name is None:
                             log_name = f"{cast(str, handler_config.get('level', 'log'))}_{datetime.now(timezone.utc).strftime('%Y%m%d')}.log".lower()
                         log_name = os.path.join(log_path, log_name)
-                        max_size: str | int | None = handler_config.get('max_size')
-                        max_size = max_size if max_size is not None else 4 * 1024 * 1024
-                        if type(max_size) is str:
-                            size_unit = max_size[len(max_size) - 3:].upper()
-                            match size_unit:
-                                case 'KIB':
-                                    max_size = int(max_size[:-3]) * 1024
-                                case 'MIB':
-                                    max_size = int(max_size[:-3]) * 1024 * 1024
-                                case 'GIB':
-                                    max_size = int(max_size[:-3]) * 1024 * 1024 * 1024
-                                case _:
-                                    max_size = int(max_size)
+                        max_size = _parse_size(handler_config.get('max_size'), 4 * 1024 * 1024)
                         max_count = handler_config.get('max_count')
                         if max_count is None:
                             max_count = 10
                         else:
                             max_count = int(max_count)
-                        handler = logging.handlers.RotatingFileHandler(
-                            filename=log_name,
-                            encoding='utf-8',
-                            maxBytes=cast(int, max_size),
-                            backupCount=max_count)
+                        buffer_size = handler_config.get('buffer_size')
+                        compress = handler_config.get('compress')
+                        rotate_when = handler_config.get('rotate_when')
+                        if handler_type == 'file' and str(handler_config.get('formatter', default_formatter)).lower() == 'binary':
+                            if buffer_size is not None or compress is not None or rotate_when is not None:
+                                raise ValueError('Unsupported "file" handler options for the "binary" formatter: buffer_size, compress, rotate_when')
+                            # records are encoded rather than formatted, they are formatted when the log file is read
+                            handler = BinaryFileHandler(
+                                log_name,
+                                max_size,
+                                max_count)
+                        elif handler_type == 'mmap':
+                            handler = MmapFileHandler(
+                                log_name,
+                                max_size,
+                                max_count,
+                                'utf-8')
+                        elif buffer_size is None and compress is None and rotate_when is None:
+                            handler = logging.handlers.RotatingFileHandler(
+                                filename=log_name,
+                                encoding='utf-8',
+                                maxBytes=max_size,
+                                backupCount=max_count)
+                        else:
+                            handler = BufferedRotatingFileHandler(
+                                log_name,
+                                max_size,
+                                max_count,
+                                'utf-8',
+                                _parse_size(buffer_size, 0),
+                                float(handler_config.get('flush_interval_ms', 200)) / 1000,
+                                str(handler_config.get('flush_level', 'ERROR')).upper(),
+                                _parse_interval(rotate_when, 0),
+                                None if compress is None else str(compress))
                 if handler is not None:
                     handler.setLevel(getattr(logging, handler_config.get('level', default_level).upper()))
-                    if handler.formatter is None:
-                        if (
-                            default_bidi_enabled
-                            and isinstance(handler, logging.StreamHandler)
-                            and handler.stream is sys.stdout
-                        ):
-                            handler.formatter = BidiFormatter(handler_config.get('format', default_format), datefmt)
-                        else:
-                            handler.formatter = logging.Formatter(handler_config.get('format', default_format), datefmt)
+                    formatter_key = None
+                    if handler.formatter is None and not isinstance(handler, BinaryFileHandler):
+                        # handlers with identical formatter configurations share a formatter, which formats each record once
+                        formatter_key = __get_formatter_key(settings, handler_config, handler)
+                        handler.formatter = __get_formatter(formatters, formatter_key)
+                    target = handler
+                    if handler_config.get('async', False):
+                        # dispatch records to the handler from a dedicated thread, filters are applied by the emitting thread
+                        async_config = handler_config.get('queue')
+                        if async_config is None:
+                            async_config = appsettings2.Configuration()
+                        async_timeout = async_config.get('timeout', 1.0)
+                        async_drain_timeout = async_config.get('drain_timeout', 5.0)
+                        handler = BackgroundHandler(
+                            target,
+                            int(async_config.get('max_size', 10000)),
+                            str(async_config.get('overflow', 'block')),
+                            None if async_timeout is None else float(async_timeout),
+                            str(async_config.get('drop_level', 'WARNING')).upper(),
+                            None if async_drain_timeout is None else float(async_drain_timeout))
+                        handler.setLevel(target.level)
                     handler.addFilter(config_filter)
+                    handler.addFilter(coalescing_filter)
+                    handler.addFilter(rate_limit_filter)
+                    handler.addFilter(_context_scope_filter)
                     handler.addFilter(context_injection_filter)
                     handlers.append(handler)
+                    live_handlers.append(_LiveHandler(index, handler, target, formatter_key))
+        # forward records to the parent process
+        ring_size = _parse_size(process_config.get('ring_size'), 4 * 1024 * 1024)
+
+        def create_process_handler(address: str) -> logging.Handler:
+            process_handler: logging.Handler = (
+                SharedMemoryHandler(
+                    address,
+                    ring_size,
+                    str(queue_config.get('overflow', 'block')),
+                    None if queue_timeout is None else float(queue_timeout),
+                    str(queue_config.get('drop_level', 'WARNING')).upper())
+                if process_transport == 'shm'
+                else ProcessHandler(address)
+            )
+            process_handler.addFilter(config_filter)
+            process_handler.addFilter(coalescing_filter)
+            process_handler.addFilter(rate_limit_filter)
+            process_handler.addFilter(_context_scope_filter)
+            process_handler.addFilter(context_injection_filter)
+            return process_handler
+        if process_parent is not None:
+            handlers.append(create_process_handler(process_parent))
         # log to stdout if no handlers configured
         if len(handlers) == 0:
             handler = logging.StreamHandler(sys.stdout)
-            if default_bidi_enabled:
-                handler.formatter = BidiFormatter(default_format, datefmt)
-            else:
-                handler.formatter = logging.Formatter(default_format, datefmt)
+            formatter_key = __get_formatter_key(settings, appsettings2.Configuration(), handler)
+            handler.formatter = __get_formatter(formatters, formatter_key)
+            handler.addFilter(_context_scope_filter)
             handlers.append(handler)
+            live_handlers.append(_LiveHandler(-1, handler, handler, formatter_key))
         # init
         logging.basicConfig(
             format=default_format,
@@ -133,6 +523,22 @@ def configure_logging(
             level=default_level,
             force=True
         )
+        __configure_filter_levels(config_filter if filters_mode == 'levels' else None)
+        __clear_logger_caches()
+        __live = _LiveConfiguration(
+            settings,
+            __get_structure(configuration, settings),
+            config_filter,
+            rate_limit_filter,
+            coalescing_filter,
+            formatters,
+            list(handlers),
+            live_handlers)
+        __register_atexit()
+        if process_transport != 'none' and process_parent is None:
+            __start_process_listener(process_config.get('address', None), create_process_handler)
+        if queue_drain == 'thread':
+            __start_drain_thread(None if queue_drain_timeout is None else float(queue_drain_timeout))
         _ = logging.getLogger(__name__)
         return handlers
     else:
@@ -141,10 +547,215 @@ def configure_logging(
         return []
 
 
+def __get_formatter_key(settings: _LiveSettings, handler_config: appsettings2.Configuration, handler: logging.Handler) -> tuple[str, Optional[str], Optional[str], bool]:
+    """Get the formatter configuration of *handler*, handlers with identical formatter configurations share a formatter."""
+    return (
+        str(handler_config.get('formatter', settings.formatter)).lower(),
+        handler_config.get('format', settings.format),
+        settings.datefmt,
+        settings.bidi
+        and isinstance(handler, logging.StreamHandler)
+        and handler.stream is sys.stdout)
+
+
+def __get_formatter(
+    formatters: dict[tuple[str, Optional[str], Optional[str], bool], logging.Formatter],
+    formatter_key: tuple[str, Optional[str], Optional[str], bool]
+) -> logging.Formatter:
+    formatter = formatters.get(formatter_key)
+    if formatter is None:
+        formatter = _create_formatter(*formatter_key)
+        formatters[formatter_key] = formatter
+    return formatter
+
+
+def __get_structure(configuration: appsettings2.Configuration, settings: _LiveSettings) -> dict[str, Any]:
+    """Get the settings of *configuration* which cannot be applied to live handlers and filters, such as the handlers which are configured."""
+    logging_config = configuration.get('logging')
+    values = logging_config.toDictionary() if isinstance(logging_config, appsettings2.Configuration) else {}
+    structure = {
+        k.lower(): v
+        for k, v in values.items()
+        if k.lower() not in __RECONFIGURABLE_SETTINGS
+    }
+    # NOTE: a "file" handler with the "binary" formatter is a different kind of handler
+    structure['handlers'] = [
+        (
+            {
+                k.lower(): v
+                for k, v in handler_config.toDictionary().items()
+                if k.lower() not in __RECONFIGURABLE_HANDLER_SETTINGS
+            },
+            str(handler_config.get('type')).lower() == 'file' and str(handler_config.get('formatter', settings.formatter)).lower() == 'binary'
+        )
+        for handler_config in configuration.get('logging__handlers') or []
+    ]
+    return structure
+
+
+def reconfigure(configuration: Optional[dict[str, Any] | appsettings2.Configuration] = None) -> list[logging.Handler]:
+    """
+    Apply *configuration* to the live logging configuration, changing only the settings which changed.
+
+    Filter rules (``filters``, ``filters_mode``, ``filters_summary_interval`` and ``coalesce``) are replaced atomically, and the root level, handler levels and formatters (``level``, ``format``, ``formatter``, ``datefmt`` and ``bidi``) are changed in place, so handlers are not closed, log files are not reopened, and queued records are kept. A change to any other setting (such as adding a handler, or changing the ``path`` of a handler) is applied via ``configure_logging(configuration, force=True)``, as is a configuration applied before logging was configured.
+
+    :param configuration: The configuration object to pull logging settings from. Omit to apply defaults.
+    :return: A list of handlers which are configured.
+    """
+    global __allow_queued_logger
+    if configuration is not None:
+        if isinstance(configuration, dict):
+            configuration = appsettings2.Configuration.fromDictionary(configuration)
+    else:
+        configuration = appsettings2.Configuration()
+    with __reconfigure_lock:
+        live = __live
+        settings = _LiveSettings(configuration)
+        structure = __get_structure(configuration, settings)
+        if live is None or structure != live.structure:
+            return configure_logging(configuration, force=True)
+        previous = live.settings
+        if settings.allow_queued_logger != previous.allow_queued_logger:
+            __allow_queued_logger = settings.allow_queued_logger
+            __clear_logger_caches()
+        if settings.filters != previous.filters:
+            live.config_filter.configure(settings.filters)
+        if settings.filters != previous.filters or settings.summary_interval != previous.summary_interval:
+            live.rate_limit_filter.configure(settings.filters, settings.summary_interval)
+        if settings.coalesce != previous.coalesce:
+            live.coalescing_filter.configure(*settings.coalesce)
+        is_level_changed = settings.filters != previous.filters or settings.filters_mode != previous.filters_mode
+        level = getattr(logging, settings.level)
+        if logging.root.level != level:
+            logging.root.setLevel(level)
+            is_level_changed = True
+        handler_configs = configuration.get('logging__handlers') or []
+        for e in live.live_handlers:
+            handler_config = handler_configs[e.index] if e.index >= 0 else appsettings2.Configuration()
+            if e.index >= 0:
+                level = getattr(logging, handler_config.get('level', settings.level).upper())
+                if e.handler.level != level:
+                    e.handler.setLevel(level)
+                    e.target.setLevel(level)
+                    is_level_changed = True
+            if e.formatter_key is not None:
+                formatter_key = __get_formatter_key(settings, handler_config, e.target)
+                if formatter_key != e.formatter_key:
+                    # NOTE: records being formatted concurrently are formatted by either the old or the new formatter
+                    e.target.formatter = __get_formatter(live.formatters, formatter_key)
+                    e.formatter_key = formatter_key
+        if is_level_changed:
+            __configure_filter_levels(live.config_filter if settings.filters_mode == 'levels' else None)
+        live.settings = settings
+        return list(live.handlers)
+
+
+def start_config_watch(filename: str, interval: float = 1.0, loader: Optional[Callable[[], appsettings2.Configuration]] = None) -> None:
+    """
+    Watch a configuration file, applying it via :function:``reconfigure`` when it changes.
+
+    The modification time (and size) of the file is polled by a background thread, the file is only loaded when it changes.
+
+    :param filename: The path of the configuration file (json, toml or yaml.)
+    :param interval: The number of seconds between polls, defaults to 1.0.
+    :param loader: (OPTIONAL) A function which loads the configuration, such as one which also applies environment variables. Default loads *filename* only.
+    """
+    global __config_watch_thread
+    stop_config_watch()
+    watch_thread = _ConfigWatchThread(
+        filename,
+        interval,
+        (lambda: _load_configuration(filename)) if loader is None else loader)
+    __config_watch_thread = watch_thread
+    watch_thread.start()
+
+
+def stop_config_watch() -> None:
+    """Stop watching the configuration file watched via :function:``start_config_watch``, if any."""
+    global __config_watch_thread
+    watch_thread = __config_watch_thread
+    __config_watch_thread = None
+    if watch_thread is not None:
+        watch_thread.stop()
+
+
+def __get_configured_level(logger: logging.Logger) -> int:
+    """Get the effective level of *logger* ignoring levels pushed down by :function:``__configure_filter_levels``, the level it would have in ``filter`` mode."""
+    current: Optional[logging.Logger] = logger
+    while current is not None:
+        level = __filter_levels_restore.get(current.name, current.level) if current is not logging.root else current.level
+        if level != logging.NOTSET:
+            return level
+        current = current.parent
+    return logging.NOTSET
+
+
+def __apply_filter_level(logger: logging.Logger, level: int | str = logging.NOTSET) -> None:
+    config_filter = __filter_levels
+    if config_filter is None or logger is logging.root:
+        return
+    if level != logging.NOTSET:
+        # NOTE: a level set by the caller replaces the level which would be restored
+        __filter_levels_restore.pop(logger.name, None)
+    # NOTE: the threshold applied by a handler in `filter` mode, a descendant of a matched logger (which is not matched itself) must not inherit its threshold
+    threshold = max(__get_configured_level(logger), config_filter.get_level(logger.name))
+    if threshold != logger.getEffectiveLevel():
+        __filter_levels_restore.setdefault(logger.name, logger.level)
+        logger.setLevel(threshold)
+
+
+def __configure_filter_levels(config_filter: Optional[ConfigFilter]) -> None:
+    """
+    Push the thresholds of *config_filter* down into Logger levels, so that suppressed records are rejected by ``isEnabledFor`` before a record is ever constructed.
+
+    Levels previously pushed down are restored first, passing ``None`` only restores them. Loggers created later are assigned a level when resolved via :function:``get_logger`` or :function:``get_queued_logger``.
+    """
+    global __filter_levels
+    __filter_levels = None
+    manager = logging.Logger.manager
+    for name, level in __filter_levels_restore.items():
+        logger = manager.loggerDict.get(name, None)
+        if isinstance(logger, logging.Logger):
+            logger.setLevel(level)
+    __filter_levels_restore.clear()
+    if config_filter is None:
+        return
+    __filter_levels = config_filter
+    # NOTE: parents are visited before children so inherited levels are considered
+    for name in sorted(list(manager.loggerDict.keys()), key=lambda e: e.count('.')):
+        logger = manager.loggerDict.get(name, None)
+        if isinstance(logger, logging.Logger):
+            __apply_filter_level(logger)
+
+
+def __get_caller_name(depth: int) -> Optional[str]:
+    """Get the module name of the caller *depth* frames above the caller of this function, cached per code object."""
+    try:
+        frame = sys._getframe(depth + 1)
+    except ValueError:
+        return None
+    code = frame.f_code
+    try:
+        return __caller_names[code]
+    except KeyError:
+        name = cast(Optional[str], frame.f_globals.get('__name__', None))
+        if len(__caller_names) >= __CACHE_SIZE:
+            __caller_names.clear()
+        __caller_names[code] = name
+        return name
+
+
+def __clear_logger_caches() -> None:
+    __caller_names.clear()
+    __loggers.clear()
+
+
 def get_logger(name: Optional[str] = None, level: int | str = logging.NOTSET, allow_queued_logger: bool | None = None) -> logging.Logger:
     """
     Similar to Python's own ``logging.getLogger(...)`` except this function attempts to resolve the name of the calling module when no name has been provided.
 
+    Loggers are memoized by name, queued-ness, and level. Repeated calls return the same instance without re-applying *level*.
+
     :param str name: (OPTIONAL) The name for the logger instance. When not provided an attempt will be made to resolve the name of the calling module. Default is ``None``.
     :param int|str level: (OPTIONAL) The default logging Level for the Logger. Default is ```NOTSET```.
     :returns: A ``logging.Logger`` instance.
@@ -152,32 +763,24 @@ def get_logger(name: Optional[str] = None, level: int | str = logging.NOTSET, al
     if allow_queued_logger is None:
         allow_queued_logger = __allow_queued_logger
     if name is None:
-        try:
-            import inspect
-            f = inspect.currentframe()
-            name = (
-                None
-                if f is None or f.f_back is None
-                else (
-                    f.f_globals.get('__name__', None)
-                    if f.f_back is None
-                    else f.f_back.f_globals.get('__name__', None)
-                )
-            )
-        except Exception:
-            pass  # NOP
-    logger: logging.Logger
-    if allow_queued_logger is not False and threading.current_thread() is not threading.main_thread():
-        logger = get_queued_logger(name)
-    elif __original_get_logger is not None:
-        logger = __original_get_logger(name)
-    else:
-        logger = logging.getLogger(name)
-    ctx = _CIF_contextvar.get()
-    if ctx is not None:
-        logger.addFilter(ctx)
-    if level != logging.NOTSET:
-        logger.setLevel(level)
+        name = __get_caller_name(1)
+    is_queued = allow_queued_logger is not False and threading.get_ident() != threading.main_thread().ident
+    key = (name, is_queued, level)
+    logger = __loggers.get(key, None)
+    if logger is None:
+        if is_queued:
+            logger = __get_queued_logger(name)
+        elif __original_get_logger is not None:
+            logger = __original_get_logger(name)
+        else:
+            logger = logging.getLogger(name)
+        if level != logging.NOTSET:
+            logger.setLevel(level)
+        if not is_queued:
+            __apply_filter_level(logger, level)
+        if len(__loggers) >= __CACHE_SIZE:
+            __loggers.clear()
+        __loggers[key] = logger
     return logger
 
 
@@ -187,50 +790,243 @@ def __get_queued_logger(name: Optional[str] = None, level: int | str = logging.N
             logger = __original_get_logger(name)
         else:
             logger = logging.getLogger(name)
-    elif name is None:
-        try:
-            import inspect
-            f = inspect.currentframe()
-            name = (
-                None if f is None or f.f_back is None else
-                f.f_back.f_globals.get('__name__', None) if f.f_back.f_back is None else
-                f.f_back.f_back.f_globals.get('__name__', None)
-            )
-        except Exception:
-            pass  # NOP
-    logger = logging.Logger(cast(str, name), level)
-    logger.addHandler(QueuedHandler())
-    return logger
+        if level != logging.NOTSET:
+            logger.setLevel(level)
+        __apply_filter_level(logger, level)
+        return logger
+    queued_logger = __queued_loggers.get(name, None)
+    if queued_logger is None:
+        queued_logger = __queued_loggers.setdefault(name, _QueuedLogger(name, __queued_handler))
+        if name is not None:
+            # NOTE: a queued logger defers to the level of the same name in the logger hierarchy
+            __apply_filter_level(logging.Logger.manager.getLogger(name))
+    if level != logging.NOTSET:
+        queued_logger.setLevel(level)
+    return queued_logger
 
 
 def get_queued_logger(name: Optional[str] = None, level: int | str = logging.NOTSET) -> logging.Logger:
     """
     Similar to Python's own ``logging.getLogger(...)`` except this function provides a bare-bones Logger that is only configured to forward logging Records to a :py:class:`~hanaro.QueuedHandler` (intentionally bypassing the rest of the logging system).
 
+    Queued loggers are kept in a registry keyed by name and share a single :py:class:`~hanaro.QueuedHandler`. Unless *level* is specified, a queued logger respects the level configured for the same name in the logger hierarchy.
+
     :param str name: (OPTIONAL) The name for the logger instance. When not provided an attempt will be made to resolve the name of the calling module. Default is ``None``.
     :param int|str level: (OPTIONAL) The default logging Level for the Logger. Default is ```NOTSET```.
     :returns: A ``logging.Logger`` instance that only has a :py:class:`~hanaro.QueuedHandler` configured.
     """
+    if name is None:
+        name = __get_caller_name(1)
     return __get_queued_logger(name, level)
 
 
-def handle_queued_log_records() -> None:
+def _output_queued_log_records(max_records: Optional[int], max_seconds: Optional[float]) -> None:
+    """Output queued log records using the root logger, in batches, within the specified budgets."""
+    queue = QueuedHandler.get_queue()
+    call_handlers = logging.root.callHandlers
+    deadline = None if max_seconds is None else time.monotonic() + max_seconds
+    remaining = max_records
+    while remaining is None or remaining > 0:
+        batch = queue.get_many(
+            __DRAIN_BATCH_SIZE
+            if remaining is None
+            else min(remaining, __DRAIN_BATCH_SIZE))
+        if len(batch) == 0:
+            break
+        for log_record in batch:
+            call_handlers(log_record)
+        if remaining is not None:
+            remaining -= len(batch)
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+
+
+def __start_drain_thread(timeout: Optional[float]) -> None:
+    global __drain_thread, __drain_timeout
+    stop_async_drain()
+    __drain_timeout = timeout
+    __drain_thread = _QueueDrainThread()
+    __drain_thread.start()
+    __register_atexit()
+
+
+def __register_atexit() -> None:
+    global __is_atexit_registered
+    if not __is_atexit_registered:
+        # NOTE: registered after `logging` registers its own shutdown, so this runs first
+        atexit.register(__shutdown)
+        __is_atexit_registered = True
+
+
+def __shutdown() -> None:
+    """Receive records still being sent by other processes, then output all queued records, and the records held by filters."""
+    listener = __process_listener
+    __stop_process_listener()
+    if listener is not None:
+        listener.join(__drain_timeout)
+    __stop_drain_thread()
+    __flush_live_filters()
+
+
+def __flush_live_filters() -> None:
+    """Log the repeats of open coalescing windows, and a summary of suppressed records, via the live handlers, such as before they are replaced."""
+    live = __live
+    if live is not None:
+        # NOTE: repeats are logged first, they may be rate limited themselves
+        live.coalescing_filter.flush()
+        live.rate_limit_filter.summarize()
+
+
+def __stop_drain_thread() -> None:
+    global __drain_thread
+    drain_thread = __drain_thread
+    __drain_thread = None
+    if drain_thread is not None:
+        drain_thread.stop(__drain_timeout)
+
+
+def __get_process_parent() -> Optional[str]:
+    """Get the address of a :class:``ProcessListener`` started by a parent process, if any."""
+    value = os.environ.get(__PROCESS_ADDRESS_VARIABLE, None)
+    if value is None:
+        return None
+    pid, _, address = value.partition(':')
+    if pid == str(os.getpid()):
+        return None
+    return address
+
+
+def __start_process_listener(address: Optional[str], handler_factory: Callable[[str], logging.Handler]) -> None:
+    global __process_listener, __process_handler_factory, __is_process_fork_registered
+    listener = ProcessListener(address)
+    __process_listener = listener
+    __process_handler_factory = handler_factory
+    # NOTE: inherited by spawned processes (`multiprocessing` spawn/forkserver, `subprocess`, etc.)
+    os.environ[__PROCESS_ADDRESS_VARIABLE] = f'{os.getpid()}:{listener.address}'
+    if not __is_process_fork_registered and hasattr(os, 'register_at_fork'):
+        os.register_at_fork(after_in_child=__after_fork_in_child)
+        __is_process_fork_registered = True
+    __register_atexit()
+
+
+def __stop_process_listener() -> None:
+    global __process_listener
+    listener = __process_listener
+    __process_listener = None
+    if listener is not None:
+        os.environ.pop(__PROCESS_ADDRESS_VARIABLE, None)
+        listener.close()
+
+
+def __after_fork_in_child() -> None:
+    """Forward records of a forked child process (such as a prefork server worker) to the :class:``ProcessListener`` of its parent."""
+    global __process_listener, __drain_thread, __async_drain
+    listener = __process_listener
+    handler_factory = __process_handler_factory
+    if listener is None or handler_factory is None:
+        return
+    __process_listener = None
+    QueuedHandler.get_queue()._at_fork_reinit()
+    __async_drain = None
+    handler = handler_factory(listener.address)
+    live = __live
+    if live is not None:
+        # NOTE: filters remain live, the inherited handlers do not
+        live.handlers = [handler]
+        live.live_handlers = []
+    root = logging.root
+    for inherited_handler in list(root.handlers):
+        # NOTE: inherited handlers are removed without being closed, their output belongs to the parent process
+        root.removeHandler(inherited_handler)
+    root.addHandler(handler)
+    if __drain_thread is not None:
+        __drain_thread = None
+        __start_drain_thread(__drain_timeout)
+
+
+def handle_queued_log_records(max_records: Optional[int] = None, max_seconds: Optional[float] = None) -> int:
     """
-    Output all queued log records using the root logger.
+    Output queued log records using the root logger.
 
     This is a QOL function for devs using `get_queued_logger`.
 
     ```python
     while not exitProgram:
         doProgramLogic()
-        hanaro.handle_queued_log_records()
+        hanaro.handle_queued_log_records(max_seconds=0.005)
         # (consider signal or sleep to play nice with CPU)
     ```
 
-    This function must be called on the main thread. Calling from any other thread will have undefined behavior and is not supported.
+    Records are taken from the queue in batches (one lock acquisition per batch.) Without a budget all queued records are output, with a budget the call returns once either budget is exhausted, allowing an application loop to bound the time spent logging.
+
+    This function must be called on the main thread. Calling from any other thread will have undefined behavior and is not supported. When the ``thread`` drain mode is configured queued records are output by a dedicated writer thread, and this function does nothing.
+
+    :param int max_records: (OPTIONAL) The maximum number of records to output. Default is ``None`` (no limit.)
+    :param float max_seconds: (OPTIONAL) The maximum number of seconds to spend outputting records, checked between batches. Default is ``None`` (no limit.)
+    :returns: The number of records still queued.
+    """
+    if __drain_thread is None:
+        _output_queued_log_records(max_records, max_seconds)
+    return QueuedHandler.get_queue().qsize()
+
+
+def start_async_drain(loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+    """
+    Output queued log records from an asyncio event loop, without polling.
+
+    Producers wake the event loop via ``loop.call_soon_threadsafe(...)`` only when a record is put into an empty Log Queue, the event loop then outputs records in batches (yielding to other callbacks between batches.) When the Log Queue is idle no work is performed at all.
+
+    :param loop: (OPTIONAL) The event loop to output queued log records from. Default is the running event loop.
+    """
+    global __async_drain
+    if __drain_thread is not None:
+        raise RuntimeError('Queued log records are already being output by a drain thread.')
+    loop = asyncio.get_running_loop() if loop is None else loop
+    stop_async_drain()
+    queue = QueuedHandler.get_queue()
+
+    def drain() -> None:
+        _output_queued_log_records(__DRAIN_BATCH_SIZE, None)
+        if queue.qsize() > 0:
+            loop.call_soon(drain)
+
+    def wake() -> None:
+        try:
+            loop.call_soon_threadsafe(drain)
+        except RuntimeError:
+            # NOTE: the event loop was closed without calling `stop_async_drain()`
+            queue.remove_waker(wake)
+    __async_drain = (loop, wake)
+    queue.add_waker(wake)
+    if queue.qsize() > 0:
+        wake()
+
+
+def stop_async_drain() -> None:
+    """
+    Stop outputting queued log records from an asyncio event loop, see ``start_async_drain(...)``.
+
+    Records still queued remain in the Log Queue, for example to be output by ``await drain_async()``.
+    """
+    global __async_drain
+    async_drain = __async_drain
+    __async_drain = None
+    if async_drain is not None:
+        QueuedHandler.get_queue().remove_waker(async_drain[1])
+
+
+async def drain_async() -> None:
+    """
+    Output all queued log records using the root logger, yielding to the event loop between batches.
+
+    This function must be called from the same event loop passed to ``start_async_drain(...)`` (if any.)
     """
-    while (log_record := QueuedHandler.get_log_record()) is not None:
-        logging.root.callHandlers(log_record)
+    if __drain_thread is not None:
+        return
+    queue = QueuedHandler.get_queue()
+    while queue.qsize() > 0:
+        _output_queued_log_records(__DRAIN_BATCH_SIZE, None)
+        await asyncio.sleep(0)
 
 
 def patch_logging() -> None:
@@ -241,6 +1037,7 @@ def patch_logging() -> None:
     if __original_get_logger is None:
         __original_get_logger = logging.getLogger
         logging.getLogger = get_logger
+        __clear_logger_caches()
 
 
 ############################
@@ -266,10 +1063,16 @@ handleQueuedLogRecords = handle_queued_log_records  # noqa: N816
 
 __all__ = [
     'configure_logging',
+    'drain_async',
     'get_logger',
     'get_queued_logger',
     'handle_queued_log_records',
     'patch_logging',
+    'reconfigure',
+    'start_async_drain',
+    'start_config_watch',
+    'stop_async_drain',
+    'stop_config_watch',
     # deprecated exports (since 1.0.0)
     'configureLogging',
     'getLogger',
@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+import threading
+import time
+from hanaro import BackgroundHandler
+from punit import fact
+from tests.fakes import CapturingHandler
+
+
+class SlowHandler(logging.Handler):
+    """A handler which stalls for every record, such as a handler for an unresponsive network service."""
+
+    def __init__(self, delay: float) -> None:
+        super().__init__()
+        self.delay = delay
+        self.records = list[logging.LogRecord]()
+        self.thread_names = set[str]()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        time.sleep(self.delay)
+        self.thread_names.add(threading.current_thread().name)
+        self.records.append(record)
+
+
+@fact
+def background_handler_dispatches_records_in_order_from_its_own_thread() -> None:
+    """Assert :class:``BackgroundHandler`` dispatches records, in order, from a dedicated thread, and that ``flush()`` waits for queued records."""
+    target = SlowHandler(0)
+    handler = BackgroundHandler(target)
+    try:
+        logger = logging.Logger('test_background_handler', logging.DEBUG)
+        logger.addHandler(handler)
+        for i in range(0, 1000):
+            logger.info('record %d', i)
+        handler.flush()
+        assert handler.qsize() == 0
+        assert [e.getMessage() for e in target.records] == [f'record {i}' for i in range(0, 1000)]
+        assert target.thread_names == {'hanaro.BackgroundHandler'}
+    finally:
+        handler.close()
+
+
+@fact
+def background_handler_isolates_slow_handlers() -> None:
+    """Assert a slow handler does not stall the emitting thread (or other handlers), only its own queue applies backpressure."""
+    slow = SlowHandler(0.2)
+    handler = BackgroundHandler(slow, 2, 'drop_newest')
+    fast = SlowHandler(0)
+    try:
+        logger = logging.Logger('test_background_handler_isolation', logging.DEBUG)
+        logger.addHandler(handler)
+        logger.addHandler(fast)
+        started = time.monotonic()
+        for i in range(0, 10):
+            logger.info('record %d', i)
+        assert time.monotonic() - started < 1.0
+        assert len(fast.records) == 10
+        assert handler.drop_counts.get('drop_newest', 0) >= 7
+    finally:
+        handler.close()
+    assert handler.qsize() == 0
+    dropped = handler.drop_counts['drop_newest']
+    messages = [e.getMessage() for e in slow.records]
+    assert len([e for e in messages if e.startswith('record ')]) == 10 - dropped
+    assert messages[-1].endswith(' records dropped (drop_newest=' + messages[-1].split(' ')[0] + ')')
+
+
+@fact
+def configure_logging_wraps_async_handlers() -> None:
+    """Assert :function:``configure_logging`` wraps handlers configured with ``"async": true`` in a :class:``BackgroundHandler``, applying the ``queue`` settings of the handler."""
+    import hanaro
+    try:
+        handlers = hanaro.configure_logging({
+            'logging': {
+                'handlers': [
+                    {'type': 'custom', 'class': 'tests.fakes.CapturingHandler', 'level': 'INFO', 'async': True, 'queue': {'max_size': 16, 'overflow': 'drop_oldest'}},
+                    {'type': 'console'}
+                ]
+            }
+        }, force=True)
+        assert len(handlers) == 2
+        handler = handlers[0]
+        assert isinstance(handler, BackgroundHandler)
+        assert isinstance(handler.handler, CapturingHandler)
+        assert handler.level == logging.INFO
+        assert handler.queue.max_size == 16
+        assert handler.queue.overflow == 'drop_oldest'
+        assert not isinstance(handlers[1], BackgroundHandler)
+        CapturingHandler.records.clear()
+        logging.getLogger('test_async_handler').info('async')
+        logging.getLogger('test_async_handler').debug('filtered')
+        handler.flush()
+        assert [e.getMessage() for e in CapturingHandler.records] == ['async']
+    finally:
+        hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
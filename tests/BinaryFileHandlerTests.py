@@ -0,0 +1,107 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import contextlib
+import io
+import json
+import logging
+import os
+import tempfile
+from hanaro import BinaryFileHandler
+from hanaro.decode import main as decode_main
+from punit import fact
+
+
+def decode(*argv: str) -> list[str]:
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        assert decode_main(list(argv)) == 0
+    return output.getvalue().splitlines()
+
+
+@fact
+def binary_file_handler_rotates_self_contained_log_files() -> None:
+    """Assert the handler rotates log files when they would exceed *max_bytes*, and that each log file decodes on its own."""
+    with tempfile.TemporaryDirectory() as path:
+        filename = os.path.join(path, 'test.log')
+        handler = BinaryFileHandler(filename, 1000, 3)
+        try:
+            logger = logging.Logger('test_binary_rotation', logging.DEBUG)
+            logger.addHandler(handler)
+            for i in range(0, 500):
+                logger.info('record %03d', i)
+        finally:
+            handler.close()
+        assert sorted(os.listdir(path)) == ['test.log', 'test.log.1', 'test.log.2', 'test.log.3']
+        messages = []
+        for name in ('test.log.3', 'test.log.2', 'test.log.1', 'test.log'):
+            assert 0 < os.path.getsize(os.path.join(path, name)) <= 1000
+            messages.extend([e.getMessage() for e in BinaryFileHandler.read(os.path.join(path, name))])
+        assert messages == [f'record {i:03d}' for i in range(500 - len(messages), 500)]
+
+
+@fact
+def binary_file_handler_appends_to_existing_log_file() -> None:
+    """Assert a log file opened for appending starts a new session of definitions, and decodes as one log."""
+    with tempfile.TemporaryDirectory() as path:
+        filename = os.path.join(path, 'test.log')
+        for session in range(0, 2):
+            handler = BinaryFileHandler(filename)
+            try:
+                logger = logging.Logger(f'test_binary_append_{session}', logging.DEBUG)
+                logger.addHandler(handler)
+                logger.info('session %d', session)
+            finally:
+                handler.close()
+        assert [e.getMessage() for e in BinaryFileHandler.read(filename)] == ['session 0', 'session 1']
+        assert [e.name for e in BinaryFileHandler.read(filename)] == ['test_binary_append_0', 'test_binary_append_1']
+
+
+@fact
+def decode_renders_configured_format() -> None:
+    """Assert ``python -m hanaro.decode`` renders a binary log file in the format configured for the handler which wrote it, identically to formatting when logged."""
+    import hanaro
+    with tempfile.TemporaryDirectory() as path:
+        configuration = {
+            'logging': {
+                'format': '%(levelname)s %(message)s',
+                'datefmt': '%Y-%m-%dT%H:%M:%S',
+                'handlers': [
+                    {'type': 'file', 'path': path, 'name': 'binary.log', 'formatter': 'binary', 'format': '[%(asctime)s] %(message)s level=%(levelname)s source=%(name)s %(metadata)s'},
+                    {'type': 'file', 'path': path, 'name': 'text.log', 'format': '[%(asctime)s] %(message)s level=%(levelname)s source=%(name)s %(metadata)s'}
+                ]
+            }
+        }
+        config_filename = os.path.join(path, 'appsettings.json')
+        with open(config_filename, 'w') as file:
+            json.dump(configuration, file)
+        try:
+            handlers = hanaro.configure_logging(configuration, force=True)
+            assert isinstance(handlers[0], BinaryFileHandler)
+            assert not isinstance(handlers[1], BinaryFileHandler)
+            logger = logging.getLogger('test_binary_decode')
+            with hanaro.ContextInjectionFilter({'request_id': 'abc'}, is_metadata=True):
+                logger.info('hello %s', 'world')
+            logger.warning('done')
+        finally:
+            hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
+        with open(os.path.join(path, 'text.log'), encoding='utf-8') as file:
+            expected = file.read().splitlines()
+        assert len(expected) == 2
+        assert decode('--config', config_filename, os.path.join(path, 'binary.log')) == expected
+        assert decode('--format', '%(levelname)s %(message)s', os.path.join(path, 'binary.log')) == ['INFO hello world', 'WARNING done']
+        assert json.loads(decode('--formatter', 'json', '--format', '%(message)s %(metadata)s', os.path.join(path, 'binary.log'))[0]) == {'message': 'hello world', 'request_id': 'abc'}
+
+
+@fact
+def configure_logging_rejects_binary_for_other_handlers() -> None:
+    """Assert the ``binary`` formatter is rejected for handlers which are not ``file`` handlers."""
+    import hanaro
+    try:
+        hanaro.configure_logging({'logging': {'handlers': [{'type': 'console', 'formatter': 'binary'}]}}, force=True)
+    except ValueError as ex:
+        assert 'binary' in str(ex)
+        return
+    finally:
+        hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
+    assert False, 'expected ValueError'
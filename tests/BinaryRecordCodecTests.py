@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+import sys
+from hanaro import BinaryRecordCodec, ContextInjectionFilter
+from punit import fact
+
+
+ALL_FIELDS_FORMAT = (
+    '%(asctime)s.%(msecs)03d %(levelname)s %(levelno)d %(name)s %(pathname)s %(filename)s %(module)s '
+    '%(funcName)s %(lineno)d %(process)d %(processName)s %(thread)d %(threadName)s %(message)s %(metadata)s'
+)
+
+
+def encode_all(records: list[logging.LogRecord], codec: BinaryRecordCodec | None = None) -> bytes:
+    codec = BinaryRecordCodec() if codec is None else codec
+    return BinaryRecordCodec.HEADER + codec.reset() + b''.join([codec.encode(e) for e in records])
+
+
+@fact
+def decoded_records_format_identically() -> None:
+    """Assert decoded records format identically to the records they were encoded from, with ``args`` as they were logged."""
+    records = []
+    for i, args in enumerate([('wörld', -1, 1.5, True, None), ('x' * 200, 2 ** 70, float('inf'), False, ''), (object(),), ()]):
+        record = logging.LogRecord('test.binary', logging.INFO + i, '/path/to/file.py', 42 + i, 'hello' + ' %r' * len(args), args, None, 'fn')
+        record.created += i * 0.0015
+        record.relativeCreated += i * 1.5
+        record.msecs = int((record.created - int(record.created)) * 1000) + 0.0
+        ContextInjectionFilter({'request_id': f'abc-{i % 2}', 'user': 'someone'}, is_metadata=True).filter(record)
+        records.append(record)
+    formatter = logging.Formatter(ALL_FIELDS_FORMAT)
+    decoded = list(BinaryRecordCodec.decode(encode_all(records)))
+    assert len(decoded) == len(records)
+    for expected, actual in zip(records, decoded):
+        assert formatter.format(actual) == formatter.format(expected), f'expected:"{formatter.format(expected)}", actual:"{formatter.format(actual)}"'
+        assert actual.__dict__['_metadata_fields'] == expected.__dict__['_metadata_fields']
+        # NOTE: timestamps (and the start time) are encoded in microseconds, each rounded by up to a microsecond
+        assert abs(actual.created - expected.created) < 0.000002
+        assert abs(actual.relativeCreated - expected.relativeCreated) < 0.003
+    assert decoded[0].args == records[0].args
+    # NOTE: an argument which is not a primitive is interpolated when encoded
+    assert decoded[2].args == () and decoded[2].msg == records[2].getMessage()
+
+
+@fact
+def records_refer_to_definitions() -> None:
+    """Assert strings, call sites, threads and context are defined once, such that a repeated record is encoded in a few bytes."""
+    codec = BinaryRecordCodec()
+    codec.reset()
+    record = logging.LogRecord('test.binary.interned', logging.INFO, __file__, 1, 'record %d of the same call site', (1,), None, 'fn')
+    ContextInjectionFilter({'request_id': 'abc'}, is_metadata=True).filter(record)
+    first = codec.encode(record)
+    second = codec.encode(record)
+    assert len(second) < 16, f'expected a compact record, actual: {len(second)} bytes'
+    assert len(first) > len(second) + len('record %d of the same call site')
+
+
+@fact
+def mutated_extra_dicts_are_encoded_by_content() -> None:
+    """Assert a dict passed as ``extra`` which is reused (and mutated) between records is encoded by its content, rather than by its identity."""
+    codec = BinaryRecordCodec()
+    data = [BinaryRecordCodec.HEADER, codec.reset()]
+    context: dict[str, object] = {}
+    expected = list[dict[str, object]]()
+    for value in (0, 1, True, 1, 2):
+        context['n'] = value
+        record = logging.LogRecord('test.binary.context', logging.INFO, __file__, 1, 'msg', None, None, None)
+        record.context = context
+        data.append(codec.encode(record))
+        expected.append({'n': value})
+    decoded = list(BinaryRecordCodec.decode(b''.join(data)))
+    actual = [getattr(e, 'context') for e in decoded]
+    # NOTE: `True == 1`, the types of values are compared
+    assert [[(k, type(v), v) for k, v in e.items()] for e in actual] == [[(k, type(v), v) for k, v in e.items()] for e in expected], actual
+
+
+@fact
+def encoder_resets_when_definitions_are_exhausted() -> None:
+    """Assert the encoder starts a new session of definitions when *max_definitions* is reached, which the decoder follows."""
+    codec = BinaryRecordCodec(max_definitions=8)
+    records = [logging.LogRecord(f'test.binary.{i}', logging.INFO, __file__, i, f'not a format string {i}', None, None, None) for i in range(0, 50)]
+    decoded = list(BinaryRecordCodec.decode(encode_all(records, codec)))
+    assert [e.getMessage() for e in decoded] == [e.getMessage() for e in records]
+    assert [e.name for e in decoded] == [e.name for e in records]
+
+
+@fact
+def decode_ignores_partially_written_last_entry() -> None:
+    """Assert a log truncated mid-entry (such as when a process crashed) decodes every complete record."""
+    records = [logging.LogRecord('test.binary', logging.INFO, __file__, 1, 'record %d', (i,), None, None) for i in range(0, 10)]
+    data = encode_all(records)
+    for length in range(len(data) - 1, len(data) - 8, -1):
+        decoded = list(BinaryRecordCodec.decode(data[:length]))
+        assert [e.getMessage() for e in decoded] == [f'record {i}' for i in range(0, len(decoded))]
+        assert len(decoded) == 9
+
+
+@fact
+def encode_renders_exceptions_and_stack_info() -> None:
+    """Assert exception info is rendered to text when encoded, and stack info is kept."""
+    try:
+        raise ValueError('boom')
+    except ValueError:
+        record = logging.LogRecord('test.binary', logging.ERROR, __file__, 1, 'failed', None, sys.exc_info(), None, 'stack')
+    decoded = next(BinaryRecordCodec.decode(encode_all([record])))
+    assert decoded.exc_info is None
+    assert decoded.exc_text is not None and 'ValueError: boom' in decoded.exc_text
+    assert decoded.stack_info == 'stack'
+    assert logging.Formatter().format(decoded) == logging.Formatter().format(record)
+
+
+@fact
+def decode_rejects_unknown_files() -> None:
+    """Assert a file which is not a binary log is rejected."""
+    try:
+        list(BinaryRecordCodec.decode(b'[2026-01-01T00:00:00] text log'))
+    except ValueError:
+        return
+    assert False, 'expected ValueError'
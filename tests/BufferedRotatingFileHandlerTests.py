@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import gzip
+import logging
+import lzma
+import os
+import tempfile
+import time
+from hanaro import BufferedRotatingFileHandler
+from punit import fact
+
+
+def read_lines(path: str) -> list[str]:
+    with open(path, encoding='utf-8') as file:
+        return file.read().splitlines()
+
+
+@fact
+def buffered_file_handler_buffers_until_flushed() -> None:
+    """Assert records are buffered until the buffer is flushed, and that records at or above *flush_level* are written immediately."""
+    with tempfile.TemporaryDirectory() as path:
+        filename = os.path.join(path, 'test.log')
+        handler = BufferedRotatingFileHandler(filename, flush_interval=60)
+        try:
+            logger = logging.Logger('test_buffered', logging.DEBUG)
+            logger.addHandler(handler)
+            logger.info('first')
+            logger.info('second')
+            assert read_lines(filename) == []
+            logger.error('third')
+            assert read_lines(filename) == ['first', 'second', 'third']
+            logger.info('fourth')
+            handler.flush()
+            assert read_lines(filename) == ['first', 'second', 'third', 'fourth']
+            logger.info('fifth')
+        finally:
+            handler.close()
+        assert read_lines(filename)[-1] == 'fifth'
+
+
+@fact
+def buffered_file_handler_flushes_on_interval_and_size() -> None:
+    """Assert buffered records are written once *flush_interval* seconds have passed, or once *buffer_size* bytes are buffered."""
+    with tempfile.TemporaryDirectory() as path:
+        filename = os.path.join(path, 'test.log')
+        handler = BufferedRotatingFileHandler(filename, buffer_size=100, flush_interval=0.05)
+        try:
+            logger = logging.Logger('test_buffered_interval', logging.DEBUG)
+            logger.addHandler(handler)
+            logger.info('interval')
+            for _ in range(0, 100):
+                if read_lines(filename) == ['interval']:
+                    break
+                time.sleep(0.01)
+            assert read_lines(filename) == ['interval']
+            handler.setFormatter(logging.Formatter('%(message)s' + ('.' * 99)))
+            logger.info('size')
+            assert len(read_lines(filename)) == 2
+        finally:
+            handler.close()
+
+
+@fact
+def buffered_file_handler_rotates_by_running_byte_count() -> None:
+    """Assert the log file is rotated before it would exceed *max_bytes*, without losing records."""
+    with tempfile.TemporaryDirectory() as path:
+        filename = os.path.join(path, 'test.log')
+        handler = BufferedRotatingFileHandler(filename, 1000, 100, flush_interval=60)
+        try:
+            logger = logging.Logger('test_buffered_rotation', logging.DEBUG)
+            logger.addHandler(handler)
+            for i in range(0, 500):
+                logger.info('record %03d ünïcödé', i)
+        finally:
+            handler.close()
+        filenames = [filename] + [f'{filename}.{i}' for i in range(1, 101) if os.path.exists(f'{filename}.{i}')]
+        assert len(filenames) > 1
+        for e in filenames:
+            assert os.path.getsize(e) < 1000
+        lines = [line for e in reversed(filenames) for line in read_lines(e)]
+        assert lines == [f'record {i:03d} ünïcödé' for i in range(0, 500)]
+
+
+@fact
+def configure_logging_creates_buffered_file_handler() -> None:
+    """Assert :function:``configure_logging`` creates a :class:``BufferedRotatingFileHandler`` for ``file`` handlers configured with a ``buffer_size``."""
+    import hanaro
+    with tempfile.TemporaryDirectory() as path:
+        try:
+            handlers = hanaro.configure_logging({
+                'logging': {
+                    'handlers': [
+                        {'type': 'file', 'path': path, 'name': 'buffered.log', 'buffer_size': '64KiB', 'flush_interval_ms': 50},
+                        {'type': 'file', 'path': path, 'name': 'unbuffered.log'}
+                    ]
+                }
+            }, force=True)
+            assert isinstance(handlers[0], BufferedRotatingFileHandler)
+            assert not isinstance(handlers[1], BufferedRotatingFileHandler)
+        finally:
+            hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
+
+
+@fact
+def buffered_file_handler_compresses_rotated_files() -> None:
+    """Assert rotated log files are shifted and compressed by a background thread, without losing records."""
+    with tempfile.TemporaryDirectory() as path:
+        filename = os.path.join(path, 'test.log')
+        handler = BufferedRotatingFileHandler(filename, 1000, 3, buffer_size=0, compress='gzip')
+        try:
+            logger = logging.Logger('test_buffered_compression', logging.DEBUG)
+            logger.addHandler(handler)
+            for i in range(0, 500):
+                logger.info('record %03d', i)
+        finally:
+            handler.close()
+        assert sorted(os.listdir(path)) == ['test.log', 'test.log.1.gz', 'test.log.2.gz', 'test.log.3.gz']
+        lines = list[str]()
+        for i in range(3, 0, -1):
+            with gzip.open(f'{filename}.{i}.gz', 'rt', encoding='utf-8') as file:
+                lines.extend(file.read().splitlines())
+        lines.extend(read_lines(filename))
+        assert lines == [f'record {i:03d}' for i in range(500 - len(lines), 500)]
+
+
+@fact
+def buffered_file_handler_rotates_by_time() -> None:
+    """Assert the log file is rotated once *rotate_interval* seconds have passed."""
+    with tempfile.TemporaryDirectory() as path:
+        filename = os.path.join(path, 'test.log')
+        handler = BufferedRotatingFileHandler(filename, backup_count=2, buffer_size=0, rotate_interval=0.2, compress='lzma')
+        try:
+            logger = logging.Logger('test_buffered_time_rotation', logging.DEBUG)
+            logger.addHandler(handler)
+            logger.info('before')
+            time.sleep(0.25)
+            logger.info('after')
+        finally:
+            handler.close()
+        with lzma.open(f'{filename}.1.xz', 'rt', encoding='utf-8') as file:
+            assert file.read().splitlines() == ['before']
+        assert read_lines(filename) == ['after']
+
+
+@fact
+def buffered_file_handler_rejects_unsupported_compression() -> None:
+    """Assert :class:``BufferedRotatingFileHandler`` validates the compression."""
+    try:
+        BufferedRotatingFileHandler('unused.log', compress='zip')
+    except ValueError:
+        return
+    assert False, 'expected ValueError'
+
+
+@fact
+def buffered_file_handler_closes_via_logging_shutdown() -> None:
+    """Assert ``logging.shutdown()`` (which holds the handler lock while closing the handler) writes buffered records without waiting on the flush thread."""
+    import subprocess
+    import sys
+    with tempfile.TemporaryDirectory() as path:
+        filename = os.path.join(path, 'test.log')
+        script = '\n'.join([
+            'import hanaro, logging, sys',
+            'handler = hanaro.BufferedRotatingFileHandler(sys.argv[1])',
+            'logger = logging.getLogger("test_buffered_shutdown")',
+            'logger.addHandler(handler)',
+            'logger.warning("shutdown")',
+            'logging.shutdown()',
+        ])
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join([p for p in sys.path if p])
+        result = subprocess.run([sys.executable, '-c', script, filename], capture_output=True, text=True, env=env, timeout=30)
+        assert result.returncode == 0, result.stderr
+        assert read_lines(filename) == ['shutdown']
@@ -0,0 +1,160 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+from hanaro import CoalescingFilter
+from punit import fact
+from tests.fakes import CapturingHandler
+from typing import Any
+
+
+def create_record(msg: str = 'dependency failed: %s', args: Any = ('timeout',), levelno: int = logging.WARNING, created: float = 1000.0) -> logging.LogRecord:
+    record = logging.LogRecord('test.coalesce', levelno, 'pathname', 5, msg, args, None, None, None)
+    record.created = created
+    return record
+
+
+def filter_and_capture(filter: CoalescingFilter, records: list[logging.LogRecord], flush: bool = False) -> list[str]:
+    """Filter *records*, and return the messages of the records which passed the filter along with the records logged in place of repeats."""
+    CapturingHandler.records.clear()
+    logger = logging.getLogger('test.coalesce')
+    handler = CapturingHandler()
+    handler.addFilter(filter)
+    logger.addHandler(handler)
+    logger.propagate = False
+    try:
+        for record in records:
+            logger.handle(record)
+        if flush:
+            filter.flush()
+        return [e.getMessage() for e in CapturingHandler.records]
+    finally:
+        logger.removeHandler(handler)
+        logger.propagate = True
+        CapturingHandler.records.clear()
+
+
+@fact
+def repeats_are_coalesced_until_window_closes() -> None:
+    """Assert the first record passes, repeats within the window are suppressed, and are logged as a single record once the window closes."""
+    filter = CoalescingFilter('coalescing_filter', 1.0)
+    records = [create_record(created=1000.0 + i * 0.1) for i in range(0, 5)]
+    records.append(create_record(args=('refused',), created=1000.5))
+    records.append(create_record(created=1001.5))
+    assert filter_and_capture(filter, records) == [
+        'dependency failed: timeout',
+        'dependency failed: refused',
+        'dependency failed: timeout (repeated 4 times)',
+        'dependency failed: timeout'
+    ]
+
+
+@fact
+def repeats_are_distinguished_by_level_and_args() -> None:
+    """Assert records with a different level or ``args`` are not repeats, and records which cannot be hashed are never coalesced."""
+    filter = CoalescingFilter('coalescing_filter', 1.0)
+    records = [
+        create_record(),
+        create_record(levelno=logging.ERROR),
+        create_record(args=('refused',)),
+        create_record('%(reason)s', ({'reason': ['unhashable']},)),
+        create_record('%(reason)s', ({'reason': ['unhashable']},))
+    ]
+    assert len(filter_and_capture(filter, records, flush=True)) == 5
+
+
+@fact
+def repeats_are_not_matched_by_hash() -> None:
+    """Assert records with different ``args`` whose hashes collide (``hash(-1) == hash(-2)``) are not repeats."""
+    filter = CoalescingFilter('coalescing_filter', 1.0)
+    records = [create_record('retry %d', (-1,)), create_record('retry %d', (-2,))]
+    assert filter_and_capture(filter, records, flush=True) == ['retry -1', 'retry -2']
+
+
+@fact
+def decision_is_made_once_per_record() -> None:
+    """Assert handlers sharing the filter observe the same decision for a record."""
+    filter = CoalescingFilter('coalescing_filter', 1.0)
+    records = [create_record() for _ in range(0, 3)]
+    for _ in range(0, 3):
+        assert [filter.filter(e) for e in records] == [True, False, False]
+
+
+@fact
+def open_windows_are_bounded() -> None:
+    """Assert the oldest window is closed early when *max_size* windows are open, such as during a storm of unique records."""
+    filter = CoalescingFilter('coalescing_filter', 60.0, max_size=4)
+    records = [create_record(), create_record()]
+    records.extend([create_record(args=(str(i),)) for i in range(0, 4)])
+    messages = filter_and_capture(filter, records)
+    assert messages[:2] == ['dependency failed: timeout', 'dependency failed: 0'], messages
+    assert 'dependency failed: timeout (repeated 1 times)' in messages
+    assert len(messages) == 6, messages
+
+
+@fact
+def configure_logging_attaches_coalescing_filter() -> None:
+    """Assert :function:``configure_logging`` coalesces repeated records according to the ``coalesce`` section."""
+    import hanaro
+    CapturingHandler.records.clear()
+    try:
+        handlers = hanaro.configure_logging({
+            'logging': {
+                'coalesce': {'window': '1m'},
+                'handlers': [
+                    {'type': 'custom', 'class': 'tests.fakes.CapturingHandler'},
+                    {'type': 'custom', 'class': 'tests.fakes.CapturingHandler'}
+                ]
+            }
+        }, force=True)
+        logger = logging.getLogger('test.coalesce.configured')
+        for _ in range(0, 10):
+            logger.warning('storm')
+        coalescing_filter = [e for e in handlers[0].filters if isinstance(e, CoalescingFilter)][0]
+        coalescing_filter.flush()
+        messages = [e.getMessage() for e in CapturingHandler.records]
+    finally:
+        hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
+        CapturingHandler.records.clear()
+    assert messages == ['storm', 'storm', 'storm (repeated 9 times)', 'storm (repeated 9 times)'], messages
+
+
+@fact
+def repeats_are_logged_when_filter_is_replaced() -> None:
+    """Assert :function:``configure_logging`` logs the repeats of open windows via the handlers it replaces."""
+    import hanaro
+    CapturingHandler.records.clear()
+    try:
+        hanaro.configure_logging({
+            'logging': {
+                'coalesce': {'window': '1h'},
+                'handlers': [{'type': 'custom', 'class': 'tests.fakes.CapturingHandler'}]
+            }
+        }, force=True)
+        logger = logging.getLogger('test.coalesce.replaced')
+        for _ in range(0, 3):
+            logger.warning('storm')
+        hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
+        messages = [e.getMessage() for e in CapturingHandler.records]
+    finally:
+        hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
+        CapturingHandler.records.clear()
+    assert messages == ['storm', 'storm (repeated 2 times)'], messages
+
+
+@fact
+def repeats_are_logged_at_exit() -> None:
+    """Assert the repeats of open windows are logged when the process exits."""
+    import os
+    import subprocess
+    import sys
+    script = '\n'.join([
+        'import hanaro, logging',
+        'hanaro.configure_logging({"logging": {"format": "%(message)s", "bidi": False, "coalesce": {"window": "1h"}, "handlers": [{"type": "console"}]}})',
+        'for _ in range(0, 3):',
+        '    logging.getLogger("test_coalesce_exit").warning("storm")',
+    ])
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([p for p in sys.path if p])
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, env=env, timeout=60)
+    assert result.stdout.splitlines() == ['storm', 'storm (repeated 2 times)'], result.stderr
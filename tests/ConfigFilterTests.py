@@ -2,7 +2,7 @@
 # SPDX-License-Identifier: MIT
 
 import logging
-from punit import theory, inlinedata
+from punit import fact, theory, inlinedata
 from hanaro import ConfigFilter
 
 
@@ -88,3 +88,45 @@ def level_matching(should_match: bool, level: int) -> None:
         })
     is_match = filter.filter(record)
     assert is_match == should_match
+
+
+@fact
+def configure_invalidates_cached_decisions() -> None:
+    """Assert :meth:``ConfigFilter.configure`` replaces settings and invalidates cached decisions."""
+    record = logging.LogRecord('test', logging.INFO, 'pathname', 5, 'msg', None, None, None, None)
+    filter = ConfigFilter("config_filter", {'test': {'level': 'WARNING'}})
+    assert filter.filter(record) is False
+    assert filter.get_level('test') == logging.WARNING
+    filter.configure({'test': {'level': 'INFO'}})
+    assert filter.filter(record) is True
+    assert filter.get_level('test') == logging.INFO
+    filter.configure()
+    assert filter.get_level('test') == logging.NOTSET
+
+
+@fact
+def effective_level_is_highest_matching_level() -> None:
+    """Assert the effective level for a logger is the highest level among all matching settings."""
+    filter = ConfigFilter(
+        "config_filter",
+        {
+            'test.*': {'level': 'INFO'},
+            'test.namespace': {'level': 'ERROR', 'regex': False},
+            '.*namespace': {'level': 'WARNING'}
+        })
+    assert filter.get_level('test.namespace') == logging.ERROR
+    assert filter.get_level('test.other') == logging.INFO
+    assert filter.get_level('other.namespace') == logging.WARNING
+    assert filter.get_level('other') == logging.NOTSET
+
+
+@fact
+def cache_is_bounded() -> None:
+    """Assert cached decisions do not grow beyond the configured cache size."""
+    filter = ConfigFilter("config_filter", {'test.*': {'level': 'WARNING'}}, cache_size=8)
+    for i in range(0, 100):
+        record = logging.LogRecord(f'test.{i}', logging.INFO, 'pathname', 5, 'msg', None, None, None, None)
+        assert filter.filter(record) is False
+    assert len(getattr(filter, '_ConfigFilter__state').cache) <= 8
+    record = logging.LogRecord('test.99', logging.ERROR, 'pathname', 5, 'msg', None, None, None, None)
+    assert filter.filter(record) is True
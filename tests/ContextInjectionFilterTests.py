@@ -84,6 +84,40 @@ def replaces_existing_attributes() -> None:
     assert getattr(record, 'metadata') == expected, f'expected=`{expected}`, actual=`{getattr(record, "metadata")}`'
 
 
+@fact
+def metadata_reflects_context_changes() -> None:
+    """Assert pre-rendered metadata reflects changes made to the context after construction."""
+    filter = ContextInjectionFilter({'foo': 'bar'}, is_metadata=True)
+    record1 = logging.LogRecord('name', 3, 'pathname', 5, 'msg', None, None, None, None)
+    filter.filter(record1)
+    assert getattr(record1, 'metadata') == 'foo="bar"'
+    filter['baz'] = 'qux'
+    filter['foo'] = 'bar2'
+    record2 = logging.LogRecord('name', 3, 'pathname', 5, 'msg', None, None, None, None)
+    filter.filter(record2)
+    assert getattr(record2, 'metadata') == 'foo="bar2" baz="qux"', f'actual=`{getattr(record2, "metadata")}`'
+    del filter['foo']
+    record3 = logging.LogRecord('name', 3, 'pathname', 5, 'msg', None, None, None, None)
+    filter.filter(record3)
+    assert getattr(record3, 'metadata') == 'baz="qux"', f'actual=`{getattr(record3, "metadata")}`'
+
+
+@fact
+def merges_into_existing_metadata_literally() -> None:
+    """Assert values merged into existing metadata are not interpreted as regex replacement templates."""
+    record = logging.LogRecord('name', 3, 'pathname', 5, 'msg', None, None, None, None)
+    setattr(record, 'metadata', 'path="c:\\old" other="1"')
+    filter = ContextInjectionFilter({'path': 'c:\\new\\1'}, is_metadata=True)
+    filter.filter(record)
+    expected = 'path="c:\\new\\1" other="1"'
+    assert getattr(record, 'metadata') == expected, f'expected=`{expected}`, actual=`{getattr(record, "metadata")}`'
+    # a second record carrying identical metadata is answered from the merge cache
+    record2 = logging.LogRecord('name', 3, 'pathname', 5, 'msg', None, None, None, None)
+    setattr(record2, 'metadata', 'path="c:\\old" other="1"')
+    filter.filter(record2)
+    assert getattr(record2, 'metadata') == expected
+
+
 @fact
 def enter_returns_self() -> None:
     """Assert :meth:``__enter__`` returns the filter instance itself."""
@@ -118,16 +152,24 @@ def context_is_cleared_after_exit() -> None:
     assert _CIF_contextvar.get() is None
 
 
+def configure_capture() -> list[logging.LogRecord]:
+    """Configure logging with a :class:``CapturingHandler``, returning the list of captured records."""
+    import hanaro
+    from tests.fakes import CapturingHandler
+    hanaro.configure_logging({'logging': {'handlers': [{'type': 'custom', 'class': 'tests.fakes.CapturingHandler'}]}}, force=True)
+    CapturingHandler.records.clear()
+    return CapturingHandler.records
+
+
 @fact
-def get_logger_in_context_attaches_filter() -> None:
-    """Assert get_logger() attaches the active ContextInjectionFilter to the returned logger."""
+def get_logger_in_context_does_not_attach_filter() -> None:
+    """Assert get_logger() does not mutate the returned logger when a ContextInjectionFilter is active."""
     import hanaro
     hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}})
     f = ContextInjectionFilter({'foo': 'bar'})
     with f:
         logger = hanaro.get_logger()
-        found = any(isinstance(filt, ContextInjectionFilter) and filt is f for filt in logger.filters)
-        assert found, f'expected logger.filters to contain the ContextInjectionFilter instance, got: {logger.filters}'
+        assert f not in logger.filters, f'expected logger.filters to not contain the ContextInjectionFilter instance, got: {logger.filters}'
 
 
 @fact
@@ -141,55 +183,90 @@ def get_logger_outside_context_has_no_extra_filter() -> None:
 
 
 @fact
-def nested_contexts_inner_has_inner_filter() -> None:
-    """Assert nested context managers — inner scope has inner filter, outer scope has outer filter."""
+def nested_contexts_are_layered() -> None:
+    """Assert nested context managers — inner scope is layered over outer scope, outer scope is restored on exit."""
     import hanaro
-    hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}})
+    captured = configure_capture()
     from hanaro.utils import _CIF_contextvar
-    outer = ContextInjectionFilter({'outer': 'yes'})
-    inner = ContextInjectionFilter({'inner': 'yes'})
+    outer = ContextInjectionFilter({'outer': 'yes', 'shared': 'outer'}, is_metadata=True)
+    inner = ContextInjectionFilter({'inner': 'yes', 'shared': 'inner'}, is_metadata=True)
+    logger = hanaro.get_logger('test_nested')
     with outer:
         assert _CIF_contextvar.get() is outer
-        outer_logger = hanaro.get_logger('test_nested_outer')
+        logger.info('outer')
         with inner:
             assert _CIF_contextvar.get() is inner
-            inner_logger = hanaro.get_logger('test_nested_inner')
+            logger.info('inner')
         assert _CIF_contextvar.get() is outer
-        outer_logger2 = hanaro.get_logger('test_nested_outer2')
+        outer['late'] = 'yes'
+        logger.info('outer again')
     assert _CIF_contextvar.get() is None
-    assert outer_logger.filters[-1] is outer, f'outer_logger should have outer filter, got: {outer_logger.filters[-1]}'
-    assert inner_logger.filters[-1] is inner, f'inner_logger should have inner filter, got: {inner_logger.filters[-1]}'
+    logger.info('none')
+    assert [getattr(r, 'metadata') for r in captured] == [
+        'outer="yes" shared="outer"',
+        'outer="yes" shared="inner" inner="yes"',
+        'outer="yes" shared="outer" late="yes"',
+        ''
+    ], [getattr(r, 'metadata') for r in captured]
+    assert getattr(captured[1], 'shared') == 'inner'
+    assert hasattr(captured[3], 'outer') is False
+    assert len(logger.filters) == 0, f'expected logger.filters to be unchanged, got: {logger.filters}'
 
 
 @fact
 def log_record_receives_context_values() -> None:
-    """Assert a LogRecord obtained via get_logger() inside a context receives injected values."""
+    """Assert a LogRecord logged inside a context receives injected values."""
     import hanaro
-    hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}})
+    captured = configure_capture()
     f = ContextInjectionFilter({'request_id': 'abc-123'})
     with f:
         logger = hanaro.get_logger()
-        # Capture the record by using a custom handler
-        captured: list[logging.LogRecord] = []
-        handler = logging.Handler()
-        handler.emit = lambda record: captured.append(record)  # type: ignore[method-assign]
-        logger.addHandler(handler)
         logger.info('test message')
-        assert len(captured) == 1
-        assert hasattr(captured[0], 'request_id')
-        assert getattr(captured[0], 'request_id') == 'abc-123'
+    logger.info('test message')
+    assert len(captured) == 2
+    assert hasattr(captured[0], 'request_id')
+    assert getattr(captured[0], 'request_id') == 'abc-123'
+    assert hasattr(captured[1], 'request_id') is False, 'records logged after the context exits should not receive context values'
 
 
 @fact
-def attached_filter_is_same_instance() -> None:
-    """Assert the filter attached to the logger is the same instance from the context."""
+async def asyncio_tasks_see_their_own_context() -> None:
+    """Assert concurrent asyncio tasks each inject their own context."""
+    import asyncio
     import hanaro
-    hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}})
-    f = ContextInjectionFilter({'key': 'val'})
-    with f:
-        logger = hanaro.get_logger()
-        found = any(filt is f for filt in logger.filters)
-        assert found, f'expected logger.filters to contain the same ContextInjectionFilter instance'
+    captured = configure_capture()
+    logger = hanaro.get_logger('test_tasks')
+
+    async def task(task_id: str) -> None:
+        with ContextInjectionFilter({'task_id': task_id}):
+            for _ in range(0, 3):
+                logger.info(task_id)
+                await asyncio.sleep(0)
+    await asyncio.gather(task('a'), task('b'), task('c'))
+    assert len(captured) == 9
+    for record in captured:
+        assert getattr(record, 'task_id') == record.getMessage()
+
+
+@fact
+def queued_records_receive_producer_context() -> None:
+    """Assert records from queued loggers receive the context of the producing thread, not of the thread handling the queue."""
+    import hanaro
+    import threading
+    captured = configure_capture()
+
+    def producer() -> None:
+        with ContextInjectionFilter({'worker': 'yes'}):
+            hanaro.get_queued_logger('test_queued_context').info('from worker')
+    thread = threading.Thread(target=producer)
+    thread.start()
+    thread.join()
+    with ContextInjectionFilter({'main': 'yes'}):
+        hanaro.handle_queued_log_records()
+    records = [r for r in captured if r.name == 'test_queued_context']
+    assert len(records) == 1
+    assert getattr(records[0], 'worker') == 'yes'
+    assert hasattr(records[0], 'main') is False
 
 
 @fact
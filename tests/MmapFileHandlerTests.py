@@ -0,0 +1,157 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+from hanaro import MmapFileHandler
+from punit import fact
+
+
+SCRIPT = '''
+import logging
+import sys
+import hanaro
+
+handler = hanaro.MmapFileHandler(sys.argv[1], 64 * 1024, 100)
+logger = logging.Logger("test_mmap_crash", logging.DEBUG)
+logger.addHandler(handler)
+i = 0
+while True:
+    logger.info("record %06d", i)
+    i += 1
+    if i % 100 == 0:
+        print(i, flush=True)
+'''
+
+
+def read_segments(filename: str) -> list[str]:
+    filenames = [f'{filename}.{i}' for i in range(100, 0, -1) if os.path.exists(f'{filename}.{i}')] + [filename]
+    return [line for e in filenames for line in MmapFileHandler.recover(e)]
+
+
+@fact
+def mmap_file_handler_truncates_on_close() -> None:
+    """Assert records are written into a preallocated segment, which is truncated to its used length when the handler is closed."""
+    with tempfile.TemporaryDirectory() as path:
+        filename = os.path.join(path, 'test.log')
+        handler = MmapFileHandler(filename, 4096)
+        try:
+            logger = logging.Logger('test_mmap', logging.DEBUG)
+            logger.addHandler(handler)
+            logger.info('first')
+            logger.info('sëcönd')
+            assert os.path.getsize(filename) == 4096
+            assert MmapFileHandler.recover(filename) == ['first', 'sëcönd']
+        finally:
+            handler.close()
+        with open(filename, encoding='utf-8') as file:
+            assert file.read() == 'first\nsëcönd\n'
+        assert os.listdir(path) == ['test.log']
+
+
+@fact
+def mmap_file_handler_resumes_after_records_containing_nul() -> None:
+    """Assert a record containing a NUL character is not mistaken for the end of a segment which was not closed, when the segment is recovered or reopened."""
+    with tempfile.TemporaryDirectory() as path:
+        filename = os.path.join(path, 'test.log')
+        logger = logging.Logger('test_mmap_nul', logging.DEBUG)
+        handler = MmapFileHandler(filename, 4096)
+        try:
+            logger.addHandler(handler)
+            logger.info('first\0null')
+            logger.info('second')
+            handler.flush()
+            # NOTE: a copy of the segment before it is closed, zero-filled after its last record (as if the process crashed)
+            with open(filename, 'rb') as file:
+                segment = file.read()
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+        with open(filename, 'wb') as file:
+            file.write(segment)
+        assert MmapFileHandler.recover(filename) == ['first\0null', 'second']
+        handler = MmapFileHandler(filename, 4096)
+        try:
+            logger.addHandler(handler)
+            logger.info('third')
+        finally:
+            handler.close()
+        with open(filename, encoding='utf-8') as file:
+            assert file.read() == 'first\0null\nsecond\nthird\n'
+
+
+@fact
+def mmap_file_handler_rolls_over_to_preallocated_segments() -> None:
+    """Assert the handler rolls over to the next segment when a segment is full, retaining *backup_count* segments."""
+    with tempfile.TemporaryDirectory() as path:
+        filename = os.path.join(path, 'test.log')
+        handler = MmapFileHandler(filename, 1000, 3)
+        try:
+            logger = logging.Logger('test_mmap_rollover', logging.DEBUG)
+            logger.addHandler(handler)
+            for i in range(0, 500):
+                logger.info('record %03d', i)
+        finally:
+            handler.close()
+        assert sorted(os.listdir(path)) == ['test.log', 'test.log.1', 'test.log.2', 'test.log.3']
+        for i in range(1, 4):
+            assert 0 < os.path.getsize(f'{filename}.{i}') <= 1000
+        lines = read_segments(filename)
+        assert lines == [f'record {i:03d}' for i in range(500 - len(lines), 500)]
+
+
+@fact
+def mmap_file_handler_recovers_records_after_crash() -> None:
+    """Assert every record fully written before the process is killed can be recovered, and that the handler resumes after the last record."""
+    with tempfile.TemporaryDirectory() as path:
+        filename = os.path.join(path, 'test.log')
+        script_path = os.path.join(path, 'mmap_crash.py')
+        with open(script_path, 'w') as file:
+            file.write(SCRIPT)
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join([p for p in sys.path if p])
+        process = subprocess.Popen([sys.executable, script_path, filename], stdout=subprocess.PIPE, text=True, env=env)
+        try:
+            written = 0
+            while written < 5000:
+                line = process.stdout.readline()  # type: ignore[union-attr]
+                assert line != '', 'expected the script to write records'
+                written = int(line)
+        finally:
+            os.kill(process.pid, signal.SIGKILL)
+            process.wait()
+            process.stdout.close()  # type: ignore[union-attr]
+        lines = read_segments(filename)
+        assert len(lines) >= written
+        assert lines == [f'record {i:06d}' for i in range(0, len(lines))]
+        handler = MmapFileHandler(filename, 64 * 1024, 100)
+        try:
+            logger = logging.Logger('test_mmap_resume', logging.DEBUG)
+            logger.addHandler(handler)
+            logger.info('resumed')
+        finally:
+            handler.close()
+        assert read_segments(filename) == lines + ['resumed']
+
+
+@fact
+def configure_logging_creates_mmap_file_handler() -> None:
+    """Assert :function:``configure_logging`` creates a :class:``MmapFileHandler`` for ``mmap`` handlers."""
+    import hanaro
+    with tempfile.TemporaryDirectory() as path:
+        try:
+            handlers = hanaro.configure_logging({
+                'logging': {
+                    'handlers': [
+                        {'type': 'mmap', 'path': path, 'name': 'mmap.log', 'max_size': '64KiB', 'max_count': 2}
+                    ]
+                }
+            }, force=True)
+            assert isinstance(handlers[0], MmapFileHandler)
+            assert os.path.getsize(os.path.join(path, 'mmap.log')) == 64 * 1024
+        finally:
+            hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
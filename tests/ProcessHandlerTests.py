@@ -0,0 +1,146 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from hanaro import ProcessHandler, ProcessListener, RecordQueue
+from punit import fact, theory, inlinedata
+
+
+@fact
+def process_handler_forwards_records_to_listener() -> None:
+    """Assert records emitted via :class:``ProcessHandler`` are put into the Log Queue of a :class:``ProcessListener``."""
+    queue = RecordQueue()
+    listener = ProcessListener(queue=queue)
+    handler = ProcessHandler(listener.address)
+    try:
+        logger = logging.Logger('test_process_handler', logging.DEBUG)
+        logger.addHandler(handler)
+        for i in range(0, 1000):
+            logger.info('forwarded %d', i)
+        handler.flush()
+        for _ in range(0, 500):
+            if queue.qsize() == 1000:
+                break
+            time.sleep(0.01)
+        records = queue.get_many()
+        assert [e.getMessage() for e in records] == [f'forwarded {i}' for i in range(0, 1000)]
+        assert records[0].name == 'test_process_handler'
+        assert handler.drop_count == 0
+    finally:
+        handler.close()
+        listener.close()
+
+
+@fact
+def process_handler_counts_drops_without_listener() -> None:
+    """Assert :class:``ProcessHandler`` drops (and counts) records which cannot be sent."""
+    with tempfile.TemporaryDirectory() as path:
+        handler = ProcessHandler(os.path.join(path, 'missing.sock'))
+        logger = logging.Logger('test_process_handler_drops', logging.DEBUG)
+        logger.addHandler(handler)
+        logger.info('dropped')
+        handler.flush()
+        handler.close()
+        assert handler.drop_count == 1
+
+
+SCRIPT = '''
+import concurrent.futures, logging, multiprocessing, sys
+import hanaro
+
+CONFIG = {"logging": {
+    "format": "%(processName)s %(message)s",
+    "bidi": False,
+    "queue": {"drain": "thread"},
+    "process": {"transport": sys.argv[2], "ring_size": "64KiB"}
+}}
+
+
+def initialize() -> None:
+    hanaro.configure_logging(CONFIG)
+
+
+def work(n: int) -> int:
+    logger = logging.getLogger("test_process_worker")
+    for i in range(0, 250):
+        logger.info("task %d record %d", n, i)
+    return n
+
+
+if __name__ == "__main__":
+    hanaro.configure_logging(CONFIG)
+    method = sys.argv[1]
+    context = multiprocessing.get_context(method)
+    with concurrent.futures.ProcessPoolExecutor(4, mp_context=context, initializer=None if method == "fork" else initialize) as executor:
+        list(executor.map(work, range(0, 8)))
+    logging.getLogger("test_process_parent").info("done")
+'''
+
+
+def run_script(method: str, transport: str) -> list[str]:
+    with tempfile.TemporaryDirectory() as path:
+        script_path = os.path.join(path, 'process_transport.py')
+        with open(script_path, 'w') as file:
+            file.write(SCRIPT)
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join([p for p in sys.path if p])
+        result = subprocess.run([sys.executable, script_path, method, transport], capture_output=True, text=True, env=env, timeout=120)
+        assert result.returncode == 0, result.stderr
+        return result.stdout.splitlines()
+
+
+def assert_aggregated(lines: list[str]) -> None:
+    messages = [e.split(' ', 1)[1] for e in lines]
+    for n in range(0, 8):
+        task = [e for e in messages if e.startswith(f'task {n} ')]
+        assert task == [f'task {n} record {i}' for i in range(0, 250)], 'expected the records of each task in order'
+    messages.sort()
+    expected = sorted([f'task {n} record {i}' for n in range(0, 8) for i in range(0, 250)] + ['done'])
+    assert messages == expected
+    assert all(not e.startswith('MainProcess ') for e in lines if 'task' in e)
+
+
+@theory
+@inlinedata('socket')
+@inlinedata('shm')
+def forked_workers_forward_records_to_parent(transport: str) -> None:
+    """Assert records of forked workers (which never configure logging) are output by the parent process."""
+    if 'fork' in multiprocessing.get_all_start_methods():
+        assert_aggregated(run_script('fork', transport))
+
+
+@theory
+@inlinedata('socket')
+@inlinedata('shm')
+def spawned_workers_forward_records_to_parent(transport: str) -> None:
+    """Assert records of spawned workers (which configure logging with the same configuration) are output by the parent process."""
+    assert_aggregated(run_script('spawn', transport))
+
+
+@fact
+def closed_handlers_are_collected() -> None:
+    """Assert the exit finalizers of handlers do not retain them, handlers which are closed and discarded are collected."""
+    import gc
+    import hanaro
+    import weakref
+    with tempfile.TemporaryDirectory() as path:
+        handlers: list[logging.Handler] = [
+            ProcessHandler(('127.0.0.1', 9)),
+            hanaro.BackgroundHandler(logging.NullHandler()),
+            hanaro.BufferedRotatingFileHandler(os.path.join(path, 'buffered.log')),
+            hanaro.MmapFileHandler(os.path.join(path, 'mmap.log'), 4096),
+            hanaro.SharedMemoryHandler(('127.0.0.1', 9))
+        ]
+        for handler in handlers:
+            handler.close()
+        refs = [weakref.ref(e) for e in handlers]
+        del handler
+        handlers.clear()
+        gc.collect()
+        assert [e() for e in refs] == [None] * len(refs)
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: © 2026 Shaun Wilson
 # SPDX-License-Identifier: MIT
 
+import logging
 from hanaro import QueuedHandler, get_queued_logger
 from hanaro.utils import handle_queued_log_records
 from punit import fact
@@ -9,7 +10,7 @@ from punit import fact
 @fact
 async def queuedLogger_bvt() -> None:
     expected_count = 10
-    logger = get_queued_logger()
+    logger = get_queued_logger(level=logging.DEBUG)
     async def emitter() -> None:
         emission_count = 0
         for i in range(0,expected_count):
@@ -24,3 +25,191 @@ async def queuedLogger_bvt() -> None:
     # NOTE: these two lines only exist for code coverage, the above validated functionality.
     logger.debug('coverage')
     handle_queued_log_records()
+
+
+@fact
+def configure_logging_configures_queue() -> None:
+    """Assert :function:``configure_logging`` applies ``queue`` settings to the Log Queue."""
+    import hanaro
+    try:
+        hanaro.configure_logging({
+            'logging': {
+                'handlers': [{'type': 'console'}],
+                'queue': {'max_size': 8, 'overflow': 'drop_oldest'}
+            }
+        }, force=True)
+        queue = QueuedHandler.get_queue()
+        assert queue.max_size == 8
+        assert queue.overflow == 'drop_oldest'
+    finally:
+        hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
+    assert QueuedHandler.get_queue().max_size == 0
+
+
+@fact
+def handle_queued_log_records_respects_budgets() -> None:
+    """Assert :function:``handle_queued_log_records`` outputs records within the budget, reporting the number still queued."""
+    import hanaro
+    from tests.fakes import CapturingHandler
+    hanaro.configure_logging({'logging': {'handlers': [{'type': 'custom', 'class': 'tests.fakes.CapturingHandler'}]}}, force=True)
+    CapturingHandler.records.clear()
+    logger = get_queued_logger('test_drain_budget', level=logging.DEBUG)
+    for i in range(0, 1000):
+        logger.info('budget %d', i)
+    assert handle_queued_log_records(max_records=300) == 700
+    assert len(CapturingHandler.records) == 300
+    assert handle_queued_log_records(max_seconds=60) == 0
+    assert [r.getMessage() for r in CapturingHandler.records] == [f'budget {i}' for i in range(0, 1000)]
+    assert handle_queued_log_records() == 0
+
+
+@fact
+def drain_thread_outputs_queued_records() -> None:
+    """Assert the ``thread`` drain mode outputs queued records without polling, and flushes when stopped."""
+    import hanaro
+    import threading
+    import time
+    from tests.fakes import CapturingHandler
+    hanaro.configure_logging({
+        'logging': {
+            'handlers': [{'type': 'custom', 'class': 'tests.fakes.CapturingHandler'}],
+            'queue': {'drain': 'thread', 'drain_timeout': 5}
+        }
+    }, force=True)
+    try:
+        CapturingHandler.records.clear()
+        logger = get_queued_logger('test_drain_thread', level=logging.DEBUG)
+
+        def produce() -> None:
+            for i in range(0, 100):
+                logger.info('drained %d', i)
+        threads = [threading.Thread(target=produce) for _ in range(0, 4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        deadline = time.monotonic() + 5
+        while len(CapturingHandler.records) < 400 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(CapturingHandler.records) == 400, len(CapturingHandler.records)
+        assert handle_queued_log_records() == 0
+        logger.info('flushed on stop')
+    finally:
+        hanaro.configure_logging({'logging': {'handlers': [{'type': 'custom', 'class': 'tests.fakes.CapturingHandler'}]}}, force=True)
+    assert CapturingHandler.records[-1].getMessage() == 'flushed on stop'
+    drain_threads = [t for t in threading.enumerate() if t.name == 'hanaro.QueueDrainThread']
+    assert len(drain_threads) == 0, drain_threads
+
+
+@fact
+def drain_thread_flushes_at_exit() -> None:
+    """Assert the ``thread`` drain mode outputs queued records when the process exits."""
+    import os
+    import subprocess
+    import sys
+    script = '\n'.join([
+        'import hanaro, threading',
+        'hanaro.configure_logging({"logging": {"format": "%(message)s", "bidi": False, "queue": {"drain": "thread"}}})',
+        'logger = hanaro.get_queued_logger("test_drain_exit", level="DEBUG")',
+        'thread = threading.Thread(target=lambda: [logger.info("exit %d", i) for i in range(0, 1000)])',
+        'thread.start()',
+        'thread.join()',
+    ])
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([p for p in sys.path if p])
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, env=env, timeout=60)
+    lines = result.stdout.splitlines()
+    assert lines == [f'exit {i}' for i in range(0, 1000)], result.stderr
+
+
+@fact
+async def async_drain_outputs_queued_records() -> None:
+    """Assert :function:``start_async_drain`` outputs records queued by other threads from the event loop."""
+    import asyncio
+    import hanaro
+    import threading
+    from tests.fakes import CapturingHandler
+    hanaro.configure_logging({'logging': {'handlers': [{'type': 'custom', 'class': 'tests.fakes.CapturingHandler'}]}}, force=True)
+    CapturingHandler.records.clear()
+    logger = get_queued_logger('test_async_drain', level=logging.DEBUG)
+    hanaro.start_async_drain()
+    try:
+        def produce() -> None:
+            for i in range(0, 1000):
+                logger.info('async %d', i)
+        thread = threading.Thread(target=produce)
+        thread.start()
+        while thread.is_alive():
+            await asyncio.sleep(0.01)
+        for _ in range(0, 500):
+            if len(CapturingHandler.records) == 1000:
+                break
+            await asyncio.sleep(0.01)
+        assert [r.getMessage() for r in CapturingHandler.records] == [f'async {i}' for i in range(0, 1000)]
+    finally:
+        hanaro.stop_async_drain()
+    logger.info('after stop')
+    await asyncio.sleep(0.01)
+    assert len(CapturingHandler.records) == 1000
+    await hanaro.drain_async()
+    assert CapturingHandler.records[-1].getMessage() == 'after stop'
+    assert QueuedHandler.get_queue().qsize() == 0
+
+
+@fact
+def configure_logging_freezes_queued_records() -> None:
+    """Assert that with ``freeze`` enabled, queued records are frozen by the emitting thread (no references to ``args`` or tracebacks are retained.)"""
+    import hanaro
+    try:
+        hanaro.configure_logging({
+            'logging': {
+                'handlers': [{'type': 'console'}],
+                'queue': {'freeze': True}
+            }
+        }, force=True)
+        QueuedHandler.get_log_records()
+        logger = get_queued_logger('test_freeze', level=logging.DEBUG)
+        argument = object()
+        try:
+            raise ValueError('frozen')
+        except ValueError:
+            logger.exception('argument %s', argument, extra={'request_id': 'abc-123'})
+        record = QueuedHandler.get_log_record()
+        assert record is not None
+        assert record.args == ()
+        assert record.msg == f'argument {argument}'
+        assert record.exc_info is None
+        assert record.exc_text is not None and 'ValueError: frozen' in record.exc_text
+        assert getattr(record, 'request_id') == 'abc-123'
+    finally:
+        hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
+    logger.info('live %s', argument)
+    record = QueuedHandler.get_log_record()
+    assert record is not None
+    assert record.args == (argument,)
+
+
+@fact
+def queued_handler_reports_emit_failures() -> None:
+    """Assert a record which cannot be frozen is reported via ``handleError``, rather than raising from the logging call."""
+    import hanaro
+    handled = list[logging.LogRecord]()
+
+    class FailingQueuedHandler(QueuedHandler):
+        def handleError(self, record: logging.LogRecord) -> None:  # noqa: N802
+            handled.append(record)
+    handler = FailingQueuedHandler()
+    try:
+        hanaro.configure_logging({
+            'logging': {
+                'handlers': [{'type': 'console'}],
+                'queue': {'freeze': True}
+            }
+        }, force=True)
+        QueuedHandler.get_log_records()
+        record = logging.LogRecord('test_emit_failure', logging.INFO, 'pathname', 5, 'bad args %d', ('not a number',), None, None, None)
+        handler.emit(record)
+        assert handled == [record]
+        assert QueuedHandler.get_log_record() is None
+    finally:
+        hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
@@ -0,0 +1,180 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+from hanaro import RateLimitFilter
+from punit import fact, theory, inlinedata
+from tests.fakes import CapturingHandler
+
+
+def create_record(name: str = 'test.ratelimit', levelno: int = logging.WARNING, lineno: int = 5, created: float = 1000.0) -> logging.LogRecord:
+    record = logging.LogRecord(name, levelno, 'pathname', lineno, 'msg', None, None, None, None)
+    record.created = created
+    return record
+
+
+def capture_summaries() -> logging.Logger:
+    CapturingHandler.records.clear()
+    logger = logging.getLogger('hanaro.RateLimitFilter')
+    logger.addHandler(CapturingHandler())
+    logger.propagate = False
+    return logger
+
+
+def release_summaries(logger: logging.Logger) -> list[str]:
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    logger.propagate = True
+    summaries = [e.getMessage() for e in CapturingHandler.records]
+    CapturingHandler.records.clear()
+    return summaries
+
+
+@fact
+def token_bucket_limits_records_per_logger() -> None:
+    """Assert records beyond the burst are suppressed until the bucket refills, at *rate* per second of record time."""
+    filter = RateLimitFilter('rate_limit_filter', {'test\\.ratelimit.*': {'rate': 10, 'burst': 5}})
+    passed = [filter.filter(create_record(created=1000.0)) for _ in range(0, 20)]
+    assert passed.count(True) == 5, passed
+    # NOTE: half a second refills 5 tokens
+    passed = [filter.filter(create_record(created=1000.5)) for _ in range(0, 20)]
+    assert passed.count(True) == 5, passed
+    # NOTE: other loggers have their own bucket, unmatched loggers are never limited
+    assert filter.filter(create_record('test.ratelimit.other', created=1000.5)) is True
+    assert all([filter.filter(create_record('unmatched', created=1000.5)) for _ in range(0, 20)])
+
+
+@theory
+@inlinedata('logger', 5)
+@inlinedata('site', 10)
+def token_bucket_is_per_logger_or_per_site(per: str, expected: int) -> None:
+    """Assert ``per`` selects whether call sites of a logger share a bucket."""
+    filter = RateLimitFilter('rate_limit_filter', {'test\\.ratelimit': {'rate': 1, 'burst': 5, 'per': per}})
+    passed = [filter.filter(create_record(lineno=lineno)) for lineno in (1, 2) for _ in range(0, 10)]
+    assert passed.count(True) == expected, passed
+
+
+@fact
+def sampling_applies_to_debug_and_info_only() -> None:
+    """Assert ``sample`` passes about that fraction of ``DEBUG`` and ``INFO`` records, and all records of higher levels."""
+    filter = RateLimitFilter('rate_limit_filter', {'test\\.ratelimit': {'sample': 0.25}})
+    passed = [filter.filter(create_record(levelno=logging.DEBUG + (i % 2) * 10)) for i in range(0, 4000)]
+    assert 800 < passed.count(True) < 1200, passed.count(True)
+    assert all([filter.filter(create_record(levelno=logging.WARNING)) for _ in range(0, 100)])
+
+
+@fact
+def decision_is_made_once_per_record() -> None:
+    """Assert handlers sharing the filter observe the same decision for a record, without consuming tokens per handler."""
+    filter = RateLimitFilter('rate_limit_filter', {'test\\.ratelimit': {'rate': 1, 'burst': 2}})
+    records = [create_record() for _ in range(0, 4)]
+    for _ in range(0, 3):
+        assert [filter.filter(e) for e in records] == [True, True, False, False]
+
+
+@fact
+def suppressed_records_are_summarized() -> None:
+    """Assert suppressed records are summarized per source once *summary_interval* elapses, and when summarized explicitly."""
+    logger = capture_summaries()
+    try:
+        filter = RateLimitFilter('rate_limit_filter', {'test\\.ratelimit': {'rate': 1, 'burst': 1, 'per': 'site'}}, summary_interval=10.0)
+        for created in (1000.0, 1000.1, 1000.2, 1000.3):
+            filter.filter(create_record(created=created))
+        filter.filter(create_record(lineno=7, created=1000.4))
+        filter.filter(create_record(lineno=7, created=1000.5))
+        assert len(CapturingHandler.records) == 0
+        filter.filter(create_record(created=1010.0))
+        filter.summarize()
+    finally:
+        summaries = release_summaries(logger)
+    assert summaries == [
+        'suppressed 3 records from test.ratelimit (pathname:5)',
+        'suppressed 1 records from test.ratelimit (pathname:7)'
+    ], summaries
+
+
+@fact
+def suppressed_records_are_summarized_by_unmatched_loggers() -> None:
+    """Assert suppressed records are summarized once *summary_interval* elapses after limited traffic stops, when a record of a logger which no rule matches is filtered."""
+    logger = capture_summaries()
+    try:
+        filter = RateLimitFilter('rate_limit_filter', {'test\\.ratelimit': {'rate': 1, 'burst': 1}}, summary_interval=10.0)
+        for created in (1000.0, 1000.1, 1000.2):
+            filter.filter(create_record(created=created))
+        filter.filter(create_record('unmatched', created=1005.0))
+        assert len(CapturingHandler.records) == 0
+        filter.filter(create_record('unmatched', created=1010.0))
+    finally:
+        summaries = release_summaries(logger)
+    assert summaries == ['suppressed 2 records from test.ratelimit'], summaries
+
+
+@fact
+def configure_logging_attaches_rate_limit_filter() -> None:
+    """Assert :function:``configure_logging`` rate limits records according to the rules of ``filters``."""
+    import hanaro
+    CapturingHandler.records.clear()
+    try:
+        hanaro.configure_logging({
+            'logging': {
+                'level': 'DEBUG',
+                'filters': {
+                    'test\\.ratelimit\\.configured': {'level': 'INFO', 'rate': 1, 'burst': 3}
+                },
+                'handlers': [
+                    {'type': 'custom', 'class': 'tests.fakes.CapturingHandler'},
+                    {'type': 'custom', 'class': 'tests.fakes.CapturingHandler'}
+                ]
+            }
+        }, force=True)
+        logger = logging.getLogger('test.ratelimit.configured')
+        for i in range(0, 10):
+            logger.warning('storm %d', i)
+        logger.debug('filtered by level')
+        messages = [e.getMessage() for e in CapturingHandler.records]
+    finally:
+        hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
+        CapturingHandler.records.clear()
+    assert messages == ['storm 0', 'storm 0', 'storm 1', 'storm 1', 'storm 2', 'storm 2'], messages
+
+
+@fact
+def suppressed_records_are_summarized_when_filter_is_replaced() -> None:
+    """Assert :function:``configure_logging`` summarizes suppressed records via the handlers it replaces."""
+    import hanaro
+    CapturingHandler.records.clear()
+    try:
+        hanaro.configure_logging({
+            'logging': {
+                'filters': {'test\\.ratelimit\\.replaced': {'rate': 1, 'burst': 1}},
+                'filters_summary_interval': '1h',
+                'handlers': [{'type': 'custom', 'class': 'tests.fakes.CapturingHandler'}]
+            }
+        }, force=True)
+        logger = logging.getLogger('test.ratelimit.replaced')
+        for _ in range(0, 3):
+            logger.warning('storm')
+        hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
+        messages = [e.getMessage() for e in CapturingHandler.records]
+    finally:
+        hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
+        CapturingHandler.records.clear()
+    assert messages == ['storm', 'suppressed 2 records from test.ratelimit.replaced'], messages
+
+
+@fact
+def suppressed_records_are_summarized_at_exit() -> None:
+    """Assert suppressed records are summarized when the process exits."""
+    import os
+    import subprocess
+    import sys
+    script = '\n'.join([
+        'import hanaro, logging',
+        'hanaro.configure_logging({"logging": {"format": "%(message)s", "bidi": False, "filters_summary_interval": "1h", "filters": {"test_ratelimit_exit": {"rate": 1, "burst": 1}}, "handlers": [{"type": "console"}]}})',
+        'for _ in range(0, 3):',
+        '    logging.getLogger("test_ratelimit_exit").warning("storm")',
+    ])
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([p for p in sys.path if p])
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, env=env, timeout=60)
+    assert result.stdout.splitlines() == ['storm', 'suppressed 2 records from test_ratelimit_exit'], result.stderr
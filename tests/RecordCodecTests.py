@@ -0,0 +1,63 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+import sys
+from hanaro import RecordCodec
+from hanaro.formatters import CompiledFormatter
+from punit import fact
+
+
+@fact
+def encode_decode_round_trip() -> None:
+    """Assert :class:``RecordCodec`` round-trips record attributes, interpolating the message."""
+    record = logging.LogRecord('test.codec', logging.WARNING, '/path/to/file.py', 42, 'hello %s (%d%%)', ('world', 100), None, 'fn')
+    record.__dict__['metadata'] = 'request_id="abc"'
+    decoded = RecordCodec.decode(RecordCodec.encode(record))
+    for name in ('name', 'levelno', 'levelname', 'pathname', 'filename', 'module', 'lineno', 'funcName', 'created', 'msecs', 'thread', 'threadName', 'process', 'processName', 'metadata'):
+        assert getattr(decoded, name) == getattr(record, name), name
+    assert decoded.getMessage() == 'hello world (100%)'
+    assert decoded.args == ()
+    assert logging.Formatter('%(asctime)s %(name)s %(message)s').format(decoded) == logging.Formatter('%(asctime)s %(name)s %(message)s').format(record)
+
+
+@fact
+def encode_renders_exceptions_and_converts_objects() -> None:
+    """Assert :class:``RecordCodec`` renders exception info to text, and converts attributes which are not primitives to ``str``."""
+    try:
+        raise ValueError('boom')
+    except ValueError:
+        record = logging.LogRecord('test.codec', logging.ERROR, __file__, 1, 'failed', None, sys.exc_info(), None)
+    record.__dict__['payload'] = {'key': object()}
+    decoded = RecordCodec.decode(RecordCodec.encode(record))
+    assert decoded.exc_info is None
+    assert decoded.exc_text is not None and 'ValueError: boom' in decoded.exc_text
+    assert 'ValueError: boom' in logging.Formatter().format(decoded)
+    assert decoded.__dict__['payload'] == str(record.__dict__['payload'])
+
+
+@fact
+def encode_many_decode_many() -> None:
+    """Assert batches of records round-trip in order."""
+    records = [logging.LogRecord('test.codec', logging.INFO, __file__, i, 'record %d', (i,), None) for i in range(0, 10)]
+    decoded = RecordCodec.decode_many(RecordCodec.encode_many([RecordCodec.freeze(e) for e in records]))
+    assert [e.getMessage() for e in decoded] == [f'record {i}' for i in range(0, 10)]
+
+
+@fact
+def copy_is_equivalent_to_freeze_and_thaw() -> None:
+    """Assert :meth:``RecordCodec.copy`` creates the same frozen record as thawing a frozen record, without modifying the original record."""
+    try:
+        raise ValueError('boom')
+    except ValueError:
+        record = logging.LogRecord('test.codec', logging.ERROR, __file__, 1, 'failed %s', ('here',), sys.exc_info(), None)
+    record.__dict__['payload'] = {'key': object()}
+    record.__dict__['metadata'] = 'request_id="abc"'
+    copied = RecordCodec.copy(record)
+    assert copied.__dict__ == RecordCodec.thaw(RecordCodec.freeze(record)).__dict__
+    # NOTE: the output cache of a formatter is never copied, it references `args`
+    CompiledFormatter().format(record)
+    assert '_formatted' in record.__dict__
+    assert '_formatted' not in RecordCodec.copy(record).__dict__
+    assert record.args == ('here',)
+    assert record.exc_info is not None
@@ -0,0 +1,125 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+import threading
+import time
+from hanaro import RecordQueue
+from punit import fact
+
+
+def create_record(message: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord('test', level, 'pathname', 5, message, None, None, None, None)
+
+
+def drain(queue: RecordQueue) -> list[str]:
+    messages = list[str]()
+    while (record := queue.get()) is not None:
+        messages.append(record.getMessage())
+    return messages
+
+
+@fact
+def unbounded_queue_preserves_order() -> None:
+    """Assert an unbounded :class:``RecordQueue`` accepts all records and preserves ordering."""
+    queue = RecordQueue()
+    for i in range(0, 100):
+        assert queue.put(create_record(str(i))) is True
+    assert queue.qsize() == 100
+    assert drain(queue) == [str(i) for i in range(0, 100)]
+    assert queue.get() is None
+
+
+@fact
+def drop_newest_policy() -> None:
+    """Assert the ``drop_newest`` policy drops new records when the queue is full."""
+    queue = RecordQueue(4, 'drop_newest')
+    results = [queue.put(create_record(str(i))) for i in range(0, 6)]
+    assert results == [True, True, True, True, False, False]
+    assert queue.drop_counts == {'drop_newest': 2}
+    assert drain(queue) == ['0', '1', '2 records dropped (drop_newest=2)', '2', '3']
+
+
+@fact
+def drop_oldest_policy() -> None:
+    """Assert the ``drop_oldest`` policy drops the oldest records when the queue is full."""
+    queue = RecordQueue(4, 'drop_oldest')
+    for i in range(0, 6):
+        assert queue.put(create_record(str(i))) is True
+    assert queue.drop_counts == {'drop_oldest': 2}
+    assert drain(queue) == ['2', '3', '2 records dropped (drop_oldest=2)', '4', '5']
+
+
+@fact
+def drop_below_policy() -> None:
+    """Assert the ``drop_below`` policy drops records below the drop level, and blocks for records at or above it."""
+    queue = RecordQueue(2, 'drop_below', timeout=0.01, drop_level='WARNING')
+    assert queue.put(create_record('0')) is True
+    assert queue.put(create_record('1')) is True
+    assert queue.put(create_record('2', logging.INFO)) is False
+    assert queue.put(create_record('3', logging.ERROR)) is False
+    assert queue.drop_counts == {'drop_below': 1, 'block': 1}
+
+
+@fact
+def block_policy_waits_for_space() -> None:
+    """Assert the ``block`` policy waits for space to become available."""
+    queue = RecordQueue(1, 'block', timeout=5.0)
+    assert queue.put(create_record('0')) is True
+
+    def consume() -> None:
+        time.sleep(0.05)
+        queue.get()
+    thread = threading.Thread(target=consume)
+    thread.start()
+    assert queue.put(create_record('1')) is True
+    thread.join()
+    assert drain(queue) == ['1']
+    assert queue.drop_counts == {}
+
+
+@fact
+def dropped_record_is_queued_once_pressure_clears() -> None:
+    """Assert the synthetic "records dropped" record is queued once the queue drains to half its capacity."""
+    queue = RecordQueue(4, 'drop_newest')
+    for i in range(0, 5):
+        queue.put(create_record(str(i)))
+    assert queue.get() is not None
+    assert queue.get() is not None
+    record = queue.get()
+    assert record is not None
+    assert record.levelno == logging.WARNING
+    assert record.getMessage() == '1 records dropped (drop_newest=1)'
+    assert drain(queue) == ['2', '3']
+
+
+@fact
+def configure_rejects_unknown_policy() -> None:
+    """Assert an unsupported overflow policy is rejected."""
+    queue = RecordQueue()
+    try:
+        queue.configure(4, 'drop_everything')
+    except ValueError:
+        return
+    assert False, 'expected a ValueError'
+
+
+@fact
+def get_many_gets_batches() -> None:
+    """Assert :meth:``RecordQueue.get_many`` gets records in order, limited to *max_records*."""
+    queue = RecordQueue()
+    for i in range(0, 10):
+        queue.put(create_record(str(i)))
+    assert [r.getMessage() for r in queue.get_many(4)] == ['0', '1', '2', '3']
+    assert queue.qsize() == 6
+    assert [r.getMessage() for r in queue.get_many()] == ['4', '5', '6', '7', '8', '9']
+    assert queue.get_many() == []
+
+
+@fact
+def get_many_includes_dropped_record() -> None:
+    """Assert :meth:``RecordQueue.get_many`` includes the synthetic "records dropped" record once pressure clears."""
+    queue = RecordQueue(2, 'drop_newest')
+    for i in range(0, 3):
+        queue.put(create_record(str(i)))
+    assert [r.getMessage() for r in queue.get_many()] == ['0', '1', '1 records dropped (drop_newest=1)']
@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+import time
+from hanaro import ProcessListener, RecordQueue, SharedMemoryHandler
+from punit import fact
+
+
+def wait_for(queue: RecordQueue, count: int) -> None:
+    for _ in range(0, 500):
+        if queue.qsize() >= count:
+            return
+        time.sleep(0.01)
+
+
+@fact
+def shared_memory_handler_forwards_records_to_listener() -> None:
+    """Assert records emitted via :class:``SharedMemoryHandler`` are read from the ring and put into the Log Queue of a :class:``ProcessListener``."""
+    queue = RecordQueue()
+    listener = ProcessListener(queue=queue)
+    handler = SharedMemoryHandler(listener.address, 64 * 1024)
+    try:
+        logger = logging.Logger('test_shared_memory_handler', logging.DEBUG)
+        logger.addHandler(handler)
+        for i in range(0, 1000):
+            logger.info('forwarded %d', i)
+        wait_for(queue, 1000)
+        records = queue.get_many()
+        assert [e.getMessage() for e in records] == [f'forwarded {i}' for i in range(0, 1000)]
+        assert handler.drop_counts == {}
+    finally:
+        handler.close()
+        listener.close()
+
+
+@fact
+def shared_memory_handler_drops_when_full() -> None:
+    """Assert the ``drop_newest`` policy drops records when the ring is full, and reports them once the pressure clears."""
+    queue = RecordQueue(1, 'block', None)
+    listener = ProcessListener(queue=queue)
+    handler = SharedMemoryHandler(listener.address, 4096, 'drop_newest')
+    try:
+        logger = logging.Logger('test_shared_memory_handler_drops', logging.DEBUG)
+        logger.addHandler(handler)
+        # NOTE: the listener blocks on the full Log Queue, so the ring fills
+        for i in range(0, 200):
+            logger.info('record %d', i)
+        dropped = handler.drop_counts.get('drop_newest', 0)
+        assert dropped > 0
+        # NOTE: the listener may free space in the ring (by reading a batch) while records are being written, so drops can be reported between records
+        messages = list[str]()
+        idle = 0
+        while idle < 100:
+            record = queue.get()
+            if record is None:
+                idle += 1
+                time.sleep(0.001)
+            else:
+                idle = 0
+                messages.append(record.getMessage())
+        logger.info('after')
+        while len(messages) == 0 or messages[-1] != 'after':
+            record = queue.get()
+            if record is None:
+                time.sleep(0.001)
+            else:
+                messages.append(record.getMessage())
+        indexes = [int(e.split(' ')[1]) for e in messages if e.startswith('record ')]
+        assert indexes == sorted(set(indexes))
+        reports = [e for e in messages if not e.startswith('record ') and e != 'after']
+        assert len(reports) > 0
+        assert all(e == f'{e.split(" ")[0]} records dropped (drop_newest={e.split(" ")[0]})' for e in reports), reports
+        assert len(indexes) + sum(int(e.split(' ')[0]) for e in reports) == 200
+    finally:
+        handler.close()
+        listener.close()
+
+
+@fact
+def shared_memory_handler_rejects_unsupported_overflow() -> None:
+    """Assert :class:``SharedMemoryHandler`` validates the overflow policy."""
+    try:
+        SharedMemoryHandler('unused', overflow='unsupported')
+    except ValueError:
+        return
+    assert False, 'expected ValueError'
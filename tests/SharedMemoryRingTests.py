@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+from hanaro import RecordCodec, SharedMemoryRing
+from punit import fact
+
+
+def encode(message: str) -> bytes:
+    return RecordCodec.encode(logging.LogRecord('test', logging.INFO, 'pathname', 5, message, None, None, None, None))
+
+
+@fact
+def ring_round_trip_between_attached_instances() -> None:
+    """Assert records written by a producer are read, in order, by a consumer attached by name."""
+    producer = SharedMemoryRing(None, 64 * 1024)
+    consumer = SharedMemoryRing(producer.name)
+    consumer.unlink()
+    try:
+        for i in range(0, 100):
+            assert producer.write(encode(str(i))) is True
+        assert [e.getMessage() for e in consumer.get_many(10)] == [str(i) for i in range(0, 10)]
+        assert [e.getMessage() for e in consumer.get_many()] == [str(i) for i in range(10, 100)]
+        assert consumer.usage() == 0
+        assert consumer.get_many() == []
+    finally:
+        consumer.close()
+        producer.close()
+
+
+@fact
+def ring_wraps_around_and_rejects_when_full() -> None:
+    """Assert the ring rejects records when full, and wraps records which do not fit before the end of the ring."""
+    ring = SharedMemoryRing(None, 4096)
+    try:
+        data = encode('x' * 100)
+        written = 0
+        while ring.write(data):
+            written += 1
+        assert written > 0
+        assert len(ring.get_many()) == written
+        # NOTE: positions are now mid-ring, writing many more records forces repeated wrap-around
+        messages = list[str]()
+        for i in range(0, written * 10):
+            if not ring.write(encode(f'{i:0100d}')):
+                messages.extend(e.getMessage() for e in ring.get_many())
+                assert ring.write(encode(f'{i:0100d}')) is True
+        messages.extend(e.getMessage() for e in ring.get_many())
+        assert messages == [f'{i:0100d}' for i in range(0, written * 10)]
+    finally:
+        ring.close()
+        ring.unlink()
+
+
+@fact
+def ring_waiting_flag() -> None:
+    """Assert the "waiting" flag is only reported once, and only when the consumer prepared to wait on an empty ring."""
+    ring = SharedMemoryRing(None, 4096)
+    try:
+        assert ring.is_waiting() is False
+        assert ring.prepare_wait() is True
+        assert ring.write(encode('wake')) is True
+        assert ring.is_waiting() is True
+        assert ring.is_waiting() is False
+        assert ring.prepare_wait() is False
+        assert ring.is_waiting() is False
+    finally:
+        ring.close()
+        ring.unlink()
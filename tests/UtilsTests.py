@@ -3,9 +3,14 @@
 
 import appsettings2
 import hanaro
+import json
 import logging
+import os
+import tempfile
+import time
 from pathlib import Path
 from punit import fact, theory, inlinedata
+from typing import Any, cast
 
 
 @theory
@@ -82,3 +87,275 @@ def configure_logging_handles_partial_configuration() -> None:
             "bidi": False
         }
     })
+
+
+@fact
+def configure_logging_pushes_filter_levels_into_loggers() -> None:
+    """Assert :function:``configure_logging`` applies filter thresholds as Logger levels when ``filters_mode`` is ``levels``."""
+    existing = logging.getLogger('test_levels_mode.existing')
+    try:
+        hanaro.configure_logging({
+            'logging': {
+                'level': 'DEBUG',
+                'filters_mode': 'levels',
+                'filters': {
+                    'test_levels_mode\\..*': {'level': 'WARNING'},
+                    'test_levels_verbose': {'level': 'DEBUG'}
+                }
+            }
+        }, force=True)
+        assert existing.level == logging.WARNING, f'actual={existing.level}'
+        created = hanaro.get_logger('test_levels_mode.created')
+        assert created.isEnabledFor(logging.INFO) is False
+        assert created.isEnabledFor(logging.WARNING) is True
+        queued = hanaro.get_queued_logger('test_levels_mode.queued')
+        assert queued.isEnabledFor(logging.INFO) is False
+        verbose = logging.getLogger('test_levels_verbose')
+        assert verbose.level == logging.NOTSET, 'a threshold which does not raise the effective level should not be applied'
+    finally:
+        hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
+    assert existing.level == logging.NOTSET, 'levels should be restored when filters mode is no longer "levels"'
+    assert created.level == logging.NOTSET
+
+
+@theory
+@inlinedata('filter')
+@inlinedata('levels')
+def filters_mode_does_not_apply_thresholds_to_descendants(filters_mode: str) -> None:
+    """Assert a descendant of a matched logger (which is not matched itself) is not subject to its threshold, in either filters mode."""
+    from tests.fakes import CapturingHandler
+    parent = logging.getLogger('test_filters_mode')
+    child = logging.getLogger('test_filters_mode.existing')
+    CapturingHandler.records.clear()
+    try:
+        hanaro.configure_logging({
+            'logging': {
+                'level': 'DEBUG',
+                'filters_mode': filters_mode,
+                'filters': {'test_filters_mode': {'level': 'WARNING'}},
+                'handlers': [{'type': 'custom', 'class': 'tests.fakes.CapturingHandler'}]
+            }
+        }, force=True)
+        created = hanaro.get_logger('test_filters_mode.created', allow_queued_logger=False)
+        for logger in (parent, child, created):
+            logger.debug('debug')
+            logger.warning('warning')
+        messages = [f'{e.name} {e.getMessage()}' for e in CapturingHandler.records]
+    finally:
+        hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
+        CapturingHandler.records.clear()
+    assert messages == [
+        'test_filters_mode warning',
+        'test_filters_mode.existing debug',
+        'test_filters_mode.existing warning',
+        'test_filters_mode.created debug',
+        'test_filters_mode.created warning'
+    ], messages
+    assert child.level == logging.NOTSET
+
+
+@fact
+def levels_mode_assigns_levels_to_loggers_created_later() -> None:
+    """Assert loggers created after logging is configured are assigned levels when resolved via :function:``get_logger``, and that the records of a matched logger created via ``logging.getLogger`` are filtered by handlers."""
+    from tests.fakes import CapturingHandler
+    CapturingHandler.records.clear()
+    try:
+        hanaro.configure_logging({
+            'logging': {
+                'level': 'DEBUG',
+                'filters_mode': 'levels',
+                'filters': {'test_levels_later\\..*': {'level': 'WARNING'}},
+                'handlers': [{'type': 'custom', 'class': 'tests.fakes.CapturingHandler'}]
+            }
+        }, force=True)
+        resolved = hanaro.get_logger('test_levels_later.resolved', allow_queued_logger=False)
+        created = logging.getLogger('test_levels_later.created')
+        assert resolved.level == logging.WARNING
+        assert created.level == logging.NOTSET, 'a logger created via `logging.getLogger` is not assigned a level (see the levels mode documentation)'
+        for logger in (resolved, created):
+            logger.info('info')
+            logger.warning('warning')
+        messages = [f'{e.name} {e.getMessage()}' for e in CapturingHandler.records]
+    finally:
+        hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
+        CapturingHandler.records.clear()
+    assert messages == ['test_levels_later.resolved warning', 'test_levels_later.created warning'], messages
+
+
+@fact
+def get_logger_memoizes_loggers() -> None:
+    """Assert :function:``get_logger`` returns the same instance for repeated calls, from the same or different call sites."""
+    def resolve() -> logging.Logger:
+        return hanaro.get_logger()
+    first = resolve()
+    assert first is resolve()
+    assert first is hanaro.get_logger()
+    assert first.name == __name__
+    named = hanaro.get_logger('test_memoized', level='INFO')
+    assert named is hanaro.get_logger('test_memoized', level='INFO')
+    assert named.level == logging.INFO
+
+
+@fact
+def get_logger_resolves_caller_from_another_module() -> None:
+    """Assert :function:``get_logger`` resolves the module name of each distinct caller."""
+    namespace: dict[str, object] = {'__name__': 'test_other_module', 'hanaro': hanaro}
+    exec('def resolve():\n    return hanaro.get_logger()\n', namespace)
+    resolve = namespace['resolve']
+    assert callable(resolve)
+    assert resolve().name == 'test_other_module'
+    assert hanaro.get_logger().name == __name__
+
+
+@fact
+def get_queued_logger_reuses_loggers_and_handler() -> None:
+    """Assert :function:``get_queued_logger`` reuses loggers by name, and all queued loggers share a single handler."""
+    first = hanaro.get_queued_logger('test_queued_registry')
+    assert first is hanaro.get_queued_logger('test_queued_registry')
+    other = hanaro.get_queued_logger('test_queued_registry.other')
+    assert first is not other
+    assert len(first.handlers) == 1
+    assert first.handlers[0] is other.handlers[0]
+
+
+@fact
+def get_queued_logger_respects_hierarchy_levels() -> None:
+    """Assert queued loggers respect levels configured on the logger hierarchy, unless a level is set explicitly."""
+    queued = hanaro.get_queued_logger('test_queued_levels.child')
+    parent = logging.getLogger('test_queued_levels')
+    try:
+        parent.setLevel(logging.WARNING)
+        assert queued.isEnabledFor(logging.INFO) is False
+        assert queued.isEnabledFor(logging.WARNING) is True
+        assert queued.getEffectiveLevel() == logging.WARNING
+        parent.setLevel(logging.DEBUG)
+        assert queued.isEnabledFor(logging.DEBUG) is True
+        queued.setLevel(logging.ERROR)
+        assert queued.isEnabledFor(logging.WARNING) is False
+        assert queued.getEffectiveLevel() == logging.ERROR
+    finally:
+        parent.setLevel(logging.NOTSET)
+        queued.setLevel(logging.NOTSET)
+
+
+@theory
+@inlinedata(3600.0, '1h')
+@inlinedata(1800.0, '30m')
+@inlinedata(10.0, '10s')
+@inlinedata(172800.0, '2d')
+@inlinedata(86400.0, 'midnight')
+@inlinedata(60.0, 60)
+@inlinedata(5.0, None)
+def parse_interval_supports_suffixes(expected: float, value: str | int | None) -> None:
+    """Assert intervals (such as ``rotate_when``) support ``s``, ``m``, ``h`` and ``d`` suffixes."""
+    from hanaro.utils import _parse_interval
+    assert _parse_interval(value, 5.0) == expected
+
+
+def create_reconfigurable_configuration(path: str, level: str, fmt: str, filter_level: str) -> dict[str, Any]:
+    return {
+        'logging': {
+            'level': level,
+            'format': fmt,
+            'filters': {'test_reconfigure\\..*': {'level': filter_level}},
+            'handlers': [
+                {'type': 'file', 'path': path, 'name': 'reconfigure.log', 'level': level},
+                {'type': 'console', 'async': True, 'level': level}
+            ]
+        }
+    }
+
+
+@fact
+def reconfigure_changes_live_handlers_in_place() -> None:
+    """Assert :function:``reconfigure`` changes levels, formats and filter rules without recreating handlers or reopening files."""
+    with tempfile.TemporaryDirectory() as path:
+        try:
+            handlers = hanaro.configure_logging(create_reconfigurable_configuration(path, 'DEBUG', '%(message)s', 'DEBUG'), force=True)
+            file_handler = cast(logging.FileHandler, handlers[0])
+            stream = file_handler.stream
+            config_filter = [e for e in handlers[0].filters if isinstance(e, hanaro.ConfigFilter)][0]
+            logger = logging.getLogger('test_reconfigure.component')
+            logger.info('before')
+            reconfigured = hanaro.reconfigure(create_reconfigurable_configuration(path, 'WARNING', 'changed %(message)s', 'ERROR'))
+            assert reconfigured == handlers
+            assert file_handler.stream is stream, 'the log file should not be reopened'
+            assert [e for e in handlers[0].filters if isinstance(e, hanaro.ConfigFilter)][0] is config_filter
+            assert logging.root.level == logging.WARNING
+            assert handlers[0].level == logging.WARNING and handlers[1].level == logging.WARNING
+            assert cast(hanaro.BackgroundHandler, handlers[1]).handler.level == logging.WARNING
+            assert config_filter.get_level('test_reconfigure.component') == logging.ERROR
+            logger.warning('suppressed by filter')
+            logging.getLogger('test_reconfigure_other').error('after')
+            handlers[0].flush()
+            with open(os.path.join(path, 'reconfigure.log'), encoding='utf-8') as file:
+                assert file.read() == 'before\nchanged after\n'
+        finally:
+            hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
+
+
+@theory
+@inlinedata('filter')
+@inlinedata('levels')
+def reconfigure_applies_root_level_in_either_filters_mode(filters_mode: str) -> None:
+    """Assert :function:``reconfigure`` applies a change of the root ``level`` to loggers, including loggers assigned a level by ``filters_mode: "levels"``."""
+    from tests.fakes import CapturingHandler
+
+    def create_configuration(level: str) -> dict[str, Any]:
+        return {
+            'logging': {
+                'level': level,
+                'filters_mode': filters_mode,
+                'filters': {'test_reconfigure_levels': {'level': 'WARNING'}},
+                'handlers': [{'type': 'custom', 'class': 'tests.fakes.CapturingHandler', 'level': 'DEBUG'}]
+            }
+        }
+    parent = logging.getLogger('test_reconfigure_levels')
+    logger = logging.getLogger('test_reconfigure_levels.child')
+    CapturingHandler.records.clear()
+    try:
+        hanaro.configure_logging(create_configuration('INFO'), force=True)
+        logger.info('before')
+        hanaro.reconfigure(create_configuration('WARNING'))
+        logger.info('suppressed by level')
+        logger.warning('after')
+        messages = [e.getMessage() for e in CapturingHandler.records]
+    finally:
+        hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
+        CapturingHandler.records.clear()
+    assert messages == ['before', 'after'], messages
+    assert parent.level == logging.NOTSET and logger.level == logging.NOTSET
+
+
+@fact
+def reconfigure_recreates_handlers_when_handlers_change() -> None:
+    """Assert :function:``reconfigure`` applies a configuration which adds a handler via :function:``configure_logging``."""
+    try:
+        handlers = hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
+        assert hanaro.reconfigure({'logging': {'handlers': [{'type': 'console', 'level': 'ERROR'}]}})[0] is handlers[0]
+        reconfigured = hanaro.reconfigure({'logging': {'handlers': [{'type': 'console'}, {'type': 'console'}]}})
+        assert len(reconfigured) == 2 and reconfigured[0] is not handlers[0]
+    finally:
+        hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
+
+
+@fact
+def config_watch_reconfigures_when_file_changes() -> None:
+    """Assert :function:``start_config_watch`` applies a configuration file when it changes."""
+    with tempfile.TemporaryDirectory() as path:
+        filename = os.path.join(path, 'appsettings.json')
+        with open(filename, 'w', encoding='utf-8') as file:
+            json.dump({'logging': {'level': 'DEBUG', 'handlers': [{'type': 'console'}]}}, file)
+        try:
+            handlers = hanaro.configure_logging(hanaro.utils._load_configuration(filename), force=True)
+            hanaro.start_config_watch(filename, 0.01)
+            with open(filename, 'w', encoding='utf-8') as file:
+                json.dump({'logging': {'level': 'ERROR', 'handlers': [{'type': 'console'}]}}, file, indent=4)
+            deadline = time.monotonic() + 5.0
+            while logging.root.level != logging.ERROR and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert logging.root.level == logging.ERROR
+            assert logging.root.handlers == handlers
+        finally:
+            hanaro.stop_config_watch()
+            hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
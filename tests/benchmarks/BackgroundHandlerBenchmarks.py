@@ -0,0 +1,41 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import io
+import logging
+import time
+from hanaro import BackgroundHandler
+from punit import fact, trait
+from tests.benchmarks import measure, report
+
+
+class StallingHandler(logging.Handler):
+    """A handler which stalls for every record, such as a handler for a slow network service."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        time.sleep(0.001)
+
+
+@fact
+@trait('longrunning')
+@trait('benchmark')
+def background_handler_isolates_emitting_thread_from_slow_handler() -> None:
+    """Measure the per-record cost to the emitting thread of a slow handler, called directly and via :class:``BackgroundHandler``."""
+    iterations = 1000
+    stream_handler = logging.StreamHandler(io.StringIO())
+    stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    direct_logger = logging.Logger('benchmark_direct', logging.DEBUG)
+    direct_logger.addHandler(stream_handler)
+    direct_logger.addHandler(StallingHandler())
+    background_handler = BackgroundHandler(StallingHandler(), 1000, 'drop_newest')
+    background_logger = logging.Logger('benchmark_background', logging.DEBUG)
+    background_logger.addHandler(stream_handler)
+    background_logger.addHandler(background_handler)
+    try:
+        results = {
+            'StreamHandler + slow handler': measure(lambda: direct_logger.info('benchmark %d', 42), iterations, 1),
+            'StreamHandler + BackgroundHandler': measure(lambda: background_logger.info('benchmark %d', 42), iterations, 1),
+        }
+    finally:
+        background_handler.close()
+    report('per-record cost to the emitting thread', results)
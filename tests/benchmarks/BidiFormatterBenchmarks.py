@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import itertools
+import logging
+from hanaro.formatters import BidiFormatter
+from hanaro.formatters.BidiFormatter import bidi_fn
+from punit import fact, trait
+from tests.benchmarks import measure, report
+
+
+README_FORMAT = '[%(asctime)s] %(message)s level=%(levelname)s source=%(name)s'
+
+
+class UnconditionalBidiFormatter(logging.Formatter):
+    """Runs every line through python-bidi, as :class:``BidiFormatter`` did before its fast path and cache."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        formatted = super().format(record)
+        return formatted if bidi_fn is None else str(bidi_fn(formatted, 'utf-8', False, None, False))
+
+
+def create_records(messages: list[str]) -> list[logging.LogRecord]:
+    return [logging.LogRecord('benchmark', logging.INFO, __file__, 1, e, None, None) for e in messages]
+
+
+@fact
+@trait('longrunning')
+@trait('benchmark')
+def bidi_formatter_cost_per_workload() -> None:
+    """Measure the per-record cost of :class:``BidiFormatter`` compared with running python-bidi over every line, for ASCII-only, mixed (1 in 10 lines RTL) and fully RTL workloads of 100 distinct (repeating) messages."""
+    workloads = {
+        'ascii': create_records([f'request {i} completed in {i * 3}ms' for i in range(0, 100)]),
+        'mixed': create_records([f'request {i} completed in {i * 3}ms' if i % 10 != 0 else f'משתמש {i} התחבר' for i in range(0, 100)]),
+        'rtl': create_records([f'משתמש {i} התחבר למערכת' for i in range(0, 100)]),
+    }
+    formatters: dict[str, logging.Formatter] = {
+        'unconditional': UnconditionalBidiFormatter(README_FORMAT, '%Y-%m-%dT%H:%M:%S'),
+        'BidiFormatter (no cache)': BidiFormatter(README_FORMAT, '%Y-%m-%dT%H:%M:%S', cache_size=0),
+        'BidiFormatter': BidiFormatter(README_FORMAT, '%Y-%m-%dT%H:%M:%S'),
+    }
+    for workload, records in workloads.items():
+        results = dict[str, float]()
+        for name, formatter in formatters.items():
+            cycle = itertools.cycle(records)
+            results[name] = measure(lambda: formatter.format(next(cycle)), 10000)
+        report(f'per-record cost ({workload})', results)
@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+import logging.handlers
+import os
+import tempfile
+from hanaro import BinaryFileHandler, ContextInjectionFilter
+from punit import fact, trait
+from tests.benchmarks import measure, report
+
+
+README_FORMAT = '[%(asctime)s] %(message)s level=%(levelname)s source=%(name)s %(metadata)s'
+
+
+@fact
+@trait('longrunning')
+@trait('benchmark')
+def binary_file_handler_cost_compared_to_rotating_file_handler() -> None:
+    """Measure the per-record cost (and size) of writing 100k records with injected context via :class:``BinaryFileHandler`` compared with formatting them via ``RotatingFileHandler`` (both write and flush per record.)"""
+    iterations = 100000
+    results = dict[str, float]()
+    sizes = dict[str, float]()
+    with tempfile.TemporaryDirectory() as path:
+        handlers: dict[str, logging.Handler] = {
+            'RotatingFileHandler': logging.handlers.RotatingFileHandler(os.path.join(path, 'text.log'), maxBytes=64 * 1024 * 1024, backupCount=2, encoding='utf-8'),
+            'BinaryFileHandler': BinaryFileHandler(os.path.join(path, 'binary.log'), 64 * 1024 * 1024, 2),
+        }
+        for name, handler in handlers.items():
+            handler.setFormatter(logging.Formatter(README_FORMAT, '%Y-%m-%dT%H:%M:%S'))
+            logger = logging.Logger(f'benchmark_{name}', logging.DEBUG)
+            logger.addFilter(ContextInjectionFilter({'request_id': 'abc123', 'user': 'someone'}, is_metadata=True))
+            logger.addHandler(handler)
+            try:
+                results[name] = measure(lambda: logger.info('benchmark %d', 42), iterations, 1)
+            finally:
+                handler.close()
+            sizes[name] = os.path.getsize(getattr(handler, 'baseFilename')) / iterations
+    report('per-record cost', results)
+    print('bytes per record:')
+    for name, size in sizes.items():
+        print(f'    {name:<40} {size:>12.1f} B')
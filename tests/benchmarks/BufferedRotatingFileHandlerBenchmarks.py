@@ -0,0 +1,68 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+import logging.handlers
+import os
+import tempfile
+import time
+from hanaro import BufferedRotatingFileHandler
+from punit import fact, trait
+from tests.benchmarks import measure, report
+
+
+@fact
+@trait('longrunning')
+@trait('benchmark')
+def buffered_file_handler_cost_compared_to_rotating_file_handler() -> None:
+    """Measure the per-line cost of writing 100k lines via :class:``BufferedRotatingFileHandler`` compared with ``RotatingFileHandler`` (one write and flush per line.)"""
+    iterations = 100000
+    results = dict[str, float]()
+    with tempfile.TemporaryDirectory() as path:
+        handlers: dict[str, logging.Handler] = {
+            'RotatingFileHandler': logging.handlers.RotatingFileHandler(os.path.join(path, 'rotating.log'), maxBytes=64 * 1024 * 1024, backupCount=2, encoding='utf-8'),
+            'BufferedRotatingFileHandler': BufferedRotatingFileHandler(os.path.join(path, 'buffered.log'), 64 * 1024 * 1024, 2),
+        }
+        for name, handler in handlers.items():
+            handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+            logger = logging.Logger(f'benchmark_{name}', logging.DEBUG)
+            logger.addHandler(handler)
+            try:
+                results[name] = measure(lambda: logger.info('benchmark %d', 42), iterations, 1)
+            finally:
+                handler.close()
+    report('per-line cost', results)
+
+
+@fact
+@trait('longrunning')
+@trait('benchmark')
+def rollover_cost_to_the_emitting_thread() -> None:
+    """Measure the cost of a rollover to the emitting thread, with 10 rotated log files, for ``RotatingFileHandler`` and for :class:``BufferedRotatingFileHandler`` (shifting and compressing in a background thread.)"""
+    iterations = 50
+    results = dict[str, float]()
+    with tempfile.TemporaryDirectory() as path:
+        handlers: dict[str, logging.handlers.RotatingFileHandler] = {
+            'RotatingFileHandler': logging.handlers.RotatingFileHandler(os.path.join(path, 'rotating.log'), backupCount=10, encoding='utf-8'),
+            'BufferedRotatingFileHandler': BufferedRotatingFileHandler(os.path.join(path, 'buffered.log'), 0, 10, buffer_size=0),
+            'BufferedRotatingFileHandler (gzip)': BufferedRotatingFileHandler(os.path.join(path, 'compressed.log'), 0, 10, buffer_size=0, compress='gzip'),
+        }
+        for name, handler in handlers.items():
+            handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+            logger = logging.Logger(f'benchmark_{name}', logging.DEBUG)
+            logger.addHandler(handler)
+            line = 'x' * 1000
+            elapsed = 0
+            try:
+                for _ in range(0, iterations):
+                    for _ in range(0, 1000):
+                        logger.info(line)
+                    # NOTE: rollovers are infrequent, background work from the previous rollover is allowed to complete
+                    time.sleep(0.05)
+                    started = time.perf_counter_ns()
+                    handler.doRollover()
+                    elapsed += time.perf_counter_ns() - started
+            finally:
+                handler.close()
+            results[name] = elapsed / iterations
+    report('per-rollover cost to the emitting thread', results)
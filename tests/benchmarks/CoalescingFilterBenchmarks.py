@@ -0,0 +1,31 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+from hanaro import CoalescingFilter
+from punit import fact, trait
+from tests.benchmarks import measure, report
+
+
+@fact
+@trait('longrunning')
+@trait('benchmark')
+def filter_cost_for_repeated_and_unique_records() -> None:
+    """Measure :meth:``CoalescingFilter.filter`` for a storm of repeated records, and for a storm of unique records (which evicts windows.)"""
+    results = dict[str, float]()
+    repeated = CoalescingFilter('coalescing_filter', 3600.0)
+    unique = CoalescingFilter('coalescing_filter', 3600.0, max_size=1024)
+    index = 0
+
+    def run_repeated() -> None:
+        repeated.filter(logging.LogRecord('storm', logging.WARNING, 'pathname', 5, 'dependency failed: %s', ('timeout',), None, None, None))
+
+    def run_unique() -> None:
+        nonlocal index
+        index += 1
+        unique.filter(logging.LogRecord('storm', logging.WARNING, 'pathname', 5, 'dependency failed: %s', (index,), None, None, None))
+    results['record only'] = measure(lambda: logging.LogRecord('storm', logging.WARNING, 'pathname', 5, 'dependency failed: %s', ('timeout',), None, None, None))
+    results['repeated'] = measure(run_repeated)
+    # NOTE: evicted windows have no repeats, nothing is logged in their place
+    results['unique (evicting)'] = measure(run_unique)
+    report('CoalescingFilter.filter', results)
@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+from hanaro.formatters import CompiledFormatter
+from punit import fact, trait
+from tests.benchmarks import measure, report
+
+
+README_FORMAT = '[%(asctime)s] %(message)s level=%(levelname)s source=%(name)s %(metadata)s'
+
+
+@fact
+@trait('longrunning')
+@trait('benchmark')
+def compiled_formatter_cost_compared_to_formatter() -> None:
+    """Measure the per-record cost of formatting the README's default format via :class:``CompiledFormatter`` compared with ``logging.Formatter``."""
+    record = logging.LogRecord('benchmark', logging.INFO, __file__, 1, 'benchmark %d', (42,), None)
+    record.metadata = 'request_id="abc123" user="someone"'
+    results = dict[str, float]()
+    formatters: dict[str, logging.Formatter] = {
+        'logging.Formatter': logging.Formatter(README_FORMAT, '%Y-%m-%dT%H:%M:%S'),
+        'CompiledFormatter': CompiledFormatter(README_FORMAT, '%Y-%m-%dT%H:%M:%S'),
+    }
+    for name, formatter in formatters.items():
+        def format_record() -> None:
+            # NOTE: measures formatting, rather than the output cache of the record
+            record.__dict__.pop('_formatted', None)
+            formatter.format(record)
+        results[name] = measure(format_record)
+    report('per-record cost', results)
+
+
+@fact
+@trait('longrunning')
+@trait('benchmark')
+def shared_formatter_cost_for_three_handlers() -> None:
+    """Measure the per-record cost of formatting a record for three handlers with the same format, with a ``logging.Formatter`` per handler compared with one shared :class:``CompiledFormatter``."""
+    results = dict[str, float]()
+    formatters: dict[str, list[logging.Formatter]] = {
+        'logging.Formatter (x3)': [logging.Formatter(README_FORMAT, '%Y-%m-%dT%H:%M:%S') for _ in range(0, 3)],
+        'CompiledFormatter (shared)': [CompiledFormatter(README_FORMAT, '%Y-%m-%dT%H:%M:%S')] * 3,
+    }
+    for name, handler_formatters in formatters.items():
+        def format_record() -> None:
+            record = logging.LogRecord('benchmark', logging.INFO, __file__, 1, 'benchmark %d', (42,), None)
+            record.metadata = 'request_id="abc123" user="someone"'
+            for formatter in handler_formatters:
+                formatter.format(record)
+        results[name] = measure(format_record)
+    report('per-record cost (3 handlers, record included)', results)
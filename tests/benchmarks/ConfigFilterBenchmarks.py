@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+from hanaro import ConfigFilter
+from punit import fact, trait
+from tests.benchmarks import measure, report
+
+
+@fact
+@trait('longrunning')
+@trait('benchmark')
+def filter_cost_is_constant_as_rule_count_grows() -> None:
+    """Measure :meth:``ConfigFilter.filter`` for a growing number of rules and a few hundred distinct logger names."""
+    names = [f'app.component{i}.module{i % 7}' for i in range(0, 300)]
+    records = [
+        logging.LogRecord(name, logging.INFO, 'pathname', 5, 'msg', None, None, None, None)
+        for name in names
+    ]
+    results = dict[str, float]()
+    for rule_count in (1, 10, 40, 160):
+        filter = ConfigFilter(
+            'config_filter',
+            {
+                f'vendor{i}\\..*': {'level': 'WARNING'}
+                for i in range(0, rule_count)
+            })
+        index = 0
+
+        def run() -> None:
+            nonlocal index
+            filter.filter(records[index])
+            index = (index + 1) % len(records)
+        results[f'{rule_count} rules'] = measure(run)
+    report('ConfigFilter.filter', results)
+    # cached decisions should make the cost (mostly) independent of the number of rules
+    assert results['160 rules'] < results['1 rules'] * 3, results
@@ -0,0 +1,31 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+from hanaro import ContextInjectionFilter
+from punit import fact, trait
+from tests.benchmarks import measure, report
+
+
+@fact
+@trait('longrunning')
+@trait('benchmark')
+def metadata_injection_cost_by_context_size() -> None:
+    """Measure :meth:``ContextInjectionFilter.filter`` in metadata mode for 1, 10, and 50 context keys."""
+    results = dict[str, float]()
+    for key_count in (1, 10, 50):
+        filter = ContextInjectionFilter(
+            {f'key{i}': f'value{i}' for i in range(0, key_count)},
+            is_metadata=True)
+        record = logging.LogRecord('test', logging.INFO, 'pathname', 5, 'msg', None, None, None, None)
+
+        def run_fresh() -> None:
+            record.__dict__.pop('metadata', None)
+            filter.filter(record)
+
+        def run_merge() -> None:
+            record.__dict__['metadata'] = 'request_id="abc-123"'
+            filter.filter(record)
+        results[f'{key_count} keys (no metadata)'] = measure(run_fresh)
+        results[f'{key_count} keys (existing metadata)'] = measure(run_merge)
+    report('ContextInjectionFilter.filter', results)
@@ -0,0 +1,29 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+from hanaro import ContextInjectionFilter
+from hanaro.formatters import JsonFormatter
+from punit import fact, trait
+from tests.benchmarks import measure, report
+
+
+README_FORMAT = '[%(asctime)s] %(message)s level=%(levelname)s source=%(name)s %(metadata)s'
+
+
+@fact
+@trait('longrunning')
+@trait('benchmark')
+def json_formatter_cost_compared_to_formatter() -> None:
+    """Measure the per-record cost of formatting the README's default format as JSON via :class:``JsonFormatter`` (with and without ``orjson``) compared with formatting it as text via ``logging.Formatter``."""
+    record = logging.LogRecord('benchmark', logging.INFO, __file__, 1, 'benchmark %d', (42,), None)
+    ContextInjectionFilter({'request_id': 'abc123', 'user': 'someone'}, is_metadata=True).filter(record)
+    results = dict[str, float]()
+    formatters: dict[str, logging.Formatter] = {
+        'logging.Formatter': logging.Formatter(README_FORMAT, '%Y-%m-%dT%H:%M:%S'),
+        'JsonFormatter': JsonFormatter(README_FORMAT, '%Y-%m-%dT%H:%M:%S'),
+        'JsonFormatter (without orjson)': JsonFormatter(README_FORMAT, '%Y-%m-%dT%H:%M:%S', use_orjson=False),
+    }
+    for name, formatter in formatters.items():
+        results[name] = measure(lambda: formatter.format(record))
+    report('per-record cost', results)
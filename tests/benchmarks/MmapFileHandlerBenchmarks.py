@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+import logging.handlers
+import os
+import tempfile
+from hanaro import BufferedRotatingFileHandler, MmapFileHandler
+from punit import fact, trait
+from tests.benchmarks import measure, report
+
+
+@fact
+@trait('longrunning')
+@trait('benchmark')
+def mmap_file_handler_cost_compared_to_file_handlers() -> None:
+    """Measure the per-line cost of writing 100k lines via :class:``MmapFileHandler`` compared with ``RotatingFileHandler`` and :class:``BufferedRotatingFileHandler``, rolling over every 4MiB."""
+    iterations = 100000
+    results = dict[str, float]()
+    with tempfile.TemporaryDirectory() as path:
+        handlers: dict[str, logging.Handler] = {
+            'RotatingFileHandler': logging.handlers.RotatingFileHandler(os.path.join(path, 'rotating.log'), maxBytes=4 * 1024 * 1024, backupCount=2, encoding='utf-8'),
+            'BufferedRotatingFileHandler': BufferedRotatingFileHandler(os.path.join(path, 'buffered.log'), 4 * 1024 * 1024, 2),
+            'MmapFileHandler': MmapFileHandler(os.path.join(path, 'mmap.log'), 4 * 1024 * 1024, 2),
+        }
+        for name, handler in handlers.items():
+            handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+            logger = logging.Logger(f'benchmark_{name}', logging.DEBUG)
+            logger.addHandler(handler)
+            try:
+                results[name] = measure(lambda: logger.info('benchmark %d', 42), iterations, 1)
+            finally:
+                handler.close()
+    report('per-line cost', results)
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import io
+import logging
+import marshal
+import multiprocessing
+import multiprocessing.connection
+import time
+from hanaro import ProcessHandler, QueuedHandler
+from punit import fact, trait
+from tests.benchmarks import measure, report
+
+
+def receive_records(connection: multiprocessing.connection.Connection) -> None:
+    """Accept a single :class:``ProcessHandler`` connection, counting (but otherwise discarding) the records it sends."""
+    with multiprocessing.connection.Listener() as listener:
+        connection.send(listener.address)
+        count = 0
+        with listener.accept() as sender:
+            try:
+                while True:
+                    count += len(marshal.loads(sender.recv_bytes()))
+            except EOFError:
+                pass
+        connection.send(count)
+
+
+@fact
+@trait('longrunning')
+@trait('benchmark')
+def process_handler_cost_compared_to_queued_handler() -> None:
+    """Measure the per-record cost of logging via :class:``ProcessHandler`` (to another process) compared with :class:``QueuedHandler`` (single-process.)"""
+    iterations = 100000
+    queued_logger = logging.Logger('benchmark_queued', logging.DEBUG)
+    queued_logger.addHandler(QueuedHandler())
+    stream_handler = logging.StreamHandler(io.StringIO())
+    stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    stream_logger = logging.Logger('benchmark_stream', logging.DEBUG)
+    stream_logger.addHandler(stream_handler)
+    results = {
+        'StreamHandler (emit + format + write)': measure(lambda: stream_logger.info('benchmark %d', 42), iterations, 1),
+        'QueuedHandler (emit)': measure(lambda: queued_logger.info('benchmark %d', 42), iterations, 1),
+    }
+    QueuedHandler.get_log_records()
+    connection, child_connection = multiprocessing.Pipe()
+    receiver = multiprocessing.Process(target=receive_records, args=(child_connection,), daemon=True)
+    receiver.start()
+    try:
+        handler = ProcessHandler(connection.recv())
+        process_logger = logging.Logger('benchmark_process', logging.DEBUG)
+        process_logger.addHandler(handler)
+        results['ProcessHandler (emit)'] = measure(lambda: process_logger.info('benchmark %d', 42), iterations, 1)
+        started = time.perf_counter_ns()
+        for _ in range(0, iterations):
+            process_logger.info('benchmark %d', 42)
+        handler.close()
+        assert connection.recv() == iterations * 2
+        results['ProcessHandler (emit + send + receive)'] = (time.perf_counter_ns() - started) / iterations
+        report('per-record cost', results)
+    finally:
+        receiver.join(5)
@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import io
+import logging
+import time
+from hanaro import QueuedHandler
+from punit import fact, trait
+from tests.benchmarks import report
+
+
+@fact
+@trait('longrunning')
+@trait('benchmark')
+def freezing_moves_cost_from_drain_to_emitting_threads() -> None:
+    """Measure the per-record cost of emitting and of draining (formatting) queued records, with and without freezing."""
+    iterations = 100000
+    output_handler = logging.StreamHandler(io.StringIO())
+    output_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+    logger = logging.Logger('benchmark_freeze', logging.DEBUG)
+    logger.addHandler(QueuedHandler())
+    results = dict[str, float]()
+    try:
+        for freeze in (False, True):
+            QueuedHandler.configure(freeze=freeze)
+            QueuedHandler.get_log_records()
+            started = time.perf_counter_ns()
+            for i in range(0, iterations):
+                logger.info('benchmark %d %s', i, 'argument')
+            emitted = time.perf_counter_ns()
+            for record in QueuedHandler.get_log_records():
+                output_handler.handle(record)
+            drained = time.perf_counter_ns()
+            label = 'frozen' if freeze else 'live'
+            results[f'emit ({label})'] = (emitted - started) / iterations
+            results[f'drain ({label})'] = (drained - emitted) / iterations
+    finally:
+        QueuedHandler.configure()
+    report('per-record cost', results)
@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import io
+import logging
+from hanaro import RateLimitFilter
+from punit import fact, trait
+from tests.benchmarks import measure, report
+
+
+@fact
+@trait('longrunning')
+@trait('benchmark')
+def suppressed_records_cost_less_than_handled_records() -> None:
+    """Measure a storm of records from one call site, handled by a formatting handler, with and without :class:``RateLimitFilter``."""
+    filter = RateLimitFilter('rate_limit_filter', {'storm': {'rate': 100, 'per': 'site'}}, summary_interval=3600.0)
+    results = dict[str, float]()
+    for title, filters in (('unlimited', []), ('rate limited', [filter]), ('sampled', [RateLimitFilter('rate_limit_filter', {'storm': {'sample': 0.01}})])):
+        handler = logging.StreamHandler(io.StringIO())
+        handler.formatter = logging.Formatter('[%(asctime)s] %(message)s level=%(levelname)s source=%(name)s')
+        for e in filters:
+            handler.addFilter(e)
+        levelno = logging.INFO if title == 'sampled' else logging.WARNING
+
+        def run() -> None:
+            record = logging.LogRecord('storm', levelno, 'pathname', 5, 'dependency failed: %s', ('timeout',), None, None, None)
+            handler.handle(record)
+            if handler.stream.tell() > 1024 * 1024:
+                handler.stream.seek(0)
+                handler.stream.truncate()
+        results[title] = measure(run)
+    results['filter only'] = measure(lambda: filter.filter(logging.LogRecord('storm', logging.WARNING, 'pathname', 5, 'msg', None, None, None, None)))
+    report('RateLimitFilter', results)
+    assert results['rate limited'] < results['unlimited'], results
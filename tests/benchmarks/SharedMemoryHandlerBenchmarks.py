@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+import logging.handlers
+import multiprocessing
+import multiprocessing.connection
+import time
+from typing import Any, Callable
+from hanaro import ProcessHandler, ProcessListener, RecordQueue, SharedMemoryHandler
+from punit import fact, trait
+from tests.benchmarks import report
+
+
+def receive_records(connection: multiprocessing.connection.Connection, count: int) -> None:
+    """Receive records via a :class:``ProcessListener``, discarding them once *count* records have been received."""
+    queue = RecordQueue()
+    listener = ProcessListener(queue=queue)
+    connection.send(listener.address)
+    received = 0
+    while received < count:
+        queue.wait(0.1)
+        received += len(queue.get_many())
+    connection.send(received)
+    listener.close()
+
+
+def receive_pickled_records(queue: Any, connection: multiprocessing.connection.Connection, count: int) -> None:
+    """Receive records pickled via :class:``logging.handlers.QueueHandler`` and a ``multiprocessing.Queue``, discarding them once *count* records have been received."""
+    connection.send(None)
+    for _ in range(0, count):
+        queue.get()
+    connection.send(count)
+
+
+def measure_pickled(iterations: int) -> tuple[float, float]:
+    queue: multiprocessing.Queue[logging.LogRecord] = multiprocessing.Queue()
+    connection, child_connection = multiprocessing.Pipe()
+    receiver = multiprocessing.Process(target=receive_pickled_records, args=(queue, child_connection, iterations), daemon=True)
+    receiver.start()
+    try:
+        connection.recv()
+        logger = logging.Logger('benchmark_QueueHandler', logging.DEBUG)
+        logger.addHandler(logging.handlers.QueueHandler(queue))
+        started = time.perf_counter_ns()
+        for _ in range(0, iterations):
+            logger.info('benchmark %d', 42)
+        emitted = time.perf_counter_ns()
+        assert connection.recv() == iterations
+        received = time.perf_counter_ns()
+        return ((emitted - started) / iterations, (received - started) / iterations)
+    finally:
+        receiver.join(5)
+
+
+def measure_transport(create_handler: Callable[[Any], logging.Handler], iterations: int) -> tuple[float, float]:
+    connection, child_connection = multiprocessing.Pipe()
+    receiver = multiprocessing.Process(target=receive_records, args=(child_connection, iterations), daemon=True)
+    receiver.start()
+    try:
+        handler = create_handler(connection.recv())
+        logger = logging.Logger(f'benchmark_{type(handler).__name__}', logging.DEBUG)
+        logger.addHandler(handler)
+        started = time.perf_counter_ns()
+        for _ in range(0, iterations):
+            logger.info('benchmark %d', 42)
+        emitted = time.perf_counter_ns()
+        handler.flush()
+        assert connection.recv() == iterations
+        received = time.perf_counter_ns()
+        handler.close()
+        return ((emitted - started) / iterations, (received - started) / iterations)
+    finally:
+        receiver.join(5)
+
+
+@fact
+@trait('longrunning')
+@trait('benchmark')
+def shared_memory_handler_cost_compared_to_pipes() -> None:
+    """Measure the per-record cost of forwarding records via :class:``SharedMemoryHandler`` compared with :class:``ProcessHandler`` and with pickling records through a pipe (``QueueHandler`` and ``multiprocessing.Queue``.)"""
+    iterations = 200000
+    emit, end_to_end = measure_pickled(iterations)
+    results = {
+        'multiprocessing.Queue (emit)': emit,
+        'multiprocessing.Queue (emit + receive)': end_to_end,
+    }
+    transports: dict[str, Callable[[Any], logging.Handler]] = {
+        'ProcessHandler': lambda address: ProcessHandler(address),
+        # NOTE: the ring is large enough that emitting never blocks, as with the (unbounded) buffer of `ProcessHandler`
+        'SharedMemoryHandler': lambda address: SharedMemoryHandler(address, 64 * 1024 * 1024),
+    }
+    for name, create_handler in transports.items():
+        emit, end_to_end = measure_transport(create_handler, iterations)
+        results[f'{name} (emit)'] = emit
+        results[f'{name} (emit + receive)'] = end_to_end
+    report('per-record cost', results)
@@ -0,0 +1,20 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import hanaro
+import logging
+from punit import fact, trait
+from tests.benchmarks import measure, report
+
+
+@fact
+@trait('longrunning')
+@trait('benchmark')
+def get_logger_cost_compared_to_logging() -> None:
+    """Measure :function:``get_logger`` compared with ``logging.getLogger(__name__)``."""
+    results = {
+        'logging.getLogger(__name__)': measure(lambda: logging.getLogger(__name__)),
+        'hanaro.get_logger(__name__)': measure(lambda: hanaro.get_logger(__name__)),
+        'hanaro.get_logger()': measure(lambda: hanaro.get_logger()),
+    }
+    report('get_logger', results)
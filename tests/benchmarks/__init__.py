@@ -0,0 +1,32 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+"""Micro-benchmarks, excluded from default test runs via the ``longrunning`` trait."""
+
+import time
+from typing import Callable
+
+
+def measure(fn: Callable[[], object], iterations: int = 100000, repeat: int = 5) -> float:
+    """
+    Measure the cost of calling *fn*.
+
+    :param fn: The function to measure.
+    :param iterations: The number of calls per timing sample, defaults to 100000.
+    :param repeat: The number of timing samples to take, the fastest is reported, defaults to 5.
+    :return: The cost of a single call, in nanoseconds.
+    """
+    best = float('inf')
+    for _ in range(0, repeat):
+        started = time.perf_counter_ns()
+        for _ in range(0, iterations):
+            fn()
+        best = min(best, (time.perf_counter_ns() - started) / iterations)
+    return best
+
+
+def report(title: str, results: dict[str, float]) -> None:
+    """Print benchmark *results* (in nanoseconds per operation) for human reference."""
+    print(f'{title}:')
+    for name, ns in results.items():
+        print(f'    {name:<40} {ns:>12.1f} ns/op')
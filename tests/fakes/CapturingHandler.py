@@ -0,0 +1,13 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+
+
+class CapturingHandler(logging.Handler):
+    """A handler which captures emitted Log Records for inspection by tests."""
+
+    records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        CapturingHandler.records.append(record)
@@ -1,9 +1,11 @@
 # SPDX-FileCopyrightText: © 2026 Shaun Wilson
 # SPDX-License-Identifier: MIT
 
+from .CapturingHandler import CapturingHandler
 from .ExampleCustomHandler import ExampleCustomHandler
 
 
 __all__ = [
+    'CapturingHandler',
     'ExampleCustomHandler'
 ]
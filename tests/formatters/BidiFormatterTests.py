@@ -4,7 +4,8 @@
 from punit import strings
 from hanaro.formatters import BidiFormatter
 import logging
-from punit import fact
+from punit import fact, theory, inlinedata
+import unicodedata
 from typing import Any, Callable, Optional
 
 bidi_fn: Optional[Callable[..., Any]] = None
@@ -27,3 +28,42 @@ def basic_verification_test() -> None:
     # NOTE: for human reference only
     print([original, expected, actual])
     assert strings.areSame(expected, actual), f'expected:"{expected}", actual:"{actual}"'
+
+
+@theory
+@inlinedata('plain ascii text (with) [punctuation] 123')
+@inlinedata('multi-line\n\ttraceback')
+@inlinedata('ansi \x1b[31mred\x1b[0m')
+@inlinedata('lätïn ünïcödé and ✓ symbols')
+@inlinedata('mixed שלום עולם text')
+@inlinedata('arabic مرحبا ١٢٣ text')
+@inlinedata('marks \u200f and \u202eembedding\u202c')
+def bidi_formatter_fast_path_is_identical(original: str) -> None:
+    """Assert lines which skip the bidi algorithm (and cached lines) are identical to the output of the bidi algorithm."""
+    for cache_size in (0, 16):
+        bidi_formatter = BidiFormatter('%(message)s', cache_size=cache_size)
+        record = logging.LogRecord('test', logging.INFO, 'pathname', 123, original, None, None)
+        expected = str(original if bidi_fn is None else bidi_fn(original, 'utf-8', False, None, False))
+        assert bidi_formatter.format(record) == expected
+        assert bidi_formatter.format(record) == expected
+
+
+@fact
+def bidi_formatter_fast_path_covers_code_points() -> None:
+    """Assert code points which skip the bidi algorithm are displayed as-is by the bidi algorithm (sampled.)"""
+    if bidi_fn is None:
+        return
+    bidi_formatter = BidiFormatter('%(message)s', cache_size=0)
+    for c in range(0x80, 0x10000, 7):
+        character = chr(c)
+        if unicodedata.bidirectional(character) == '' or 0xd800 <= c <= 0xdfff:
+            # NOTE: unassigned code points (and surrogates) are not supported by the bidi algorithm
+            continue
+        original = f'a {character} b'
+        try:
+            expected = str(bidi_fn(original, 'utf-8', False, None, False))
+        except Exception:
+            # NOTE: some versions of python-bidi do not support isolates
+            continue
+        record = logging.LogRecord('test', logging.INFO, 'pathname', 123, original, None, None)
+        assert bidi_formatter.format(record) == expected, hex(c)
@@ -0,0 +1,180 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import logging
+import sys
+import time
+from hanaro.formatters import CompiledFormatter
+from punit import fact, theory, inlinedata
+from typing import Literal, Optional
+
+
+README_FORMAT = '[%(asctime)s] %(message)s level=%(levelname)s source=%(name)s %(metadata)s'
+
+
+def create_record(msg: str = 'hello %s', exc: bool = False, stack: bool = False) -> logging.LogRecord:
+    exc_info = None
+    if exc:
+        try:
+            raise ValueError('failure')
+        except ValueError:
+            exc_info = sys.exc_info()
+    record = logging.LogRecord('test.compiled', logging.WARNING, 'path.py', 42, msg, ('world',), exc_info, 'fn', 'stack' if stack else None)
+    record.metadata = 'key="value"'
+    # NOTE: records compared with each other are created at the same time
+    record.created = 1767182096.125
+    record.msecs = 125.0
+    return record
+
+
+@theory
+@inlinedata(README_FORMAT, '%Y-%m-%dT%H:%M:%S', '%')
+@inlinedata(logging.BASIC_FORMAT, None, '%')
+@inlinedata('%(asctime)s %(msecs)03d %(levelname)-8s|%(lineno)5d|%(process)x 100%% %%(name)s', None, '%')
+@inlinedata('%(message)r', None, '%')
+@inlinedata('{asctime} {levelname:>8} {message}', '%H:%M', '{')
+@inlinedata('$asctime $message', '', '$')
+def compiled_formatter_output_is_identical(fmt: str, datefmt: Optional[str], style: Literal['%', '{', '$']) -> None:
+    """Assert :class:``CompiledFormatter`` output is identical to ``logging.Formatter``, including exceptions and stack info."""
+    expected_formatter = logging.Formatter(fmt, datefmt, style)
+    actual_formatter = CompiledFormatter(fmt, datefmt, style)
+    for exc, stack in ((False, False), (True, False), (True, True)):
+        record = create_record(exc=exc, stack=stack)
+        expected = expected_formatter.format(record)
+        # NOTE: formatting caches `exc_text` on the record, each formatter is given a record of its own
+        record = create_record(exc=exc, stack=stack)
+        actual = actual_formatter.format(record)
+        assert expected == actual, f'expected:"{expected}", actual:"{actual}"'
+        # NOTE: the second format of the same second is rendered from the timestamp cache
+        assert actual_formatter.format(create_record(exc=exc, stack=stack)) == expected_formatter.format(create_record(exc=exc, stack=stack))
+
+
+@fact
+def compiled_formatter_caches_timestamp_per_second() -> None:
+    """Assert the rendered timestamp changes when the second changes, and respects a custom converter."""
+    formatter = CompiledFormatter('%(asctime)s', '%H:%M:%S')
+    expected_formatter = logging.Formatter('%(asctime)s', '%H:%M:%S')
+    record = create_record()
+    for created in (1000.1, 1000.9, 1001.0, 999.5):
+        record.created = created
+        assert formatter.format(record) == expected_formatter.format(record)
+    formatter.converter = time_converter
+    expected_formatter.converter = time_converter
+    assert formatter.format(record) == expected_formatter.format(record)
+
+
+def time_converter(created: Optional[float]) -> time.struct_time:
+    return time.gmtime(0 if created is None else created + 3600)
+
+
+@fact
+def compiled_formatter_raises_for_missing_field() -> None:
+    """Assert a missing field raises the same error as ``logging.Formatter``."""
+    formatter = CompiledFormatter('%(missing)s %(message)s')
+    try:
+        formatter.format(create_record())
+    except ValueError as ex:
+        assert str(ex) == 'Formatting field not found in record: \'missing\''
+        return
+    assert False, 'expected ValueError'
+
+
+class CountingArgument:
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __str__(self) -> str:
+        self.count += 1
+        return 'counted'
+
+
+@fact
+def compiled_formatter_caches_output_on_record() -> None:
+    """Assert a formatter formats a record once, and that formatters with different formats interpolate its message once."""
+    argument = CountingArgument()
+    record = logging.LogRecord('test.compiled', logging.INFO, 'path.py', 42, 'hello %s', (argument,), None)
+    formatter = CompiledFormatter('[%(asctime)s] %(message)s')
+    other = CompiledFormatter('%(levelname)s %(message)s')
+    first = formatter.format(record)
+    assert formatter.format(record) is first
+    assert other.format(record) == 'INFO hello counted'
+    assert argument.count == 1
+    # NOTE: the cache is invalidated when the record changes
+    record.msg = 'goodbye %s'
+    assert formatter.format(record) == first.replace('hello', 'goodbye')
+    assert argument.count == 2
+
+
+@fact
+def compiled_formatter_cache_does_not_retain_args() -> None:
+    """Assert the output cached on a record does not retain its ``args``, so that formatted records can be pickled (such as by ``SocketHandler`` and ``QueueHandler``.)"""
+    import logging.handlers
+    import pickle
+    import queue
+    import threading
+    import weakref
+    formatter = CompiledFormatter('%(levelname)s %(message)s')
+    argument = threading.Lock()
+    record = logging.LogRecord('test.compiled', logging.INFO, 'path.py', 42, 'hello %s', (argument,), None)
+    assert formatter.format(record).startswith('INFO hello <unlocked _thread.lock')
+    socket_handler = logging.handlers.SocketHandler('localhost', 9)
+    socket_handler.setFormatter(formatter)
+    try:
+        assert len(socket_handler.makePickle(record)) > 0
+    finally:
+        socket_handler.close()
+    queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+    queue_handler.setFormatter(formatter)
+    assert len(pickle.dumps(queue_handler.prepare(record))) > 0
+    # NOTE: `args` are released once the record no longer references them
+    collected = CountingArgument()
+    reference = weakref.ref(collected)
+    record = logging.LogRecord('test.compiled', logging.INFO, 'path.py', 42, 'hello %s', (collected,), None)
+    formatter.format(record)
+    del collected
+    record.args = None
+    assert reference() is None
+
+
+@fact
+def configure_logging_shares_identical_formatters() -> None:
+    """Assert :function:``configure_logging`` shares one formatter between handlers with identical formatter configurations."""
+    import hanaro
+    try:
+        handlers = hanaro.configure_logging({
+            'logging': {
+                'formatter': 'compiled',
+                'bidi': False,
+                'handlers': [
+                    {'type': 'console'},
+                    {'type': 'custom', 'class': 'tests.fakes.CapturingHandler'},
+                    {'type': 'custom', 'class': 'tests.fakes.CapturingHandler', 'format': '%(message)s'},
+                    {'type': 'custom', 'class': 'tests.fakes.CapturingHandler', 'formatter': 'default'}
+                ]
+            }
+        }, force=True)
+        assert handlers[0].formatter is handlers[1].formatter
+        assert handlers[0].formatter is not handlers[2].formatter
+        assert handlers[0].formatter is not handlers[3].formatter
+    finally:
+        hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
+
+
+@fact
+def configure_logging_selects_compiled_formatter() -> None:
+    """Assert :function:``configure_logging`` creates a :class:``CompiledFormatter`` when ``formatter`` is ``compiled``."""
+    import hanaro
+    try:
+        handlers = hanaro.configure_logging({
+            'logging': {
+                'formatter': 'compiled',
+                'handlers': [
+                    {'type': 'console'},
+                    {'type': 'console', 'formatter': 'default'}
+                ]
+            }
+        }, force=True)
+        assert isinstance(handlers[0].formatter, CompiledFormatter)
+        assert not isinstance(handlers[1].formatter, CompiledFormatter)
+    finally:
+        hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)
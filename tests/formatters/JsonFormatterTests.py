@@ -0,0 +1,126 @@
+# SPDX-FileCopyrightText: © 2026 Shaun Wilson
+# SPDX-License-Identifier: MIT
+
+import json
+import logging
+import sys
+from hanaro import ContextInjectionFilter, RecordCodec
+from hanaro.formatters import JsonFormatter
+from punit import fact, theory, inlinedata
+from typing import Any, Literal, Optional
+
+
+README_FORMAT = '[%(asctime)s] %(message)s level=%(levelname)s source=%(name)s %(metadata)s'
+
+
+def create_record(msg: str = 'hello %s', args: Any = ('world',), exc: bool = False, stack: bool = False) -> logging.LogRecord:
+    exc_info = None
+    if exc:
+        try:
+            raise ValueError('failure')
+        except ValueError:
+            exc_info = sys.exc_info()
+    record = logging.LogRecord('test.json', logging.WARNING, 'path.py', 42, msg, args, exc_info, 'fn', 'stack' if stack else None)
+    record.created = 1767182096.125
+    record.msecs = 125.0
+    return record
+
+
+def format_both(formatter_factory: Any, record_factory: Any) -> dict[str, Any]:
+    """Format via ``orjson`` (where installed) and via the builtin serializer, assert the output is identical, and return the parsed output."""
+    expected = formatter_factory(use_orjson=False).format(record_factory())
+    actual = formatter_factory(use_orjson=True).format(record_factory())
+    assert '\n' not in expected, f'expected a single line, actual:"{expected}"'
+    assert json.loads(expected) == json.loads(actual), f'expected:"{expected}", actual:"{actual}"'
+    return dict(json.loads(expected))
+
+
+@theory
+@inlinedata(README_FORMAT, '%', 'asctime,message,levelname,name')
+@inlinedata('{asctime} {levelname:>8} {name!r} {message}', '{', 'asctime,levelname,name,message')
+@inlinedata('${asctime} $levelname $name $message', '$', 'asctime,levelname,name,message')
+def json_formatter_plans_fields_from_format(fmt: str, style: Literal['%', '{', '$'], expected: str) -> None:
+    """Assert the fields of the output are planned from the attributes referenced by the format, in order."""
+    output = format_both(lambda use_orjson: JsonFormatter(fmt, '%Y-%m-%dT%H:%M:%S', style, use_orjson=use_orjson), create_record)
+    # NOTE: `metadata` is omitted because the record has none
+    assert list(output.keys()) == expected.split(',')
+    assert output['message'] == 'hello world'
+    assert output['levelname'] == 'WARNING'
+    assert output['name'] == 'test.json'
+    assert output['asctime'].startswith('2025-12-31T') or output['asctime'].startswith('2026-01-01T')
+
+
+@fact
+def json_formatter_outputs_metadata_as_fields() -> None:
+    """Assert structured metadata injected by :class:``ContextInjectionFilter`` is output as first-class fields, rather than as a pre-rendered string."""
+    def create_injected_record() -> logging.LogRecord:
+        record = create_record()
+        ContextInjectionFilter({'request_id': 'abc-123', 'user': 'some"one'}, is_metadata=True).filter(record)
+        return record
+    output = format_both(lambda use_orjson: JsonFormatter(README_FORMAT, use_orjson=use_orjson), create_injected_record)
+    assert 'metadata' not in output
+    assert output['request_id'] == 'abc-123'
+    assert output['user'] == 'some"one'
+    # NOTE: metadata fields survive serialization of the record between processes
+    record = RecordCodec.thaw(RecordCodec.freeze(create_injected_record()))
+    assert json.loads(JsonFormatter(README_FORMAT).format(record))['request_id'] == 'abc-123'
+
+
+@fact
+def json_formatter_outputs_extras_exceptions_and_stack_info() -> None:
+    """Assert attributes added to a record are output as fields (except for private attributes), as are exceptions and stack info."""
+    def create_extra_record() -> logging.LogRecord:
+        record = create_record(exc=True, stack=True)
+        record.__dict__.update({'count': 3, 'ratio': 0.5, 'flag': True, 'missing': None, 'obj': object, '_private': 'hidden'})
+        return record
+    output = format_both(lambda use_orjson: JsonFormatter('%(message)s', use_orjson=use_orjson), create_extra_record)
+    assert output['message'] == 'hello world'
+    assert output['count'] == 3
+    assert output['ratio'] == 0.5
+    assert output['flag'] is True
+    assert output['obj'] == str(object)
+    assert 'missing' not in output
+    assert '_private' not in output
+    assert output['exc_info'].startswith('Traceback') and 'ValueError: failure' in output['exc_info']
+    assert output['stack_info'] == 'stack'
+
+
+@theory
+@inlinedata('nan', None)
+@inlinedata('big', str(2 ** 70))
+@inlinedata('text', '"\\u0001 ünïcödé\\n"')
+def json_formatter_serializes_values_without_orjson(kind: str, expected: Optional[str]) -> None:
+    """Assert values which ``orjson`` or ``json`` reject (or escape) are serialized by the builtin serializer."""
+    value: Any = {'nan': float('nan'), 'big': 2 ** 70, 'text': '\u0001 ünïcödé\n'}[kind]
+    record = create_record()
+    record.value = value
+    output = JsonFormatter('%(message)s', use_orjson=False).format(record)
+    assert output == f'{{"message":"hello world","value":{expected or "null"}}}', f'actual:"{output}"'
+    assert JsonFormatter('%(message)s').format(record) == output
+
+
+@fact
+def json_formatter_uses_defaults_for_missing_fields() -> None:
+    """Assert a field missing from a record is taken from *defaults*, or omitted."""
+    formatter = JsonFormatter('%(message)s %(tenant)s %(missing)s', defaults={'tenant': 'default'})
+    assert formatter.format(create_record()) == '{"message":"hello world","tenant":"default"}'
+
+
+@fact
+def configure_logging_selects_json_formatter() -> None:
+    """Assert :function:``configure_logging`` creates a :class:``JsonFormatter`` when ``formatter`` is ``json``."""
+    import hanaro
+    try:
+        handlers = hanaro.configure_logging({
+            'logging': {
+                'bidi': True,
+                'handlers': [
+                    {'type': 'console', 'formatter': 'json'},
+                    {'type': 'console'}
+                ]
+            }
+        }, force=True)
+        assert isinstance(handlers[0].formatter, JsonFormatter)
+        assert not isinstance(handlers[1].formatter, JsonFormatter)
+    finally:
+        hanaro.configure_logging({'logging': {'handlers': [{'type': 'console'}]}}, force=True)